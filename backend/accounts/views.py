@@ -29,7 +29,7 @@ class RegisterView(generics.CreateAPIView):
             serializer.is_valid(raise_exception=True)
             user = serializer.save()
 
-            logger.info(f"New user registered: {user.email}")
+            logger.info("New user registered: %s", user.email)
 
             return CustomResponse(
                 {
@@ -39,7 +39,7 @@ class RegisterView(generics.CreateAPIView):
                 status=status.HTTP_201_CREATED,
             )
         except Exception as e:
-            logger.error(f"Registration error: {str(e)}")
+            logger.error("Registration error: %s", e)
             return CustomResponse(message= str(e), status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -58,7 +58,7 @@ class LoginView(generics.GenericAPIView):
             # Generate JWT tokens
             refresh = RefreshToken.for_user(user)
 
-            logger.info(f"User logged in: {user.email}")
+            logger.info("User logged in: %s", user.email)
 
             return CustomResponse(
                 {
@@ -72,7 +72,7 @@ class LoginView(generics.GenericAPIView):
                 message= "Login successful",
             )
         except Exception as e:
-            logger.error(f"Login error: {str(e)}")
+            logger.error("Login error: %s", e)
             return CustomResponse(message= str(e), status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -146,7 +146,7 @@ class ChangePasswordView(generics.UpdateAPIView):
             # Keep the user logged in after password change
             update_session_auth_hash(request, user)
 
-            logger.info(f"Password changed for user: {user.email}")
+            logger.info("Password changed for user: %s", user.email)
 
             return CustomResponse(
                 message="Password changed successfully",
@@ -154,7 +154,7 @@ class ChangePasswordView(generics.UpdateAPIView):
             )
 
         except Exception as e:
-            logger.error(f"Password change error: {str(e)}")
+            logger.error("Password change error: %s", e)
             return CustomResponse(
                 message=str(e),
                 status=status.HTTP_400_BAD_REQUEST,
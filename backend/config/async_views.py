@@ -0,0 +1,48 @@
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """
+    APIView whose handlers are coroutines, for async-native read endpoints
+    served under ASGI. Authentication, permission_classes, throttles,
+    content negotiation and exception handling are DRF's own; only resolving
+    the user, which may query ``users``, runs in a worker thread.
+    """
+
+    http_method_names = ["get"]
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.perform_authentication)(request)
+            self.initial(request, *args, **kwargs)
+            handler = getattr(self, request.method.lower(), None)
+            if request.method.lower() not in self.http_method_names or handler is None:
+                self.http_method_not_allowed(request, *args, **kwargs)
+            response = await handler(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.rendered(self.response)
+
+    @staticmethod
+    def rendered(response):
+        """
+        Render ``response`` on the event loop. Django would render a lazy
+        response through the same shared thread the async ORM queues on.
+        """
+        if not hasattr(response, "render"):
+            return response
+        response.render()
+        rendered = HttpResponse(response.content, status=response.status_code)
+        for header, value in response.items():
+            rendered[header] = value
+        return rendered
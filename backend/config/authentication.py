@@ -0,0 +1,51 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+
+def _cache():
+    return caches[settings.AUTH_USER_CACHE]
+
+
+def _cache_key(user_id):
+    return f"auth-user:{user_id}"
+
+
+def invalidate_cached_user(user):
+    """Drop ``user`` from this worker's authentication cache"""
+    _cache().delete(_cache_key(getattr(user, api_settings.USER_ID_FIELD)))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication resolving the token's user from a short-TTL in-process
+    cache instead of querying ``users`` on every request. Only users that
+    passed the stock checks are cached; saving or deleting a user drops the
+    entry (accounts.signals), so role, is_active and password changes apply
+    on the next request in this worker and within AUTH_USER_CACHE_TIMEOUT
+    seconds in the others.
+    """
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None:
+            return super().get_user(validated_token)
+
+        cache = _cache()
+        key = _cache_key(user_id)
+        # The cache pickles its values, so every request gets its own instance
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(validated_token)
+            cache.set(key, user)
+        elif api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(
+                _("The user's password has been changed."), code="password_changed"
+            )
+        return user
@@ -0,0 +1,117 @@
+import random
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.core.signing import BadSignature, TimestampSigner
+from rest_framework.permissions import SAFE_METHODS
+
+# The replica serving the reads of the request being handled, chosen once so
+# that all of them see the same copy of the data
+_replica_alias = ContextVar("replica_alias", default=None)
+
+# Signed token pinning a user who just wrote to the primary. Writes return it
+# in this header and the client echoes it back, so the pin holds whichever
+# worker serves the next request without credentialed CORS.
+PIN_HEADER = "X-DB-Primary-Pin"
+_pin_signer = TimestampSigner(salt="db-primary-pin")
+
+
+class ReplicaRouter:
+    """
+    Sends reads made between ``start_replica_reads`` and ``stop_replica_reads``
+    to the replica chosen for the request and everything else to the primary. Writes always go to the primary, even
+    for instances loaded from a replica.
+    """
+
+    def db_for_read(self, model, **hints):
+        return _replica_alias.get() or "default"
+
+    def db_for_write(self, model, **hints):
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold copies of the primary's rows
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas receive the schema with the data (see sync_replica)
+        return db not in settings.DATABASE_REPLICAS
+
+
+def _user(request):
+    user = getattr(request, "user", None)
+    return user if user is not None and user.is_authenticated else None
+
+
+def pin_to_primary(request, response):
+    """Keep the user's reads on the primary for REPLICA_STICKY_SECONDS"""
+    user = _user(request)
+    if settings.DATABASE_REPLICAS and user is not None:
+        response[PIN_HEADER] = _pin_signer.sign(str(user.pk))
+
+
+def _pinned(request):
+    """Whether ``request`` carries an unexpired pin for its own user"""
+    user = _user(request)
+    token = request.headers.get(PIN_HEADER) if user is not None else None
+    if not token:
+        return False
+    try:
+        # max_age checks the signature's timestamp, so a client cannot extend it
+        value = _pin_signer.unsign(token, max_age=settings.REPLICA_STICKY_SECONDS)
+    except BadSignature:
+        return False
+    return value == str(user.pk)
+
+
+def start_replica_reads(request):
+    """
+    Route the reads of ``request`` to one replica, picked now, unless its
+    user wrote recently. Returns the token for ``stop_replica_reads``.
+    """
+    alias = None
+    if settings.DATABASE_REPLICAS and not _pinned(request):
+        alias = random.choice(settings.DATABASE_REPLICAS)
+    return _replica_alias.set(alias)
+
+
+def stop_replica_reads(token):
+    _replica_alias.reset(token)
+
+
+def use_replica(view):
+    """Serve a function view's reads from a replica (apply below @api_view)"""
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        token = start_replica_reads(request)
+        try:
+            return view(request, *args, **kwargs)
+        finally:
+            stop_replica_reads(token)
+
+    return wrapper
+
+
+class ReplicaReadMixin:
+    """
+    Serves the ``replica_actions`` of a viewset from a replica. Successful
+    writes pin their user to the primary so they read their own writes.
+    """
+
+    replica_actions = ("list", "retrieve")
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if request.method in SAFE_METHODS and self.action in self.replica_actions:
+            self._replica_token = start_replica_reads(request)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        token = getattr(self, "_replica_token", None)
+        if token is not None:
+            self._replica_token = None
+            stop_replica_reads(token)
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            pin_to_primary(request, response)
+        return super().finalize_response(request, response, *args, **kwargs)
@@ -0,0 +1,151 @@
+import copy
+import logging
+import queue
+import sys
+from collections.abc import Mapping
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+
+# Argument types whose %-formatting is cheap and cannot change after the call
+_PRIMITIVE_ARGS = (str, int, float, bool, type(None))
+
+_exc_formatter = logging.Formatter()
+
+
+def _primitive_args(args):
+    if not args:
+        return True
+    values = args.values() if isinstance(args, Mapping) else args
+    return all(type(value) in _PRIMITIVE_ARGS for value in values)
+
+
+class _DrainingListener(QueueListener):
+    """QueueListener whose stop() waits for room for its sentinel in a full queue"""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+class QueueLogHandler(QueueHandler):
+    """
+    Hands records to a bounded queue; a listener thread formats them and
+    writes them to the console and a size-rotated log file, so request
+    threads never wait on disk I/O.
+
+    When the queue is full the new record is dropped and counted, and a
+    WARNING with the number dropped is logged once there is room again.
+    """
+
+    def __init__(
+        self,
+        filename=None,
+        max_bytes=10 * 1024 * 1024,
+        backup_count=5,
+        queue_size=10000,
+        console=True,
+    ):
+        super().__init__(queue.Queue(maxsize=queue_size))
+        self.queue_size = queue_size
+        self.dropped = 0
+        self._unreported = 0
+
+        targets = []
+        if console:
+            targets.append(logging.StreamHandler(sys.stderr))
+        if filename:
+            targets.append(
+                RotatingFileHandler(
+                    filename,
+                    maxBytes=max_bytes,
+                    backupCount=backup_count,
+                    encoding="utf-8",
+                    delay=True,
+                )
+            )
+        self.targets = targets
+        self.listener = _DrainingListener(self.queue, *targets)
+        self.listener.start()
+
+    def setFormatter(self, fmt):
+        # Formatting happens on the listener thread, in the target handlers
+        super().setFormatter(fmt)
+        for target in self.targets:
+            target.setFormatter(fmt)
+
+    def prepare(self, record):
+        # Primitive args format the same later, so leave merging them to the
+        # listener. Anything else (model instances, querysets, mutable
+        # containers) may change or hit the database from the listener
+        # thread, so snapshot the message here as the stdlib does, and render
+        # the traceback before its frames move on.
+        if _primitive_args(record.args) and not record.exc_info:
+            return record
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def emit(self, record):
+        if self._unreported:
+            self._report_dropped()
+        try:
+            self.enqueue(self.prepare(record))
+        except queue.Full:
+            # emit() runs under the handler lock, so the counters are safe
+            self.dropped += 1
+            self._unreported += 1
+        except Exception:
+            self.handleError(record)
+
+    def enqueue(self, record):
+        self.queue.put_nowait(record)
+
+    def _report_dropped(self):
+        count, self._unreported = self._unreported, 0
+        record = logging.makeLogRecord({
+            "name": __name__,
+            "levelno": logging.WARNING,
+            "levelname": logging.getLevelName(logging.WARNING),
+            "module": "log_handlers",
+            "msg": "%s log records dropped, logging queue full",
+            "args": (count,),
+        })
+        try:
+            self.enqueue(record)
+        except queue.Full:
+            self._unreported += count
+
+    def stats(self):
+        """Queue fill and dropped record counters of this worker"""
+        return {
+            "queued": self.queue.qsize(),
+            "capacity": self.queue_size,
+            "dropped": self.dropped,
+        }
+
+    def flush(self):
+        """Wait until the listener has written every queued record"""
+        if self.listener._thread is not None:
+            self.queue.join()
+        for target in self.targets:
+            target.flush()
+
+    def close(self):
+        if self.listener._thread is not None:
+            self.listener.stop()
+        for target in self.targets:
+            target.close()
+        super().close()
+
+
+def queue_handlers():
+    """The QueueLogHandlers attached to the root logger"""
+    return [
+        handler
+        for handler in logging.getLogger().handlers
+        if isinstance(handler, QueueLogHandler)
+    ]
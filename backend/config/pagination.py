@@ -0,0 +1,175 @@
+import base64
+import json
+
+from django.conf import settings
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.utils.urls import replace_query_param
+
+from config.response import CustomResponse
+
+
+class InvalidCursor(ValidationError):
+    default_detail = "Invalid cursor"
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination over a fixed, unique ordering.
+    Each page is fetched with ``WHERE (key) > (cursor) ORDER BY key LIMIT n``
+    so deep pages cost the same as the first one.
+    Views may override the ordering with a ``keyset_ordering`` attribute,
+    which can also name annotations such as a search rank, or per request
+    with a ``get_keyset_ordering()`` method.
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size = settings.REST_FRAMEWORK.get("PAGE_SIZE", 100)
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+    cursor_query_param = "cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page, position, reverse = self._page(queryset, request, view)
+        return self._rows(list(page), position, reverse)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """``paginate_queryset`` through the async ORM"""
+        page, position, reverse = self._page(queryset, request, view)
+        return self._rows([row async for row in page], position, reverse)
+
+    def _page(self, queryset, request, view):
+        """The page's query, one row past the page size, and the cursor"""
+        self.request = request
+        self.ordering = tuple(self.get_ordering(view))
+        self.page_size = self.get_page_size(request)
+        self.fields = [self._field(queryset, name.lstrip("-")) for name in self.ordering]
+
+        position, reverse = self.decode_cursor(request)
+        ordering = self._reversed(self.ordering) if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self._seek(ordering, position))
+        return queryset[: self.page_size + 1], position, reverse
+
+    def get_ordering(self, view):
+        if hasattr(view, "get_keyset_ordering"):
+            return view.get_keyset_ordering()
+        return getattr(view, "keyset_ordering", self.ordering)
+
+    def _rows(self, rows, position, reverse):
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+
+        # Moving backwards always leaves a next page, moving forward from a
+        # cursor always leaves a previous page
+        has_next = has_more if not reverse else True
+        has_previous = has_more if reverse else position is not None
+        self.next_cursor = (
+            self.encode_cursor(self._position(rows[-1]), False)
+            if rows and has_next
+            else None
+        )
+        self.previous_cursor = (
+            self.encode_cursor(self._position(rows[0]), True)
+            if rows and has_previous
+            else None
+        )
+        return rows
+
+    @staticmethod
+    def _field(queryset, name):
+        annotation = queryset.query.annotations.get(name)
+        if annotation is None:
+            return queryset.model._meta.get_field(name)
+        field = annotation.output_field.clone()
+        field.set_attributes_from_name(name)
+        return field
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_pagination(self):
+        """Pagination block for the ``CustomResponse`` envelope"""
+        return {
+            "next": self._link(self.next_cursor),
+            "previous": self._link(self.previous_cursor),
+            "next_cursor": self.next_cursor,
+            "previous_cursor": self.previous_cursor,
+            "page_size": self.page_size,
+        }
+
+    def get_paginated_response(self, data):
+        return CustomResponse(data, status=200, pagination=self.get_pagination())
+
+    # Cursor handling
+
+    def encode_cursor(self, position, reverse):
+        # isoformat() keeps full microsecond precision, which DjangoJSONEncoder
+        # truncates and which the seek comparison needs to be exact
+        values = [
+            value.isoformat() if hasattr(value, "isoformat") else value
+            for value in position
+        ]
+        payload = json.dumps({"p": values, "r": int(reverse)})
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            values = payload["p"]
+            if len(values) != len(self.fields):
+                raise ValueError
+            position = [
+                field.to_python(value) for field, value in zip(self.fields, values)
+            ]
+            return position, bool(payload.get("r"))
+        except Exception:
+            raise InvalidCursor()
+
+    def _position(self, row):
+        # Rows are model instances or, on the values() fast path, dicts
+        if isinstance(row, dict):
+            return [row[field.attname] for field in self.fields]
+        return [getattr(row, field.attname) for field in self.fields]
+
+    def _link(self, cursor):
+        if cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    # Query building
+
+    @staticmethod
+    def _reversed(ordering):
+        return tuple(
+            name[1:] if name.startswith("-") else f"-{name}" for name in ordering
+        )
+
+    @staticmethod
+    def _seek(ordering, position):
+        """Rows strictly after ``position`` in ``ordering``"""
+        condition = Q()
+        for index, name in enumerate(ordering):
+            lookup = "lt" if name.startswith("-") else "gt"
+            column = name.lstrip("-")
+            term = Q(**{f"{column}__{lookup}": position[index]})
+            for previous, value in zip(ordering[:index], position[:index]):
+                term &= Q(**{previous.lstrip("-"): value})
+            condition |= term
+        # The redundant inclusive bound on the leading column lets the
+        # database seek into the index instead of scanning up to the cursor
+        leading = ordering[0]
+        lookup = "lte" if leading.startswith("-") else "gte"
+        return Q(**{f"{leading.lstrip('-')}__{lookup}": position[0]}) & condition
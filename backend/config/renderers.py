@@ -0,0 +1,65 @@
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # Optional accelerator, the stdlib encoder is used instead
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer writing the response with orjson when it is installed.
+    Output matches the stock renderer byte for byte: compact, UTF-8,
+    millisecond ``Z`` datetimes, Decimals as numbers and U+2028/U+2029
+    escaped. The envelope's ``data`` list is encoded in place, straight to
+    bytes.
+    Indented output (the browsable API) goes through the stock renderer.
+    """
+
+    # Dates and times go through DRF's encoder too, which trims datetimes
+    # to milliseconds where orjson would keep microseconds
+    options = (
+        (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS) if orjson else 0
+    )
+    # Decimal, lazy strings, querysets etc. the way DRF's encoder handles them
+    default = encoders.JSONEncoder().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        renderer_context = renderer_context or {}
+        indent = self.get_indent(accepted_media_type, renderer_context)
+        if orjson is None or indent is not None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=self.default, option=self.options)
+        # Match the stock renderer, which escapes these for JavaScript
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return ret
+
+
+class StreamingExportRenderer(BaseRenderer):
+    """
+    Registers an export format for content negotiation.
+    Views answering in this format return a StreamingHttpResponse directly,
+    so render() is only reached for error payloads.
+    """
+
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return str(data).encode(self.charset)
+
+
+class CSVRenderer(StreamingExportRenderer):
+    media_type = "text/csv"
+    format = "csv"
+
+
+class NDJSONRenderer(StreamingExportRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
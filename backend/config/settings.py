@@ -2,6 +2,7 @@ import os
 from pathlib import Path
 from datetime import timedelta
 import environ
+from corsheaders.defaults import default_headers
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -18,6 +19,9 @@ ALLOWED_HOSTS = env("ALLOWED_HOSTS").split(",")
 CORS_ALLOW_ALL_ORIGINS = (
     True if str(env("ALLOW_ALL_ORIGINS")).upper() == "TRUE" else False
 )
+# The frontend reads and echoes the replica pin (see DATABASE_REPLICAS)
+CORS_ALLOW_HEADERS = (*default_headers, "x-db-primary-pin")
+CORS_EXPOSE_HEADERS = ["X-DB-Primary-Pin"]
 
 
 # Application definition
@@ -54,19 +58,19 @@ AUTH_USER_MODEL = 'accounts.User'
 # REST Framework Configuration
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "config.authentication.CachedJWTAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "config.renderers.FastJSONRenderer",
     ],
     "DEFAULT_PARSER_CLASSES": [
-        "rest_framework.parsers.JSONParser",
+        "config.parsers.FastJSONParser",
     ],
     "EXCEPTION_HANDLER": "rest_framework.views.exception_handler",
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "DEFAULT_PAGINATION_CLASS": "config.pagination.KeysetPagination",
     "PAGE_SIZE": 100,
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
@@ -132,6 +136,97 @@ DATABASES = {
 #     }
 # }
 
+# Read replicas: DB_REPLICAS is a comma-separated list of SQLite files, e.g.
+# DB_REPLICAS=db_replica.sqlite3, refreshed from the primary with
+# `python manage.py sync_replica`. GETs of the core viewsets and the
+# dashboard read from a replica picked once per request, except for users who
+# wrote within REPLICA_STICKY_SECONDS. That pin is a signed X-DB-Primary-Pin
+# token returned by writes and echoed back by the client, so it holds across
+# workers. Without replicas everything uses "default".
+DATABASE_REPLICAS = []
+for index, name in enumerate(
+    filter(None, env("DB_REPLICAS", default="").split(",")), start=1
+):
+    DATABASES[f"replica{index}"] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / name.strip(),
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(f"replica{index}")
+DATABASE_ROUTERS = ["config.db_routers.ReplicaRouter"]
+
+# PRAGMAs run on every new SQLite connection (config.sqlite_pragmas), chosen
+# by SQLITE_PROFILE. Compare them with `python manage.py benchmark_sqlite_profiles`.
+SQLITE_PROFILES = {
+    # SQLite's own defaults: rollback journal, synchronous=FULL, a 2 MB page
+    # cache and deferred transactions
+    "stock": {},
+    # Readers and the writer no longer block each other, and writers queue
+    # for the lock. synchronous=NORMAL may lose the last commits on power
+    # loss (never on a crash of the process) but cannot corrupt the file.
+    "wal": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+        "cache_size": -20000,  # KiB
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "transaction_mode": "IMMEDIATE",
+    },
+}
+SQLITE_PROFILES["wal_durable"] = {**SQLITE_PROFILES["wal"], "synchronous": "FULL"}
+SQLITE_PROFILE = env("SQLITE_PROFILE", default="wal")
+REPLICA_STICKY_SECONDS = 5
+# Cache
+# Entries are keyed by the DataVersion rows in the database, so a per-process
+# cache never serves stale data; point this at Redis/Memcached to share entries
+# Company/department/employee read responses are cached only with
+# RESPONSE_CACHE_ENABLED=True; once RESPONSE_CACHE_MAX_ENTRIES is reached each
+# new entry evicts the least recently used one
+RESPONSE_CACHE_ENABLED = (
+    True if str(env("RESPONSE_CACHE_ENABLED", default="False")).upper() == "TRUE" else False
+)
+RESPONSE_CACHE_TIMEOUT = 60
+RESPONSE_CACHE_MAX_ENTRIES = 1000
+
+# Users resolved from JWT access tokens are kept per worker for this many
+# seconds; saving a user evicts them in the worker that saved it
+AUTH_USER_CACHE = "auth-users"
+AUTH_USER_CACHE_TIMEOUT = 30
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "employee-api",
+    },
+    "responses": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "employee-api-responses",
+        "TIMEOUT": RESPONSE_CACHE_TIMEOUT,
+        "OPTIONS": {
+            "MAX_ENTRIES": RESPONSE_CACHE_MAX_ENTRIES,
+            # Cull len // MAX_ENTRIES = 1 entry, the least recently used
+            "CULL_FREQUENCY": RESPONSE_CACHE_MAX_ENTRIES,
+        },
+    },
+    "auth-users": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "employee-api-auth-users",
+        "TIMEOUT": AUTH_USER_CACHE_TIMEOUT,
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    },
+}
+DASHBOARD_CACHE_TIMEOUT = 300
+OPTIONS_CACHE_TIMEOUT = 300
+
+# Name lookup indexes (/api/lookup/) are checked against the DataVersion of
+# their model at most this often, catching bulk writes and other workers
+LOOKUP_INDEX_CHECK_INTERVAL = 5
+
+# Bulk employee import (POST /api/employees/bulk/)
+EMPLOYEE_IMPORT_BATCH_SIZE = 500
+EMPLOYEE_IMPORT_MAX_ROWS = 10000
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
@@ -185,6 +280,14 @@ EMAIL_HOST_PASSWORD = env("EMAIL_HOST_PASSWORD")
 DEFAULT_FROM_EMAIL = env("DEFAULT_FROM_EMAIL")
 
 # Logging Configuration
+# Records go through a bounded in-memory queue and are formatted and written
+# by a listener thread, so logging never blocks a request on disk I/O. When
+# LOG_QUEUE_SIZE records are waiting, new ones are dropped and counted (see
+# /api/logs/stats/). app.log rotates at LOG_MAX_BYTES, keeping LOG_BACKUP_COUNT files.
+LOG_QUEUE_SIZE = int(env("LOG_QUEUE_SIZE", default=10000))
+LOG_MAX_BYTES = int(env("LOG_MAX_BYTES", default=10 * 1024 * 1024))
+LOG_BACKUP_COUNT = int(env("LOG_BACKUP_COUNT", default=5))
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -195,23 +298,22 @@ LOGGING = {
         },
     },
     'handlers': {
-        'console': {
-            'class': 'logging.StreamHandler',
-            'formatter': 'verbose',
-        },
-        'file': {
-            'class': 'logging.FileHandler',
+        'queue': {
+            'class': 'config.log_handlers.QueueLogHandler',
             'filename': BASE_DIR / 'logs' / 'app.log',
+            'max_bytes': LOG_MAX_BYTES,
+            'backup_count': LOG_BACKUP_COUNT,
+            'queue_size': LOG_QUEUE_SIZE,
             'formatter': 'verbose',
         },
     },
     'root': {
-        'handlers': ['console', 'file'],
+        'handlers': ['queue'],
         'level': 'INFO',
     },
     'loggers': {
         'django': {
-            'handlers': ['console', 'file'],
+            'handlers': ['queue'],
             'level': 'INFO',
             'propagate': False,
         },
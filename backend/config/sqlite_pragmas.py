@@ -0,0 +1,61 @@
+import re
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+PRAGMAS = ("journal_mode", "synchronous", "busy_timeout", "cache_size", "mmap_size", "temp_store")
+_VALUE = re.compile(r"-?\w+")
+
+
+def profile(name=None):
+    """The SQLITE_PROFILES entry called ``name`` (default SQLITE_PROFILE)"""
+    name = name or settings.SQLITE_PROFILE
+    try:
+        values = settings.SQLITE_PROFILES[name]
+    except KeyError:
+        raise ImproperlyConfigured(
+            f"Unknown SQLITE_PROFILE {name!r}, use one of "
+            f"{', '.join(sorted(settings.SQLITE_PROFILES))}"
+        )
+    unknown = set(values) - {*PRAGMAS, "transaction_mode"}
+    if unknown:
+        raise ImproperlyConfigured(
+            f"SQLITE_PROFILES[{name!r}] has unsupported keys: {', '.join(sorted(unknown))}"
+        )
+    return values
+
+
+def apply_profile(connection, name=None):
+    """
+    Run the profile's PRAGMAs on a freshly opened SQLite connection.
+
+    ``transaction_mode`` is not a pragma: it sets how the connection BEGINs
+    atomic blocks, as DATABASES OPTIONS["transaction_mode"] would. IMMEDIATE
+    takes the write lock up front, so a writer waits out busy_timeout instead
+    of failing with "database is locked" when it upgrades a read transaction.
+    """
+    if connection.vendor != "sqlite":
+        return
+    values = profile(name)
+    with connection.cursor() as cursor:
+        for pragma in PRAGMAS:
+            if pragma in values:
+                value = str(values[pragma])
+                if not _VALUE.fullmatch(value):
+                    raise ImproperlyConfigured(f"Invalid value for PRAGMA {pragma}: {value!r}")
+                cursor.execute(f"PRAGMA {pragma} = {value}")
+    if "transaction_mode" in values:
+        mode = values["transaction_mode"]
+        if mode is not None and mode.upper() not in connection.transaction_modes:
+            raise ImproperlyConfigured(f"Invalid transaction_mode: {mode!r}")
+        connection.transaction_mode = mode.upper() if mode else None
+
+
+def current_pragmas(connection):
+    """The connection's effective value of every tuned PRAGMA"""
+    with connection.cursor() as cursor:
+        values = {}
+        for pragma in PRAGMAS:
+            cursor.execute(f"PRAGMA {pragma}")
+            values[pragma] = cursor.fetchone()[0]
+    return values
@@ -23,6 +23,17 @@ urlpatterns = [
 """
 API Endpoints Documentation:
 
+List endpoints are cursor paginated: follow pagination.next / pagination.previous,
+or pass ?cursor={cursor} and ?page_size={n} (max 1000).
+
+Company, department and employee list/detail GETs accept ?fields=a,b to return
+only those keys and ?expand=company,department to nest related objects; only
+the columns and joins they need are queried, unknown names return 400.
+
+Company, department, employee, report, dashboard and options GETs send ETag and
+Last-Modified; repeat them with If-None-Match / If-Modified-Since to get 304
+while the data is unchanged.
+
 Authentication:
 - POST   accounts/api/register/          - Register new user
 - POST   accounts/api/login/             - Login user (returns JWT tokens)
@@ -31,7 +42,8 @@ Authentication:
 Companies:
 - GET    /api/companies/              - List all companies
 - POST   /api/companies/              - Create new company (Admin only)
-- GET    /api/companies/{id}/         - Retrieve single company
+- GET    /api/companies/{id}/         - Retrieve single company (supports ?depth=0-2, default 1, ?employees_limit=)
+- GET    /api/companies/{id}/employees/ - Paginated company employees (supports ?status=)
 - PUT    /api/companies/{id}/         - Update company (Admin only)
 - PATCH  /api/companies/{id}/         - Partial update company (Admin only)
 - DELETE /api/companies/{id}/         - Delete company (Admin only)
@@ -39,20 +51,47 @@ Companies:
 Departments:
 - GET    /api/departments/            - List all departments (supports ?company={id} filter)
 - POST   /api/departments/            - Create new department (Admin/Manager)
-- GET    /api/departments/{id}/       - Retrieve single department
+- GET    /api/departments/{id}/       - Retrieve single department (supports ?depth=0-1, default 0, ?employees_limit=)
+- GET    /api/departments/{id}/employees/ - Paginated department employees (supports ?status=)
 - PUT    /api/departments/{id}/       - Update department (Admin/Manager)
 - PATCH  /api/departments/{id}/       - Partial update department (Admin/Manager)
 - DELETE /api/departments/{id}/       - Delete department (Admin/Manager)
 
 Employees:
-- GET    /api/employees/              - List all employees (supports filters: ?company={id}, ?department={id}, ?status={status})
+- GET    /api/employees/              - List all employees (supports filters: ?company={id}, ?department={id}, ?status={status},
+                                        and ?q= full-text search over name, email, phone, designation and address, best match first)
 - POST   /api/employees/              - Create new employee (Admin/Manager)
+- POST   /api/employees/transition/   - Move employees (by ids or filter) to a new workflow status (Admin/Manager)
+- POST   /api/employees/bulk/         - Import employees from a JSON array or CSV file (Admin/Manager, ?mode=atomic|partial, ?batch_size={n})
 - GET    /api/employees/{id}/         - Retrieve single employee
 - PUT    /api/employees/{id}/         - Update employee (Admin/Manager)
 - PATCH  /api/employees/{id}/         - Partial update employee (Admin/Manager)
 - DELETE /api/employees/{id}/         - Delete employee (Admin/Manager)
-- GET    /api/employees/report/       - Get report of hired employees
+- GET    /api/employees/report/       - Get report of hired employees (?format=csv|ndjson streams the rows)
 
 Dashboard:
-- GET    /api/dashboard/              - Get summary statistics
+- GET    /api/dashboard/              - Get summary statistics (supports ?company={id}, ?department={id}, ?breakdown=company)
+- GET    /api/dashboard/cache/        - Get dashboard cache hit/miss counters (Admin only)
+
+Form options:
+- GET    /api/options/                - Company [id, name], department [id, company_id, name] and status [value, label] arrays for dropdowns (ETag)
+
+Lookup:
+- GET    /api/lookup/                 - Autocomplete names: ?type=company|department|employee&prefix=
+                                        (optional ?limit= up to 50, ?company= / ?department= for departments and employees)
+
+Response cache (RESPONSE_CACHE_ENABLED=True):
+- GET    /api/cache/responses/        - Get company/department/employee response cache hit ratios (Admin only)
+
+Logging:
+- GET    /api/logs/stats/             - Get logging queue fill and dropped record counts (Admin only)
+
+Async reads (for ASGI deployments, same payloads, permissions and ETags as the endpoints above):
+- GET    /api/async/companies/        - List companies
+- GET    /api/async/companies/{id}/   - Retrieve single company
+- GET    /api/async/departments/      - List departments
+- GET    /api/async/departments/{id}/ - Retrieve single department
+- GET    /api/async/employees/        - List employees
+- GET    /api/async/employees/{id}/   - Retrieve single employee
+- GET    /api/async/dashboard/        - Get summary statistics
 """
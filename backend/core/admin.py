@@ -22,14 +22,16 @@ class CompanyAdmin(admin.ModelAdmin):
     ordering = ["company_name"]
 
     def number_of_departments(self, obj):
-        return obj.number_of_departments
+        return obj.departments_count
 
     number_of_departments.short_description = "Departments"
+    number_of_departments.admin_order_field = "departments_count"
 
     def number_of_employees(self, obj):
-        return obj.number_of_employees
+        return obj.employees_count
 
     number_of_employees.short_description = "Employees"
+    number_of_employees.admin_order_field = "employees_count"
 
 
 @admin.register(Department)
@@ -42,10 +44,14 @@ class DepartmentAdmin(admin.ModelAdmin):
     readonly_fields = ["created_at", "updated_at", "number_of_employees"]
     ordering = ["company", "department_name"]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("company")
+
     def number_of_employees(self, obj):
-        return obj.number_of_employees
+        return obj.employees_count
 
     number_of_employees.short_description = "Employees"
+    number_of_employees.admin_order_field = "employees_count"
 
 
 @admin.register(Employee)
@@ -0,0 +1,35 @@
+from contextlib import contextmanager
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+
+@contextmanager
+def throwaway_database():
+    """
+    Point the default connection at a fresh test database for the duration of
+    the block and drop it afterwards, so benchmarks never touch the
+    configured database.
+    """
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+class BenchmarkCommand(BaseCommand):
+    """
+    Base for the benchmark_* commands: ``handle`` runs ``benchmark`` in a
+    throwaway database. Subclasses implement only the measurement, and may
+    override ``handle`` for checks that need no database before calling super.
+    """
+
+    def handle(self, *args, **options):
+        with throwaway_database():
+            self.benchmark(**options)
+
+    def benchmark(self, **options):
+        raise NotImplementedError(
+            "subclasses of BenchmarkCommand must provide a benchmark() method"
+        )
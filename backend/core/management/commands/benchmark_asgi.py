@@ -0,0 +1,168 @@
+import asyncio
+import logging
+import random
+import time
+
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import User
+from core.management.benchmark import BenchmarkCommand
+from core.models import Company, Department, Employee
+
+from .benchmark_search import DESIGNATIONS, FIRST_NAMES, LAST_NAMES
+
+
+class Command(BenchmarkCommand):
+    help = (
+        "Drive the ASGI application with concurrent clients over the sync and "
+        "the /api/async/ read endpoints in a throwaway test database, reporting "
+        "throughput and latency percentiles per concurrency level"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--clients", default="100,250,500,1000",
+                            help="Comma-separated concurrency levels")
+        parser.add_argument("--seconds", type=float, default=5)
+        parser.add_argument("--rows", type=int, default=10000)
+
+    def benchmark(self, **options):
+        paths, token = self._populate(options["rows"])
+        from config.asgi import application
+
+        # Compare the request paths, not the cost of their access logs
+        logging.getLogger("core").setLevel(logging.WARNING)
+
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"{options['rows']:,} employees, {options['seconds']:g} s per run, "
+            f"requests cycle through {', '.join(paths)}\n"
+        ))
+        self.stdout.write(
+            f"{'clients':>7} {'path':<6} {'req/s':>8} {'p50':>9} {'p95':>9}"
+            f" {'p99':>9} {'errors':>7}"
+        )
+        for clients in (int(value) for value in options["clients"].split(",")):
+            for label, prefix in (("sync", "/api/"), ("async", "/api/async/")):
+                urls = [prefix + path for path in paths]
+                result = asyncio.run(
+                    self._run(application, urls, token, clients, options["seconds"])
+                )
+                self._report(clients, label, result)
+
+    def _populate(self, rows):
+        companies = Company.objects.bulk_create(
+            Company(company_name=f"Company {i}") for i in range(20)
+        )
+        departments = Department.objects.bulk_create(
+            Department(company=company, department_name=f"Department {i}")
+            for company in companies
+            for i in range(5)
+        )
+        rng = random.Random(42)
+
+        def employee(i):
+            department = rng.choice(departments)
+            return Employee(
+                company_id=department.company_id,
+                department=department,
+                employee_name=f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                email_address=f"employee{i}@example.com",
+                mobile_number="+201234567890",
+                address="123 Test St",
+                designation=rng.choice(DESIGNATIONS),
+            )
+
+        Employee.objects.bulk_create((employee(i) for i in range(rows)), batch_size=5000)
+        user = User.objects.create_user(
+            username="bench", email="bench@example.com", password="bench", role="employee"
+        )
+        employee = Employee.objects.order_by("id").values_list("id", flat=True)[rows // 2]
+        paths = [
+            "employees/?page_size=20",
+            f"employees/{employee}/",
+            f"companies/{companies[0].id}/?depth=1",
+            f"departments/?company={companies[1].id}",
+            "dashboard/",
+        ]
+        return paths, str(RefreshToken.for_user(user).access_token)
+
+    async def _request(self, application, url, token):
+        """One GET through the ASGI app: (status, seconds)"""
+        path, _, query = url.partition("?")
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "root_path": "",
+            "headers": [
+                (b"host", b"localhost"),
+                (b"authorization", f"Bearer {token}".encode()),
+            ],
+            "client": ("127.0.0.1", 50000),
+            "server": ("localhost", 80),
+        }
+        done = asyncio.Event()
+        request_sent = False
+        status = None
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            # Django listens for a disconnect while the view runs
+            await done.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif not message.get("more_body"):
+                done.set()
+
+        started = time.perf_counter()
+        await application(scope, receive, send)
+        return status, time.perf_counter() - started
+
+    async def _run(self, application, urls, token, clients, seconds):
+        started = time.perf_counter()
+        deadline = started + seconds
+        timings, errors = [], 0
+
+        async def client(offset):
+            nonlocal errors
+            i = offset
+            while time.perf_counter() < deadline:
+                status, elapsed = await self._request(
+                    application, urls[i % len(urls)], token
+                )
+                i += 1
+                if status == 200:
+                    timings.append(elapsed)
+                else:
+                    errors += 1
+
+        await asyncio.gather(*(client(offset) for offset in range(clients)))
+        # Requests in flight at the deadline still count, so divide by the
+        # time they took to drain
+        elapsed = time.perf_counter() - started
+        return {"timings": sorted(timings), "errors": errors, "elapsed": elapsed}
+
+    def _report(self, clients, label, result):
+        timings = result["timings"]
+
+        def percentile(fraction):
+            if not timings:
+                return float("nan")
+            return timings[min(len(timings) - 1, int(len(timings) * fraction))] * 1000
+
+        self.stdout.write(
+            f"{clients:>7} {label:<6} {len(timings) / result['elapsed']:>8.1f}"
+            f" {percentile(0.5):>6.0f} ms {percentile(0.95):>6.0f} ms"
+            f" {percentile(0.99):>6.0f} ms {result['errors']:>7}"
+        )
@@ -0,0 +1,190 @@
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from datetime import date, datetime, timedelta, timezone
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Count, Q
+
+from config.pagination import KeysetPagination
+from core.models import Employee
+
+
+# Indexes shipped by 0001/0002, before Employee.Meta.indexes existed
+BASELINE_INDEXES = [
+    'CREATE INDEX "employees_company_id" ON "employees" ("company_id")',
+    'CREATE INDEX "employees_department_id" ON "employees" ("department_id")',
+]
+
+START = datetime(2020, 1, 1)
+
+STATUSES = [
+    ("application_received", 0.4),
+    ("interview_scheduled", 0.25),
+    ("hired", 0.2),
+    ("not_accepted", 0.15),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the employee access paths on a synthetic SQLite table, "
+        "before and after the Employee.Meta.indexes"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1_000_000)
+        parser.add_argument("--companies", type=int, default=100)
+        parser.add_argument("--departments", type=int, default=10,
+                            help="Departments per company")
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--path", help="SQLite file to build (default: temp file)")
+
+    def handle(self, *args, **options):
+        path = options["path"] or os.path.join(
+            tempfile.mkdtemp(prefix="bench-indexes-"), "bench.sqlite3"
+        )
+        if os.path.exists(path):
+            os.remove(path)
+        db = sqlite3.connect(path)
+        table_sql, index_sql = self._schema()
+        db.execute(table_sql)
+        for sql in BASELINE_INDEXES:
+            db.execute(sql)
+
+        self.stdout.write(f"Populating {options['rows']:,} employees in {path}")
+        self._populate(db, options)
+        db.execute("ANALYZE")
+        queries = self._queries(options)
+
+        before = self._run(db, queries, options["repeat"])
+
+        for sql in BASELINE_INDEXES:
+            db.execute(f'DROP INDEX {sql.split()[2]}')
+        for sql in index_sql:
+            db.execute(sql)
+        db.execute("ANALYZE")
+        after = self._run(db, queries, options["repeat"])
+        db.close()
+
+        for label, _, _ in queries:
+            self.stdout.write(self.style.MIGRATE_HEADING(f"\n{label}"))
+            for phase, results in (("before", before), ("after", after)):
+                median, plan = results[label]
+                self.stdout.write(f"  {phase:<6} {median:10.2f} ms")
+                for line in plan:
+                    self.stdout.write(f"           {line}")
+
+    def _schema(self):
+        """CREATE TABLE and Meta index DDL as the migrations would emit them"""
+        with connection.schema_editor(collect_sql=True, atomic=False) as editor:
+            editor.create_model(Employee)
+        statements = [sql.rstrip(";") for sql in editor.collected_sql]
+        table_sql = next(sql for sql in statements if sql.startswith("CREATE TABLE"))
+        index_sql = [sql for sql in statements if "INDEX" in sql]
+        return table_sql, index_sql
+
+    def _populate(self, db, options):
+        db.execute("PRAGMA journal_mode=OFF")
+        db.execute("PRAGMA synchronous=OFF")
+        rng = random.Random(42)
+        statuses = [status for status, _ in STATUSES]
+        weights = [weight for _, weight in STATUSES]
+        companies = options["companies"]
+        departments = options["departments"]
+        batch = []
+        for pk in range(1, options["rows"] + 1):
+            company_id = rng.randint(1, companies)
+            department_id = (company_id - 1) * departments + rng.randint(1, departments)
+            employee_status = rng.choices(statuses, weights)[0]
+            created_at = START + timedelta(seconds=pk * 30)
+            hired_on = (
+                (created_at + timedelta(days=14)).date().isoformat()
+                if employee_status == "hired"
+                else None
+            )
+            batch.append((
+                pk, company_id, department_id, employee_status, f"Employee {pk}",
+                f"employee{pk}@example.com", "+1234567890", "123 Test St",
+                "Developer", hired_on, created_at.isoformat(" "),
+                created_at.isoformat(" "),
+            ))
+            if len(batch) == 50_000:
+                self._insert(db, batch)
+                batch = []
+        if batch:
+            self._insert(db, batch)
+        db.commit()
+
+    def _insert(self, db, rows):
+        db.executemany(
+            "INSERT INTO employees (id, company_id, department_id, employee_status, "
+            "employee_name, email_address, mobile_number, address, designation, "
+            "hired_on, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    def _queries(self, options):
+        """The ORM access paths of EmployeeViewSet, the report and the dashboard"""
+        employees = Employee.objects.order_by("-created_at", "-id")
+        middle_pk = options["rows"] // 2
+        middle = START.replace(tzinfo=timezone.utc) + timedelta(seconds=middle_pk * 30)
+        company = options["companies"] // 2
+        department = company * options["departments"]
+        querysets = [
+            ("list: first page", employees[:100]),
+            (
+                "list: deep keyset page",
+                employees.filter(
+                    KeysetPagination._seek(("-created_at", "-id"), [middle, middle_pk])
+                )[:100],
+            ),
+            ("list: ?company=", employees.filter(company_id=company)[:100]),
+            ("list: ?department=", employees.filter(department_id=department)[:100]),
+            ("list: ?status=", employees.filter(employee_status="interview_scheduled")[:100]),
+            (
+                "list: ?company=&status=",
+                employees.filter(company_id=company, employee_status="hired")[:100],
+            ),
+            ("report: hired", employees.filter(employee_status="hired")[:100]),
+            (
+                "dashboard: company breakdown",
+                Employee.objects.order_by()
+                .values("company_id")
+                .annotate(
+                    total=Count("pk"),
+                    hired=Count("pk", filter=Q(employee_status="hired")),
+                ),
+            ),
+        ]
+        compiled = []
+        for label, queryset in querysets:
+            sql, params = queryset.query.get_compiler(connection=connection).as_sql()
+            compiled.append((label, sql.replace("%s", "?"), self._adapt(params)))
+        return compiled
+
+    @staticmethod
+    def _adapt(params):
+        return tuple(
+            value.isoformat(" ") if isinstance(value, (datetime, date)) else value
+            for value in params
+        )
+
+    def _run(self, db, queries, repeat):
+        results = {}
+        for label, sql, params in queries:
+            plan = [
+                row[-1] for row in db.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            ]
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                db.execute(sql, params).fetchall()
+                timings.append((time.perf_counter() - started) * 1000)
+            results[label] = (statistics.median(timings), plan)
+        return results
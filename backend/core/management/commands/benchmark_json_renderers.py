@@ -0,0 +1,85 @@
+import io
+import statistics
+import time
+
+from rest_framework import status
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from config.parsers import FastJSONParser
+from config.renderers import FastJSONRenderer, orjson
+from config.response import CustomResponse
+from core.models import Employee
+from core.services.fast_read_service import FastReadService
+
+from .benchmark_read_paths import Command as ReadPathsCommand
+
+
+class Command(ReadPathsCommand):
+    help = (
+        "Benchmark DRF's JSONRenderer/JSONParser against FastJSONRenderer/"
+        "FastJSONParser on the employee list envelope in a throwaway test database"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100000)
+        parser.add_argument("--page-sizes", default="20,1000,100000",
+                            help="Comma-separated number of employees per response")
+        parser.add_argument("--companies", type=int, default=20)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            self.stdout.write(self.style.WARNING(
+                "orjson is not installed, FastJSONRenderer falls back to the stdlib encoder"
+            ))
+        super().handle(*args, **options)
+
+    def benchmark(self, **options):
+        self._populate(options["rows"], options["companies"])
+        for size in (int(value) for value in options["page_sizes"].split(",")):
+            self._compare_renderers(size, options["repeat"])
+
+    def _median(self, work, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = work()
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings), result
+
+    def _compare_renderers(self, size, repeat):
+        plan = FastReadService.plan(FastReadService.EMPLOYEE_FIELDS)
+        rows = plan.render(
+            Employee.objects.order_by("-created_at", "-id").values(*plan.columns)[:size]
+        )
+        envelope = CustomResponse(
+            data=rows,
+            status=status.HTTP_200_OK,
+            pagination={"next": None, "previous": None, "page_size": size},
+        ).data
+
+        stock, fast = JSONRenderer(), FastJSONRenderer()
+        slow, slow_body = self._median(lambda: stock.render(envelope), repeat)
+        quick, fast_body = self._median(lambda: fast.render(envelope), repeat)
+        identical = "identical" if slow_body == fast_body else "DIFFERENT"
+
+        stock_parser, fast_parser = JSONParser(), FastJSONParser()
+        parse_slow, _ = self._median(
+            lambda: stock_parser.parse(io.BytesIO(slow_body)), repeat
+        )
+        parse_fast, _ = self._median(
+            lambda: fast_parser.parse(io.BytesIO(slow_body)), repeat
+        )
+
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"\n{len(rows):,} employees ({len(slow_body) / 1024:,.0f} KiB)"
+        ))
+        self.stdout.write(
+            f"  render  JSONRenderer {slow:9.2f} ms   FastJSONRenderer {quick:9.2f} ms"
+            f"   x{slow / quick:5.1f}   output {identical}"
+        )
+        self.stdout.write(
+            f"  parse   JSONParser   {parse_slow:9.2f} ms   FastJSONParser   {parse_fast:9.2f} ms"
+            f"   x{parse_slow / parse_fast:5.1f}"
+        )
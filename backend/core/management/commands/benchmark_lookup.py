@@ -0,0 +1,92 @@
+import random
+import statistics
+import time
+
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from accounts.models import User
+from core.management.benchmark import BenchmarkCommand
+from core.models import Company, Employee
+from core.services.lookup_service import LookupService
+from core.views import lookup_names
+
+from .benchmark_search import FIRST_NAMES, LAST_NAMES
+
+
+class Command(BenchmarkCommand):
+    help = (
+        "Measure /api/lookup/ prefix latency from the in-process index and "
+        "from the LOWER(name) index query in a throwaway test database"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100000)
+        parser.add_argument("--repeat", type=int, default=1000)
+
+    def benchmark(self, **options):
+        LookupService.reset()
+        try:
+            self._populate(options["rows"])
+            self._measure(options["repeat"])
+        finally:
+            LookupService.reset()
+
+    def _populate(self, rows):
+        company = Company.objects.create(company_name="Benchmark Co")
+        rng = random.Random(42)
+        Employee.objects.bulk_create(
+            (
+                Employee(
+                    company=company,
+                    employee_name=f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {i}",
+                    email_address=f"employee{i}@example.com",
+                    mobile_number="+1234567890",
+                    address="123 Test St",
+                    designation="Developer",
+                )
+                for i in range(rows)
+            ),
+            batch_size=10000,
+        )
+
+    def _time_us(self, work, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            work()
+            timings.append((time.perf_counter() - started) * 1e6)
+        timings.sort()
+        return statistics.median(timings), timings[int(len(timings) * 0.99) - 1]
+
+    def _measure(self, repeat):
+        index = LookupService.INDEXES["employee"]
+        started = time.perf_counter()
+        index.ready()
+        self.stdout.write(
+            f"Loaded {len(index._keys):,} names in "
+            f"{(time.perf_counter() - started) * 1000:.0f} ms"
+        )
+
+        admin = User.objects.create_user(
+            username="bench", email="bench@example.com", password="bench", role="admin"
+        )
+        factory = APIRequestFactory()
+
+        def endpoint(prefix):
+            request = factory.get("/api/lookup/", {"type": "employee", "prefix": prefix})
+            force_authenticate(request, user=admin)
+            return lookup_names(request)
+
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"\n{'prefix':<10} {'index p50/p99 (us)':>20} {'query p50/p99 (us)':>20}"
+            f" {'endpoint p50 (us)':>18}"
+        ))
+        for prefix in ("m", "mo", "moh", "mohamed s", "zz"):
+            in_memory = self._time_us(lambda: LookupService.lookup("employee", prefix), repeat)
+            query = self._time_us(lambda: index.query(prefix, 10), repeat)
+            request = self._time_us(lambda: endpoint(prefix), max(1, repeat // 10))
+            assert index.search(prefix, 10) == index.query(prefix, 10)
+            self.stdout.write(
+                f"{prefix!r:<10} {in_memory[0]:>9.1f} / {in_memory[1]:<8.1f}"
+                f" {query[0]:>9.1f} / {query[1]:<8.1f} {request[0]:>12.1f}"
+            )
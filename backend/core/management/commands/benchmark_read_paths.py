@@ -0,0 +1,104 @@
+import random
+import statistics
+import time
+from datetime import date, timedelta
+
+from rest_framework.renderers import JSONRenderer
+
+from core.management.benchmark import BenchmarkCommand
+from core.models import Company, Department, Employee
+from core.serializers import EmployeeReportSerializer, EmployeeSerializer
+from core.services.fast_read_service import FastReadService
+
+STATUSES = ["application_received", "interview_scheduled", "hired", "not_accepted"]
+
+
+class Command(BenchmarkCommand):
+    help = (
+        "Benchmark EmployeeSerializer/EmployeeReportSerializer against the "
+        "values() fast path in a throwaway test database"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", default="10000,100000",
+                            help="Comma-separated employee counts")
+        parser.add_argument("--companies", type=int, default=20)
+        parser.add_argument("--repeat", type=int, default=3)
+
+    def benchmark(self, **options):
+        for rows in (int(value) for value in options["rows"].split(",")):
+            self._populate(rows, options["companies"])
+            self._compare(rows, options["repeat"])
+
+    def _populate(self, rows, companies):
+        Employee.objects.all().delete()
+        Department.objects.all().delete()
+        Company.objects.all().delete()
+        company_objs = Company.objects.bulk_create(
+            Company(company_name=f"Company {i}") for i in range(companies)
+        )
+        departments = Department.objects.bulk_create(
+            Department(company=company, department_name=f"Department {i}")
+            for company in company_objs
+            for i in range(5)
+        )
+        rng = random.Random(42)
+        employees = []
+        for i in range(rows):
+            department = rng.choice(departments)
+            employee_status = rng.choice(STATUSES)
+            employees.append(Employee(
+                company_id=department.company_id,
+                department=department,
+                employee_status=employee_status,
+                hired_on=(
+                    date.today() - timedelta(days=rng.randint(0, 2000))
+                    if employee_status == "hired"
+                    else None
+                ),
+                employee_name=f"Employee {i}",
+                email_address=f"employee{i}@example.com",
+                mobile_number="+1234567890",
+                address="123 Test St",
+                designation="Developer",
+            ))
+        Employee.objects.bulk_create(employees, batch_size=5000)
+
+    def _time(self, build, repeat):
+        renderer = JSONRenderer()
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            body = renderer.render(build())
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings), body
+
+    def _compare(self, rows, repeat):
+        employees = Employee.objects.order_by("-created_at", "-id")
+        hired = Employee.objects.select_related("company", "department").filter(
+            employee_status="hired"
+        )
+        plan = FastReadService.plan(FastReadService.EMPLOYEE_FIELDS)
+        paths = [
+            (
+                "employee list",
+                lambda: EmployeeSerializer(
+                    employees.select_related("company", "department"), many=True
+                ).data,
+                lambda: plan.render(employees.values(*plan.columns)),
+            ),
+            (
+                "hired report",
+                lambda: EmployeeReportSerializer(hired, many=True).data,
+                lambda: FastReadService.report(),
+            ),
+        ]
+        self.stdout.write(self.style.MIGRATE_HEADING(f"\n{rows:,} employees"))
+        for label, serializer_path, fast_path in paths:
+            slow, slow_body = self._time(serializer_path, repeat)
+            fast, fast_body = self._time(fast_path, repeat)
+            identical = "identical" if slow_body == fast_body else "DIFFERENT"
+            self.stdout.write(
+                f"  {label:<14} serializer {slow:9.1f} ms   values() {fast:9.1f} ms"
+                f"   x{slow / fast:4.1f}   output {identical}"
+            )
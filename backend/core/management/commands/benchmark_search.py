@@ -0,0 +1,158 @@
+import random
+import statistics
+import time
+
+from django.db import connection
+from django.db.models import Q
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from accounts.models import User
+from core.management.benchmark import BenchmarkCommand
+from core.models import Company, Department, Employee
+from core.services.search_service import SearchService
+from core.views import EmployeeViewSet
+
+FIRST_NAMES = [
+    "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda",
+    "William", "Elizabeth", "David", "Barbara", "Richard", "Susan", "Joseph",
+    "Jessica", "Thomas", "Sarah", "Charles", "Karen", "Christopher", "Nancy",
+    "Daniel", "Lisa", "Matthew", "Betty", "Anthony", "Margaret", "Mark", "Sandra",
+    "Ahmed", "Fatima", "Mohamed", "Aisha", "Omar", "Layla", "Yusuf", "Mariam",
+    "Wei", "Mei", "Hiroshi", "Yuki", "Raj", "Priya", "Carlos", "Sofia", "Luca",
+    "Giulia", "Zoë", "Björn",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
+    "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson",
+    "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson", "Walker",
+    "Young", "Allen", "King", "Wright", "Scott", "Torres", "Nguyen", "Hill",
+    "Flores", "Hassan", "Ali", "Ibrahim", "Tanaka", "Sato", "Patel", "Singh",
+    "Rossi", "Müller", "Schmidt",
+]
+DESIGNATIONS = [
+    "Software Engineer", "Senior Developer", "Product Manager", "Designer",
+    "Data Analyst", "Accountant", "Sales Representative", "HR Specialist",
+    "Support Engineer", "QA Tester", "DevOps Engineer", "Marketing Lead",
+]
+STREETS = ["Main St", "Oak Ave", "Park Road", "High Street", "Maple Drive", "Nile Corniche"]
+CITIES = ["Cairo", "London", "Berlin", "Tokyo", "Austin", "Milan", "Mumbai", "Lagos"]
+
+
+class Command(BenchmarkCommand):
+    help = (
+        "Measure ?q= employee search latency against LIKE '%x%' scans in a "
+        "throwaway test database"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000000)
+        parser.add_argument("--companies", type=int, default=50)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        if not SearchService.available(connection):
+            self.stderr.write("Full-text search needs SQLite FTS5")
+            return
+        super().handle(*args, **options)
+
+    def benchmark(self, **options):
+        self._populate(options["rows"], options["companies"])
+        self._measure(options["repeat"])
+
+    def _populate(self, rows, companies):
+        started = time.perf_counter()
+        company_objs = Company.objects.bulk_create(
+            Company(company_name=f"Company {i}") for i in range(companies)
+        )
+        departments = Department.objects.bulk_create(
+            Department(company=company, department_name=f"Department {i}")
+            for company in company_objs
+            for i in range(5)
+        )
+        rng = random.Random(42)
+        batch = []
+        for i in range(rows):
+            department = rng.choice(departments)
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            batch.append(Employee(
+                company_id=department.company_id,
+                department=department,
+                employee_name=f"{first} {last}",
+                email_address=f"{first}.{last}{i}@example.com".lower(),
+                mobile_number=f"+20{rng.randint(100000000, 999999999)}",
+                address=(
+                    f"{rng.randint(1, 999)} {rng.choice(STREETS)}, {rng.choice(CITIES)}"
+                ),
+                designation=rng.choice(DESIGNATIONS),
+            ))
+            if len(batch) == 10000:
+                Employee.objects.bulk_create(batch)
+                batch = []
+        Employee.objects.bulk_create(batch)
+        self.stdout.write(
+            f"Inserted {rows:,} employees, index maintained by triggers, "
+            f"in {time.perf_counter() - started:.0f} s"
+        )
+
+    def _time(self, work, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = work()
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings), result
+
+    def _measure(self, repeat):
+        admin = User.objects.create_user(
+            username="bench", email="bench@example.com", password="bench", role="admin"
+        )
+        view = EmployeeViewSet.as_view({"get": "list"})
+        factory = APIRequestFactory()
+        company_id = Company.objects.order_by("id").values_list("id", flat=True)[0]
+        email = Employee.objects.order_by("id").values_list("email_address", flat=True)[
+            Employee.objects.count() // 2
+        ]
+
+        def endpoint(params):
+            request = factory.get("/api/employees/", params)
+            force_authenticate(request, user=admin)
+            return view(request)
+
+        def like(query):
+            condition = Q()
+            for column in SearchService.COLUMNS:
+                condition |= Q(**{f"{column}__icontains": query})
+            return list(
+                Employee.objects.filter(condition)
+                .order_by("-created_at", "-id")
+                .values_list("id", flat=True)[:100]
+            )
+
+        cases = [
+            ("rare name", {"q": "björn tanaka"}),
+            ("common name", {"q": "smith"}),
+            ("prefix", {"q": "moh"}),
+            ("phone digits", {"q": "20555"}),
+            ("email", {"q": email}),
+            ("with company", {"q": "engineer", "company": company_id}),
+        ]
+        # LIKE stops after the newest 100 hits, ?q= ranks every match
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"\n{'query':<14} {'matches':>9} {'?q= page':>12} {'LIKE %x%':>12}"
+        ))
+        for label, params in cases:
+            expression = SearchService.match_expression(params["q"])
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT count(*) FROM {SearchService.TABLE} "
+                    f"WHERE {SearchService.TABLE} MATCH %s",
+                    [expression],
+                )
+                matches = cursor.fetchone()[0]
+            search, response = self._time(lambda: endpoint(params), repeat)
+            assert response.status_code == 200, response.data
+            scan, _ = self._time(lambda: like(params["q"]), repeat)
+            self.stdout.write(
+                f"{label:<14} {matches:>9,} {search:>9.1f} ms {scan:>9.1f} ms"
+            )
@@ -0,0 +1,210 @@
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connection
+from django.test import override_settings
+
+from config.sqlite_pragmas import current_pragmas
+from core.management.benchmark import throwaway_database
+from core.models import Company, Department, Employee
+from core.services.transition_service import TransitionService
+
+from .benchmark_search import DESIGNATIONS, FIRST_NAMES, LAST_NAMES
+
+# Each writer moves its new hires through the workflow
+WORKFLOW = ["interview_scheduled", "hired"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Run concurrent writer threads (creating and transitioning employees) "
+        "and reader threads against a throwaway SQLite file per SQLITE_PROFILES "
+        "entry, reporting throughput, lock errors and lock-wait percentiles"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--profiles", default=",".join(settings.SQLITE_PROFILES),
+                            help="Comma-separated SQLITE_PROFILES names")
+        parser.add_argument("--writers", type=int, default=4)
+        parser.add_argument("--readers", type=int, default=8)
+        parser.add_argument("--seconds", type=float, default=10)
+        parser.add_argument("--rows", type=int, default=20000)
+
+    def handle(self, *args, **options):
+        if connection.vendor != "sqlite":
+            raise CommandError("benchmark_sqlite_profiles needs SQLite")
+        profiles = [name.strip() for name in options["profiles"].split(",")]
+        unknown = set(profiles) - set(settings.SQLITE_PROFILES)
+        if unknown:
+            raise CommandError(f"Unknown profiles: {', '.join(sorted(unknown))}")
+
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"{options['writers']} writers, {options['readers']} readers, "
+            f"{options['seconds']:g} s per profile, {options['rows']:,} employees\n"
+        ))
+        self.stdout.write(
+            f"{'profile':<12} {'writes/s':>9} {'reads/s':>9} {'locked':>7}"
+            f" {'wait p50':>9} {'p95':>8} {'p99':>8} {'max':>8} {'read p95':>9}"
+        )
+        for name in profiles:
+            self._run_profile(name, options)
+
+    def _run_profile(self, name, options):
+        # A file, not the in-memory test database: journaling and locking
+        # only behave as in production on disk
+        test_settings = connection.settings_dict.setdefault("TEST", {})
+        previous = test_settings.get("NAME")
+        directory = tempfile.mkdtemp(prefix="sqlite-profile-")
+        test_settings["NAME"] = os.path.join(directory, "benchmark.sqlite3")
+        try:
+            with override_settings(SQLITE_PROFILE=name), throwaway_database():
+                departments = self._populate(options["rows"])
+                pragmas = current_pragmas(connection)
+                baseline = self._uncontended_write(departments)
+                result = self._contend(departments, options)
+        finally:
+            test_settings["NAME"] = previous
+            os.rmdir(directory)
+        self._report(name, pragmas, baseline, result, options["seconds"])
+
+    def _populate(self, rows):
+        companies = Company.objects.bulk_create(
+            Company(company_name=f"Company {i}") for i in range(10)
+        )
+        departments = Department.objects.bulk_create(
+            Department(company=company, department_name=f"Department {i}")
+            for company in companies
+            for i in range(5)
+        )
+        rng = random.Random(42)
+        Employee.objects.bulk_create(
+            (self._employee(rng, rng.choice(departments), i) for i in range(rows)),
+            batch_size=5000,
+        )
+        return departments
+
+    def _employee(self, rng, department, i):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        return Employee(
+            company_id=department.company_id,
+            department=department,
+            employee_name=f"{first} {last}",
+            email_address=f"employee{i}@example.com",
+            mobile_number="+201234567890",
+            address="123 Test St",
+            designation=rng.choice(DESIGNATIONS),
+        )
+
+    def _write(self, rng, departments, i):
+        """One unit of writer work: hire a new employee through the workflow"""
+        employee = self._employee(rng, rng.choice(departments), i)
+        employee.save()
+        for new_status in WORKFLOW:
+            TransitionService.transition(
+                TransitionService.scope(ids=[employee.pk]),
+                new_status,
+                hired_on=employee.created_at.date(),
+            )
+
+    def _read(self, rng, departments):
+        department = rng.choice(departments)
+        list(
+            Employee.objects.select_related("company", "department")
+            .filter(department=department)
+            .order_by("-created_at", "-id")[:50]
+        )
+        Employee.objects.filter(employee_status="hired").count()
+
+    def _uncontended_write(self, departments):
+        """Median write time with no other threads, subtracted as non-wait time"""
+        rng = random.Random(0)
+        timings = []
+        for i in range(50):
+            started = time.perf_counter()
+            self._write(rng, departments, 1_000_000_000 + i)
+            timings.append(time.perf_counter() - started)
+        return statistics.median(timings)
+
+    def _contend(self, departments, options):
+        deadline = time.perf_counter() + options["seconds"]
+        start = threading.Barrier(options["writers"] + options["readers"])
+        lock = threading.Lock()
+        result = {"writes": [], "reads": [], "locked": 0}
+
+        def worker(seed, work):
+            rng = random.Random(seed)
+            timings, locked = [], 0
+            try:
+                start.wait()
+                i = 0
+                while time.perf_counter() < deadline:
+                    i += 1
+                    started = time.perf_counter()
+                    try:
+                        work(rng, i)
+                    except OperationalError as e:
+                        if "locked" not in str(e):
+                            raise
+                        locked += 1
+                        continue
+                    timings.append(time.perf_counter() - started)
+            finally:
+                # Each thread opened its own connection
+                connection.close()
+            with lock:
+                result["locked"] += locked
+            return timings
+
+        def writer(seed):
+            timings = worker(
+                seed, lambda rng, i: self._write(rng, departments, seed * 10_000_000 + i)
+            )
+            with lock:
+                result["writes"].extend(timings)
+
+        def reader(seed):
+            timings = worker(seed, lambda rng, i: self._read(rng, departments))
+            with lock:
+                result["reads"].extend(timings)
+
+        threads = [
+            threading.Thread(target=writer, args=(seed,))
+            for seed in range(1, options["writers"] + 1)
+        ] + [
+            threading.Thread(target=reader, args=(seed,))
+            for seed in range(1, options["readers"] + 1)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return result
+
+    def _report(self, name, pragmas, baseline, result, seconds):
+        writes, reads = result["writes"], sorted(result["reads"])
+        # Time a write spent beyond its uncontended cost is time spent
+        # waiting for the database lock
+        waits = sorted(max(0.0, timing - baseline) * 1000 for timing in writes)
+
+        def percentile(values, fraction):
+            if not values:
+                return float("nan")
+            return values[min(len(values) - 1, int(len(values) * fraction))]
+
+        self.stdout.write(
+            f"{name:<12} {len(writes) / seconds:>9.1f} {len(reads) / seconds:>9.1f}"
+            f" {result['locked']:>7}"
+            f" {percentile(waits, 0.5):>6.1f} ms {percentile(waits, 0.95):>5.1f} ms"
+            f" {percentile(waits, 0.99):>5.1f} ms {percentile(waits, 1):>5.0f} ms"
+            f" {percentile(reads, 0.95) * 1000:>6.1f} ms"
+        )
+        self.stdout.write(
+            f"{'':<12} uncontended write {baseline * 1000:.1f} ms; "
+            + ", ".join(f"{key}={value}" for key, value in pragmas.items())
+        )
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from core.models import Employee
+from core.services.search_service import SearchService
+
+
+class Command(BaseCommand):
+    help = (
+        "Recreate the employees_fts full-text index and its triggers and "
+        "reindex every employee"
+    )
+
+    def handle(self, *args, **options):
+        if not SearchService.available(connection):
+            raise CommandError(
+                f"Full-text search needs SQLite FTS5, not {connection.vendor}"
+            )
+        SearchService.rebuild(connection)
+        self.stdout.write(self.style.SUCCESS(
+            f"Search index rebuilt for {Employee.objects.count()} employees"
+        ))
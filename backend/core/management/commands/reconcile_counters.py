@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from core.services.counter_service import CounterService
+
+
+class Command(BaseCommand):
+    help = "Find and fix drift in the stored company/department counter columns"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows checked per batch (default: 1000)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report drifted rows without fixing them",
+        )
+
+    def handle(self, *args, **options):
+        fixed = CounterService.reconcile(
+            batch_size=options["batch_size"], dry_run=options["dry_run"]
+        )
+        verb = "Found" if options["dry_run"] else "Fixed"
+        for label, count in fixed.items():
+            self.stdout.write(f"{verb} {count} drifted {label}")
+        self.stdout.write(self.style.SUCCESS("Counter reconciliation complete"))
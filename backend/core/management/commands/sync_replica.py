@@ -0,0 +1,31 @@
+import sqlite3
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+
+class Command(BaseCommand):
+    help = (
+        "Copy the primary SQLite database into every DB_REPLICAS file, "
+        "standing in for replication when testing read routing locally"
+    )
+
+    def handle(self, *args, **options):
+        if not settings.DATABASE_REPLICAS:
+            raise CommandError("No replicas configured, set DB_REPLICAS")
+        primary = connections["default"]
+        if primary.vendor != "sqlite":
+            raise CommandError("sync_replica only copies SQLite databases")
+
+        primary.ensure_connection()
+        for alias in settings.DATABASE_REPLICAS:
+            connections[alias].close()
+            target = sqlite3.connect(connections[alias].settings_dict["NAME"])
+            try:
+                # The backup API takes a consistent snapshot while writers run
+                primary.connection.backup(target)
+            finally:
+                target.close()
+            self.stdout.write(f"Copied primary into {alias}")
+        self.stdout.write(self.style.SUCCESS("Replicas synced"))
@@ -0,0 +1,53 @@
+# Generated by Django 6.0 on 2026-10-17 02:23
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def _count(model, fk_name):
+    counts = (
+        model.objects.filter(**{fk_name: OuterRef("pk")})
+        .order_by()
+        .values(fk_name)
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    return Coalesce(Subquery(counts, output_field=models.IntegerField()), 0)
+
+
+def backfill_counters(apps, schema_editor):
+    Company = apps.get_model("core", "Company")
+    Department = apps.get_model("core", "Department")
+    Employee = apps.get_model("core", "Employee")
+    Company.objects.update(
+        departments_count=_count(Department, "company"),
+        employees_count=_count(Employee, "company"),
+    )
+    Department.objects.update(employees_count=_count(Employee, "department"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_alter_employee_department'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='departments_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='employees_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='department',
+            name='employees_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
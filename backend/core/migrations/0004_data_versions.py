@@ -0,0 +1,30 @@
+# Generated by Django 6.0 on 2026-10-17 02:27
+
+from django.db import migrations, models
+
+
+def seed_versions(apps, schema_editor):
+    DataVersion = apps.get_model("core", "DataVersion")
+    for key in ("core.company", "core.department", "core.employee"):
+        DataVersion.objects.get_or_create(key=key)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_company_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DataVersion',
+            fields=[
+                ('key', models.CharField(max_length=100, primary_key=True, serialize=False)),
+                ('version', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'data_versions',
+            },
+        ),
+        migrations.RunPython(seed_versions, migrations.RunPython.noop),
+    ]
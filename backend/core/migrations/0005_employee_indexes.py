@@ -0,0 +1,52 @@
+# Generated by Django 6.0 on 2026-10-17 02:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_data_versions'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='employee',
+            name='company',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='employees', to='core.company'),
+        ),
+        migrations.AlterField(
+            model_name='employee',
+            name='department',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='employees', to='core.department'),
+        ),
+        migrations.AddIndex(
+            model_name='department',
+            index=models.Index(fields=['department_name', 'id'], name='department_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(fields=['-created_at', '-id'], name='employee_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(fields=['company', '-created_at', '-id'], name='employee_company_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(fields=['company', 'employee_status', '-created_at', '-id'], name='employee_company_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(fields=['department', '-created_at', '-id'], name='employee_department_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(fields=['employee_status', '-created_at', '-id'], name='employee_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(condition=models.Q(('employee_status', 'hired')), fields=['-created_at', '-id'], name='employee_hired_idx'),
+        ),
+    ]
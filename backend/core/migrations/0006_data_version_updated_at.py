@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2026-10-17 02:41
+
+from django.db import migrations, models
+
+
+def seed_deletion_versions(apps, schema_editor):
+    DataVersion = apps.get_model("core", "DataVersion")
+    for key in ("core.company", "core.department", "core.employee"):
+        DataVersion.objects.get_or_create(key=f"{key}.deletions")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_employee_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dataversion',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunPython(seed_deletion_versions, migrations.RunPython.noop),
+    ]
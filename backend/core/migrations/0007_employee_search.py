@@ -0,0 +1,30 @@
+# Generated by Django 6.0 on 2026-10-17 03:20
+
+from django.db import migrations
+
+from core.services.search_service import SearchService
+
+
+def create_search_index(apps, schema_editor):
+    # FTS5 is SQLite only; elsewhere ?q= falls back to icontains filters
+    if not SearchService.available(schema_editor.connection):
+        return
+    SearchService.rebuild(schema_editor.connection)
+
+
+def drop_search_index(apps, schema_editor):
+    if not SearchService.available(schema_editor.connection):
+        return
+    for statement in SearchService.drop():
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_data_version_updated_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
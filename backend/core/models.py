@@ -1,20 +1,272 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, F, OuterRef, Prefetch, Subquery, Window
+from django.db.models.functions import Coalesce, Lower, RowNumber
 from django.core.validators import RegexValidator
 from django.core.exceptions import ValidationError
+from django.utils import timezone
 from datetime import date
 
 
-class Company(models.Model):
+def _count_subquery(model, fk_name):
+    """Correlated ``COUNT(*)`` of ``model`` rows pointing at the outer row"""
+    counts = (
+        model.objects.filter(**{fk_name: OuterRef("pk")})
+        .order_by()
+        .values(fk_name)
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    return Coalesce(Subquery(counts, output_field=models.IntegerField()), 0)
+
+
+class TrackLoadedValuesMixin:
+    """
+    Remember the column values an instance was loaded with, so changes can
+    be detected without a query and saves write only the changed columns
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def _reset_loaded_values(self):
+        self._loaded_values = {
+            field.attname: getattr(self, field.attname)
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__
+        }
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        """Reloaded columns become the new loaded values"""
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+        if fields is None or not hasattr(self, "_loaded_values"):
+            self._reset_loaded_values()
+            return
+        # Only the named columns were reloaded, others keep any pending change
+        for name in fields:
+            field = self._meta.get_field(name)
+            if field.concrete and field.attname in self.__dict__:
+                self._loaded_values[field.attname] = getattr(self, field.attname)
+
+    def get_dirty_fields(self):
+        """``{field name: loaded value}`` of fields changed since loading"""
+        loaded = getattr(self, "_loaded_values", None)
+        if loaded is None:
+            return {}
+        dirty = {}
+        for field in self._meta.concrete_fields:
+            if field.attname not in self.__dict__:
+                continue  # Deferred and never assigned
+            if field.attname not in loaded:
+                dirty[field.name] = None
+            elif getattr(self, field.attname) != loaded[field.attname]:
+                dirty[field.name] = loaded[field.attname]
+        return dirty
+
+    def save(self, *args, **kwargs):
+        """Default ``update_fields`` to the changed (and auto_now) columns"""
+        if (
+            kwargs.get("update_fields") is None
+            and not kwargs.get("force_insert")
+            and not self._state.adding
+            and hasattr(self, "_loaded_values")
+        ):
+            kwargs["update_fields"] = list(self.get_dirty_fields()) + [
+                field.name
+                for field in self._meta.concrete_fields
+                if getattr(field, "auto_now", False)
+            ]
+        super().save(*args, **kwargs)
+        self._reset_loaded_values()
+
+
+class DataVersion(models.Model):
+    """Per-model write counter used to key cached results"""
+
+    key = models.CharField(max_length=100, primary_key=True)
+    version = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "data_versions"
+
+    def __str__(self):
+        return f"{self.key}@{self.version}"
+
+    @staticmethod
+    def deletion_key(model):
+        """
+        Key bumped when ``model`` rows disappear or are rewritten by a
+        set-based UPDATE, the changes MAX(updated_at) and COUNT(*) can miss
+        """
+        return f"{model._meta.label_lower}.deletions"
+
+    @classmethod
+    def bump(cls, *keys):
+        """Increment the version of every key with an F-expression UPDATE"""
+        for key in keys:
+            changed = {"version": F("version") + 1, "updated_at": timezone.now()}
+            if cls.objects.filter(key=key).update(**changed):
+                continue
+            _, created = cls.objects.get_or_create(key=key, defaults={"version": 1})
+            if not created:
+                cls.objects.filter(key=key).update(**changed)
+
+    @classmethod
+    def current(cls, *keys):
+        """Versions of ``keys`` in order, read with a single query"""
+        return cls.snapshot(*keys)[0]
+
+    @classmethod
+    def snapshot(cls, *keys):
+        """Versions of ``keys`` in order and the latest time any of them moved"""
+        return cls._snapshot(keys, list(cls._snapshot_rows(keys)))
+
+    @classmethod
+    async def asnapshot(cls, *keys):
+        """``snapshot`` through the async ORM"""
+        return cls._snapshot(keys, [row async for row in cls._snapshot_rows(keys)])
+
+    @classmethod
+    def _snapshot_rows(cls, keys):
+        return cls.objects.filter(key__in=keys).values_list("key", "version", "updated_at")
+
+    @staticmethod
+    def _snapshot(keys, rows):
+        versions = {key: version for key, version, _ in rows}
+        changed_at = max((updated_at for _, _, updated_at in rows), default=None)
+        return tuple(versions.get(key, 0) for key in keys), changed_at
+
+
+class VersionedQuerySet(models.QuerySet):
+    """Bumps the model's DataVersion on bulk writes that skip signals"""
+
+    def bulk_create(self, objs, *args, **kwargs):
+        created = super().bulk_create(objs, *args, **kwargs)
+        if created:
+            DataVersion.bump(self.model._meta.label_lower)
+        return created
+
+    def update(self, **kwargs):
+        rows = super().update(**kwargs)
+        if rows:
+            DataVersion.bump(
+                self.model._meta.label_lower, DataVersion.deletion_key(self.model)
+            )
+        return rows
+
+
+class CompanyQuerySet(VersionedQuerySet):
+    def with_department_tree(self, depth=2, employees_limit=None):
+        """
+        Prefetch the detail tree in one query per level:
+        depth 1 adds departments, depth 2 also their employees
+        """
+        if depth < 1:
+            return self
+        departments = Department.objects.select_related("company").order_by(
+            "department_name", "id"
+        )
+        if depth >= 2:
+            departments = departments.with_employees(limit=employees_limit)
+        return self.prefetch_related(Prefetch("departments", queryset=departments))
+
+    def with_actual_counts(self):
+        """Annotate live department and employee counts for drift checks"""
+        return self.annotate(
+            actual_departments_count=_count_subquery(Department, "company"),
+            actual_employees_count=_count_subquery(Employee, "company"),
+        )
+
+
+class DepartmentQuerySet(VersionedQuerySet):
+    def with_employees(self, limit=None):
+        """
+        Prefetch each department's employees (newest first, at most
+        ``limit`` per department) with their company in one query
+        """
+        ordering = ("-created_at", "-id")
+        employees = Employee.objects.select_related("company").order_by(*ordering)
+        if limit is not None:
+            # A window filter rather than a slice, so the limit also holds
+            # when this prefetch is nested under the company's departments
+            employees = employees.annotate(
+                department_rank=Window(
+                    RowNumber(),
+                    partition_by=F("department_id"),
+                    order_by=[F(name[1:]).desc() for name in ordering],
+                )
+            ).filter(department_rank__lte=limit)
+        return self.prefetch_related(Prefetch("employees", queryset=employees))
+
+    def with_actual_counts(self):
+        """Annotate live employee count for drift checks"""
+        return self.annotate(
+            actual_employees_count=_count_subquery(Employee, "department")
+        )
+
+    def bulk_create(self, objs, *args, **kwargs):
+        from .services.counter_service import CounterService
+
+        with transaction.atomic(using=self.db):
+            created = super().bulk_create(objs, *args, **kwargs)
+            CounterService.departments_added(created)
+        return created
+
+    def update(self, **kwargs):
+        from .services.counter_service import CounterService
+
+        if "company" not in kwargs and "company_id" not in kwargs:
+            return super().update(**kwargs)
+        with transaction.atomic(using=self.db):
+            groups = CounterService.department_groups(self)
+            rows = super().update(**kwargs)
+            CounterService.departments_moved(groups, kwargs)
+        return rows
+
+
+class EmployeeQuerySet(VersionedQuerySet):
+    def bulk_create(self, objs, *args, **kwargs):
+        from .services.counter_service import CounterService
+
+        with transaction.atomic(using=self.db):
+            created = super().bulk_create(objs, *args, **kwargs)
+            CounterService.employees_added(created)
+        return created
+
+    def update(self, **kwargs):
+        from .services.counter_service import CounterService
+
+        if not CounterService.EMPLOYEE_RELATIONS.intersection(kwargs):
+            return super().update(**kwargs)
+        with transaction.atomic(using=self.db):
+            groups = CounterService.employee_groups(self)
+            rows = super().update(**kwargs)
+            CounterService.employees_moved(groups, kwargs)
+        return rows
+
+
+class Company(TrackLoadedValuesMixin, models.Model):
     """Company model with auto-calculated fields"""
 
     company_name = models.CharField(max_length=255, unique=True)
+    departments_count = models.IntegerField(default=0, editable=False)
+    employees_count = models.IntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = CompanyQuerySet.as_manager()
+
     class Meta:
         db_table = "companies"
         verbose_name_plural = "Companies"
         ordering = ["company_name"]
+        indexes = [
+            # Case-insensitive prefix lookups (/api/lookup/)
+            models.Index(Lower("company_name"), name="company_name_lower_idx"),
+        ]
 
     def __str__(self):
         return self.company_name
@@ -30,16 +282,24 @@ class Company(models.Model):
         return self.employees.count()
 
 
-class Department(models.Model):
+class Department(TrackLoadedValuesMixin, models.Model):
     """Department model linked to Company"""
 
     company = models.ForeignKey(
         Company, on_delete=models.CASCADE, related_name="departments"
     )
     department_name = models.CharField(max_length=255)
+    employees_count = models.IntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = DepartmentQuerySet.as_manager()
+
+    def save(self, *args, **kwargs):
+        """Save the row and its company counters in one transaction"""
+        with transaction.atomic(using=kwargs.get("using")):
+            super().save(*args, **kwargs)
+
     def delete(self, *args, **kwargs):
         """Prevent deletion if department has employees"""
         if self.number_of_employees > 0:
@@ -52,6 +312,12 @@ class Department(models.Model):
         db_table = "departments"
         unique_together = ["company", "department_name"]
         ordering = ["company", "department_name"]
+        indexes = [
+            # Keyset pagination of the department list
+            models.Index(fields=["department_name", "id"], name="department_name_idx"),
+            # Case-insensitive prefix lookups (/api/lookup/)
+            models.Index(Lower("department_name"), name="department_name_lower_idx"),
+        ]
 
     def __str__(self):
         return f"{self.department_name} - {self.company.company_name}"
@@ -62,7 +328,7 @@ class Department(models.Model):
         return self.employees.count()
 
 
-class Employee(models.Model):
+class Employee(TrackLoadedValuesMixin, models.Model):
     """Employee model with workflow status"""
 
     STATUS_CHOICES = [
@@ -72,13 +338,20 @@ class Employee(models.Model):
         ("not_accepted", "Not Accepted"),
     ]
 
+    VALID_TRANSITIONS = {
+        "application_received": ["interview_scheduled", "not_accepted"],
+        "interview_scheduled": ["hired", "not_accepted"],
+        "hired": ["hired"],  # Can stay hired
+        "not_accepted": ["not_accepted"],  # Terminal state
+    }
+
     phone_regex = RegexValidator(
         regex=r"^\+?1?\d{9,15}$",
         message="Phone number must be entered in the format: '+999999999'. Up to 15 digits allowed.",
     )
 
     company = models.ForeignKey(
-        Company, on_delete=models.CASCADE, related_name="employees"
+        Company, on_delete=models.CASCADE, related_name="employees", db_index=False
     )
     department = models.ForeignKey(
         Department,
@@ -86,6 +359,7 @@ class Employee(models.Model):
         null=True,
         blank=True,
         related_name="employees",
+        db_index=False,
     )
     employee_status = models.CharField(
         max_length=30, choices=STATUS_CHOICES, default="application_received"
@@ -99,9 +373,40 @@ class Employee(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = EmployeeQuerySet.as_manager()
+
     class Meta:
         db_table = "employees"
         ordering = ["-created_at"]
+        # Every list filter is followed by the (-created_at, -id) keyset
+        # ordering, so each index ends with it to avoid a sort step. The
+        # company/department composites also serve the foreign key lookups.
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="employee_created_idx"),
+            models.Index(
+                fields=["company", "-created_at", "-id"],
+                name="employee_company_idx",
+            ),
+            models.Index(
+                fields=["company", "employee_status", "-created_at", "-id"],
+                name="employee_company_status_idx",
+            ),
+            models.Index(
+                fields=["department", "-created_at", "-id"],
+                name="employee_department_idx",
+            ),
+            models.Index(
+                fields=["employee_status", "-created_at", "-id"],
+                name="employee_status_idx",
+            ),
+            models.Index(
+                fields=["-created_at", "-id"],
+                condition=models.Q(employee_status="hired"),
+                name="employee_hired_idx",
+            ),
+            # Case-insensitive prefix lookups (/api/lookup/)
+            models.Index(Lower("employee_name"), name="employee_name_lower_idx"),
+        ]
 
     def __str__(self):
         return f"{self.employee_name} - {self.company.company_name}"
@@ -118,7 +423,22 @@ class Employee(models.Model):
         """Validate department belongs to selected company"""
         super().clean()
 
-        if self.department and self.department.company != self.company:
+        # A loaded pairing was already checked; skip it only when both keys
+        # still hold the values they were loaded with
+        loaded = getattr(self, "_loaded_values", None)
+        relations_unchanged = (
+            not self._state.adding
+            and loaded is not None
+            and all(
+                name in loaded and loaded[name] == getattr(self, name)
+                for name in ("company_id", "department_id")
+            )
+        )
+        if (
+            not relations_unchanged
+            and self.department
+            and self.department.company_id != self.company_id
+        ):
             raise ValidationError(
                 {"department": "Department must belong to the selected company."}
             )
@@ -131,29 +451,48 @@ class Employee(models.Model):
 
         # Validate workflow transitions
         if self.pk:  # Only validate on update
-            old_instance = Employee.objects.get(pk=self.pk)
-            if self.employee_status != old_instance.employee_status:
-                if not self._is_valid_transition(
-                    old_instance.employee_status, self.employee_status
-                ):
+            old_status = self._loaded_status()
+            if self.employee_status != old_status:
+                if not self._is_valid_transition(old_status, self.employee_status):
                     raise ValidationError(
                         {
-                            "employee_status": f"Invalid transition from {old_instance.employee_status} to {self.employee_status}"
+                            "employee_status": f"Invalid transition from {old_status} to {self.employee_status}"
                         }
                     )
 
+    def _loaded_status(self):
+        """Status the row had when loaded, queried only if it wasn't loaded"""
+        loaded = getattr(self, "_loaded_values", {})
+        if "employee_status" in loaded:
+            return loaded["employee_status"]
+        return (
+            Employee.objects.filter(pk=self.pk)
+            .values_list("employee_status", flat=True)
+            .first()
+        )
+
     def _is_valid_transition(self, old_status, new_status):
         """Validate workflow transitions"""
-        valid_transitions = {
-            "application_received": ["interview_scheduled", "not_accepted"],
-            "interview_scheduled": ["hired", "not_accepted"],
-            "hired": ["hired"],  # Can stay hired
-            "not_accepted": ["not_accepted"],  # Terminal state
-        }
+        return new_status in self.VALID_TRANSITIONS.get(old_status, [])
 
-        return new_status in valid_transitions.get(old_status, [])
+    @classmethod
+    def transition_sources(cls, new_status):
+        """Statuses that may move to ``new_status`` (excluding itself)"""
+        return [
+            old_status
+            for old_status, targets in cls.VALID_TRANSITIONS.items()
+            if new_status in targets and old_status != new_status
+        ]
 
     def save(self, *args, **kwargs):
         """Override save to call full_clean"""
-        self.full_clean()
-        super().save(*args, **kwargs)
+        # Unchanged relations were valid when loaded, skip their lookups
+        dirty = self.get_dirty_fields()
+        exclude = [
+            field.name
+            for field in self._meta.concrete_fields
+            if field.is_relation and not self._state.adding and field.name not in dirty
+        ]
+        self.full_clean(exclude=exclude)
+        with transaction.atomic(using=kwargs.get("using")):
+            super().save(*args, **kwargs)
@@ -1,7 +1,47 @@
 from rest_framework import serializers
+from rest_framework.reverse import reverse
 from .models import Company, Department, Employee
 
 
+class CompanyRefSerializer(serializers.ModelSerializer):
+    """Company reference nested by ?expand=company"""
+
+    class Meta:
+        model = Company
+        fields = ["id", "company_name"]
+
+
+class DepartmentRefSerializer(serializers.ModelSerializer):
+    """Department reference nested by ?expand=department"""
+
+    class Meta:
+        model = Department
+        fields = ["id", "department_name"]
+
+
+class SparseFieldsMixin:
+    """
+    Trim a root serializer to ``context["fields"]`` and nest the relations in
+    ``context["expand"]`` with their ``expandable`` Ref serializer
+    """
+
+    expandable = {}
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if self.root is not self:
+            return fields
+        expand = self.context.get("expand", ())
+        for name in expand:
+            fields[name] = self.expandable[name](read_only=True)
+        selected = self.context.get("fields")
+        if selected is not None:
+            for name in list(fields):
+                if name not in selected and name not in expand:
+                    fields.pop(name)
+        return fields
+
+
 class SampleDataEmployeeSerializer(serializers.ModelSerializer):
     """Serializer for Employee model with all validations"""
 
@@ -30,7 +70,9 @@ class SampleDataEmployeeSerializer(serializers.ModelSerializer):
 class DepartmentSerializer(serializers.ModelSerializer):
     """Serializer for Department model"""
 
-    number_of_employees = serializers.IntegerField(read_only=True)
+    number_of_employees = serializers.IntegerField(
+        source="employees_count", read_only=True
+    )
     company_name = serializers.CharField(source="company.company_name", read_only=True)
 
     class Meta:
@@ -47,11 +89,27 @@ class DepartmentSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "created_at", "updated_at"]
 
 
-class DepartmentDetailsSerializer(serializers.ModelSerializer):
+class DepartmentDetailsSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for Department model"""
 
-    number_of_employees = serializers.IntegerField(read_only=True)
+    expandable = {"company": CompanyRefSerializer}
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self.context.get("include_employees", True):
+            fields.pop("employees", None)
+        return fields
+
+    def get_employees_url(self, obj):
+        return reverse(
+            "department-employees", args=[obj.pk], request=self.context.get("request")
+        )
+
+    number_of_employees = serializers.IntegerField(
+        source="employees_count", read_only=True
+    )
     company_name = serializers.CharField(source="company.company_name", read_only=True)
+    employees_url = serializers.SerializerMethodField()
     employees = SampleDataEmployeeSerializer(many=True, read_only=True)
 
     class Meta:
@@ -62,6 +120,7 @@ class DepartmentDetailsSerializer(serializers.ModelSerializer):
             "company_name",
             "department_name",
             "number_of_employees",
+            "employees_url",
             "employees",
             "created_at",
             "updated_at",
@@ -72,8 +131,12 @@ class DepartmentDetailsSerializer(serializers.ModelSerializer):
 class CompanySerializer(serializers.ModelSerializer):
     """Serializer for Company model with auto-calculated fields"""
 
-    number_of_departments = serializers.IntegerField(read_only=True)
-    number_of_employees = serializers.IntegerField(read_only=True)
+    number_of_departments = serializers.IntegerField(
+        source="departments_count", read_only=True
+    )
+    number_of_employees = serializers.IntegerField(
+        source="employees_count", read_only=True
+    )
 
     class Meta:
         model = Company
@@ -87,11 +150,27 @@ class CompanySerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "created_at", "updated_at"]
 
-class CompanyDetailsSerializer(serializers.ModelSerializer):
+class CompanyDetailsSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for Company model with auto-calculated fields"""
 
-    number_of_departments = serializers.IntegerField(read_only=True)
-    number_of_employees = serializers.IntegerField(read_only=True)
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self.context.get("include_departments", True):
+            fields.pop("departments", None)
+        return fields
+
+    def get_employees_url(self, obj):
+        return reverse(
+            "company-employees", args=[obj.pk], request=self.context.get("request")
+        )
+
+    number_of_departments = serializers.IntegerField(
+        source="departments_count", read_only=True
+    )
+    number_of_employees = serializers.IntegerField(
+        source="employees_count", read_only=True
+    )
+    employees_url = serializers.SerializerMethodField()
     departments = DepartmentDetailsSerializer(many=True, read_only=True)
 
     class Meta:
@@ -102,15 +181,18 @@ class CompanyDetailsSerializer(serializers.ModelSerializer):
             "number_of_departments",
             "departments",
             "number_of_employees",
+            "employees_url",
             "created_at",
             "updated_at",
         ]
         read_only_fields = ["id", "created_at", "updated_at"]
 
 
-class EmployeeSerializer(serializers.ModelSerializer):
+class EmployeeSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for Employee model with all validations"""
 
+    expandable = {"company": CompanyRefSerializer, "department": DepartmentRefSerializer}
+
     days_employed = serializers.IntegerField(read_only=True)
     company_name = serializers.CharField(source="company.company_name", read_only=True)
     department_name = serializers.CharField(
@@ -145,7 +227,7 @@ class EmployeeSerializer(serializers.ModelSerializer):
             company = data.get(
                 "company", self.instance.company if self.instance else None
             )
-            if company and data["department"].company != company:
+            if company and data["department"].company_id != company.pk:
                 raise serializers.ValidationError(
                     {"department": "Department must belong to the selected company."}
                 )
@@ -187,6 +269,91 @@ class EmployeeSerializer(serializers.ModelSerializer):
         return data
 
 
+class EmployeeImportSerializer(serializers.ModelSerializer):
+    """
+    Row serializer for bulk imports.
+    Relations are plain ids checked against the ``companies`` /
+    ``departments`` maps preloaded into the context, so validating a row
+    never touches the database.
+    """
+
+    company = serializers.IntegerField()
+    department = serializers.IntegerField(required=False, allow_null=True)
+
+    class Meta:
+        model = Employee
+        fields = [
+            "company",
+            "department",
+            "employee_status",
+            "employee_name",
+            "email_address",
+            "mobile_number",
+            "address",
+            "designation",
+            "hired_on",
+        ]
+
+    def validate(self, data):
+        companies = self.context["companies"]
+        departments = self.context["departments"]
+
+        if data["company"] not in companies:
+            raise serializers.ValidationError({"company": "Company not found."})
+
+        department = data.get("department")
+        if department is not None:
+            if department not in departments:
+                raise serializers.ValidationError(
+                    {"department": "Department not found."}
+                )
+            if departments[department] != data["company"]:
+                raise serializers.ValidationError(
+                    {"department": "Department must belong to the selected company."}
+                )
+
+        if data.get("employee_status") == "hired" and not data.get("hired_on"):
+            raise serializers.ValidationError(
+                {"hired_on": "Hired date is required for hired employees."}
+            )
+
+        return data
+
+
+class EmployeeFilterSerializer(serializers.Serializer):
+    """Same filters as the employee list"""
+
+    company = serializers.IntegerField(required=False)
+    department = serializers.IntegerField(required=False)
+    status = serializers.ChoiceField(choices=Employee.STATUS_CHOICES, required=False)
+
+
+class EmployeeTransitionSerializer(serializers.Serializer):
+    """Request body of the bulk workflow transition"""
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(), required=False, allow_empty=False
+    )
+    filter = EmployeeFilterSerializer(required=False)
+    employee_status = serializers.ChoiceField(choices=Employee.STATUS_CHOICES)
+    hired_on = serializers.DateField(required=False)
+
+    def validate(self, data):
+        if ("ids" in data) == ("filter" in data):
+            raise serializers.ValidationError(
+                {"non_field_errors": ["Provide either ids or filter."]}
+            )
+        if "filter" in data and not data["filter"]:
+            raise serializers.ValidationError(
+                {"filter": "At least one filter is required."}
+            )
+        if data["employee_status"] == "hired" and not data.get("hired_on"):
+            raise serializers.ValidationError(
+                {"hired_on": "Hired date is required for hired employees."}
+            )
+        return data
+
+
 class EmployeeReportSerializer(serializers.ModelSerializer):
     company_name = serializers.CharField(source="company.company_name")
     department_name = serializers.SerializerMethodField()
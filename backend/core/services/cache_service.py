@@ -0,0 +1,97 @@
+import threading
+from urllib.parse import urlencode
+
+from django.core.cache import caches
+
+from ..models import DataVersion
+
+
+class VersionedCache:
+    """
+    Cache results under the current DataVersion of the models they read.
+    Writes bump the version in the shared database, so every worker process
+    stops using older entries as soon as the write commits.
+    """
+
+    def __init__(self, prefix, models, timeout=300, alias="default"):
+        self.prefix = prefix
+        self.keys = tuple(model._meta.label_lower for model in models)
+        self.timeout = timeout
+        self.alias = alias
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    def version(self):
+        return DataVersion.current(*self.keys)
+
+    def snapshot(self):
+        return DataVersion.snapshot(*self.keys)
+
+    async def asnapshot(self):
+        return await DataVersion.asnapshot(*self.keys)
+
+    def make_key(self, version, params=None):
+        version = ".".join(str(part) for part in version)
+        query = urlencode(sorted((params or {}).items()))
+        return f"{self.prefix}:{version}:{query}"
+
+    def get(self, params=None, version=None):
+        """Cached value for ``params``, or ``None`` on a miss"""
+        value = self.backend.get(self.make_key(version or self.version(), params))
+        self._record(hit=value is not None)
+        return value
+
+    def set(self, value, params=None, version=None):
+        """
+        Store ``value`` for ``params``. Pass the ``version`` read before
+        computing it, so a write racing the computation orphans the entry.
+        """
+        key = self.make_key(version or self.version(), params)
+        self.backend.set(key, value, self.timeout)
+
+    def get_or_set(self, compute, params=None, version=None):
+        """
+        Return the cached value for ``params`` or store ``compute()``.
+        Pass ``version`` when the caller has already read it.
+        """
+        version = version or self.version()
+        value = self.get(params, version)
+        if value is None:
+            value = compute()
+            self.set(value, params, version)
+        return value
+
+    async def aget_or_set(self, compute, params=None, version=None):
+        """``get_or_set`` with a coroutine function ``compute``"""
+        version = version or (await self.asnapshot())[0]
+        key = self.make_key(version, params)
+        value = await self.backend.aget(key)
+        self._record(hit=value is not None)
+        if value is None:
+            value = await compute()
+            await self.backend.aset(key, value, self.timeout)
+        return value
+
+    def _record(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self):
+        """Hit/miss counters of this worker process"""
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / total, 4) if total else None,
+            "version": self.version(),
+        }
@@ -0,0 +1,67 @@
+import hashlib
+
+from django.db.models import Count, Max
+
+from ..models import DataVersion
+
+
+class ConditionalService:
+
+    # Aggregates of the payload's own rows
+    STATE = {"last_modified": Max("updated_at"), "count": Count("pk")}
+
+    @staticmethod
+    def validators(queryset=None, related=(), extra="", snapshot=None):
+        """
+        ETag and Last-Modified (a POSIX timestamp) of a payload built from
+        ``queryset`` and the ``related`` models it also reads.
+
+        ``queryset`` contributes MAX(updated_at), its row count and its
+        model's deletion version; ``related`` models contribute their write
+        and deletion versions. ``extra`` covers anything else the payload varies on,
+        such as the query string or the negotiated format. ``snapshot`` is the
+        ``DataVersion.snapshot`` of those keys if the caller already read it.
+        """
+        state = None
+        if queryset is not None:
+            state = queryset.order_by().aggregate(**ConditionalService.STATE)
+        if snapshot is None:
+            snapshot = DataVersion.snapshot(*ConditionalService._keys(queryset, related))
+        return ConditionalService._validators(extra, state, snapshot)
+
+    @staticmethod
+    async def avalidators(queryset=None, related=(), extra="", snapshot=None):
+        """``validators`` through the async ORM"""
+        state = None
+        if queryset is not None:
+            state = await queryset.order_by().aaggregate(**ConditionalService.STATE)
+        if snapshot is None:
+            snapshot = await DataVersion.asnapshot(
+                *ConditionalService._keys(queryset, related)
+            )
+        return ConditionalService._validators(extra, state, snapshot)
+
+    @staticmethod
+    def _keys(queryset, related):
+        keys = [] if queryset is None else [DataVersion.deletion_key(queryset.model)]
+        # Counter updates of related rows only bump their deletion version
+        for model in related:
+            keys += [model._meta.label_lower, DataVersion.deletion_key(model)]
+        return keys
+
+    @staticmethod
+    def _validators(extra, state, snapshot):
+        parts = [extra]
+        last_modified = None
+        if state is not None:
+            last_modified = state["last_modified"]
+            parts += [state["count"], last_modified]
+
+        versions, changed_at = snapshot
+        parts.append(versions)
+        if changed_at is not None and (last_modified is None or changed_at > last_modified):
+            last_modified = changed_at
+
+        etag = '"%s"' % hashlib.md5(repr(parts).encode()).hexdigest()
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        return etag, timestamp
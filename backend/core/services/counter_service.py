@@ -0,0 +1,177 @@
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Count, F, Q
+
+from ..models import Company, DataVersion, Department, Employee, _count_subquery
+
+
+class CounterService:
+    """Keeps the denormalized ``*_count`` columns in step with their rows"""
+
+    EMPLOYEE_RELATIONS = {"company", "company_id", "department", "department_id"}
+
+    @staticmethod
+    def _apply(model, field, deltas):
+        """Apply ``{pk: delta}`` to ``field`` with one F-expression UPDATE per row"""
+        changed = False
+        for pk, delta in deltas.items():
+            if pk is None or not delta:
+                continue
+            # _base_manager skips the relation-tracking update() overrides
+            changed |= bool(
+                model._base_manager.filter(pk=pk).update(**{field: F(field) + delta})
+            )
+        if changed:
+            # Counter rows keep their updated_at, so signal the change to
+            # conditional GETs through the deletion version instead
+            DataVersion.bump(DataVersion.deletion_key(model))
+
+    @staticmethod
+    def _related_id(kwargs, name, default):
+        """Resolve the new id for ``name`` from ``update()`` kwargs"""
+        if name in kwargs:
+            value = kwargs[name]
+            return getattr(value, "pk", value)
+        if f"{name}_id" in kwargs:
+            return kwargs[f"{name}_id"]
+        return default
+
+    # Employees
+
+    @staticmethod
+    def employee_added(company_id, department_id, delta=1):
+        CounterService._apply(Company, "employees_count", {company_id: delta})
+        CounterService._apply(Department, "employees_count", {department_id: delta})
+
+    @staticmethod
+    def employee_moved(old, new):
+        """``old``/``new`` are ``(company_id, department_id)`` tuples"""
+        if old == new:
+            return
+        CounterService.employee_added(*old, delta=-1)
+        CounterService.employee_added(*new, delta=1)
+
+    @staticmethod
+    def employees_added(employees, delta=1):
+        companies = Counter(employee.company_id for employee in employees)
+        departments = Counter(employee.department_id for employee in employees)
+        CounterService._apply(
+            Company, "employees_count", {pk: n * delta for pk, n in companies.items()}
+        )
+        CounterService._apply(
+            Department,
+            "employees_count",
+            {pk: n * delta for pk, n in departments.items()},
+        )
+
+    @staticmethod
+    def employee_groups(queryset):
+        """Row counts of ``queryset`` grouped by company and department"""
+        return list(
+            queryset.order_by()
+            .values_list("company_id", "department_id")
+            .annotate(total=Count("pk"))
+        )
+
+    @staticmethod
+    def employees_moved(groups, kwargs):
+        companies = Counter()
+        departments = Counter()
+        for company_id, department_id, total in groups:
+            new_company_id = CounterService._related_id(kwargs, "company", company_id)
+            new_department_id = CounterService._related_id(
+                kwargs, "department", department_id
+            )
+            companies[company_id] -= total
+            companies[new_company_id] += total
+            departments[department_id] -= total
+            departments[new_department_id] += total
+        CounterService._apply(Company, "employees_count", companies)
+        CounterService._apply(Department, "employees_count", departments)
+
+    # Departments
+
+    @staticmethod
+    def department_added(company_id, delta=1):
+        CounterService._apply(Company, "departments_count", {company_id: delta})
+
+    @staticmethod
+    def departments_added(departments):
+        companies = Counter(department.company_id for department in departments)
+        CounterService._apply(Company, "departments_count", companies)
+
+    @staticmethod
+    def department_groups(queryset):
+        """Row counts of ``queryset`` grouped by company"""
+        return list(
+            queryset.order_by()
+            .values_list("company_id")
+            .annotate(total=Count("pk"))
+        )
+
+    @staticmethod
+    def departments_moved(groups, kwargs):
+        companies = Counter()
+        for company_id, total in groups:
+            companies[company_id] -= total
+            companies[CounterService._related_id(kwargs, "company", company_id)] += total
+        CounterService._apply(Company, "departments_count", companies)
+
+    # Reconciliation
+
+    @staticmethod
+    def _drifted(queryset, pairs):
+        drift = Q()
+        for stored, actual in pairs:
+            drift |= ~Q(**{stored: F(actual)})
+        return queryset.filter(drift)
+
+    @staticmethod
+    def reconcile(batch_size=1000, dry_run=False):
+        """
+        Recompute counters for rows whose stored value drifted from the live
+        count, walking each table in primary-key batches.
+        Returns ``{"companies": n, "departments": n}`` of drifted rows.
+        """
+        targets = [
+            (
+                "companies",
+                Company,
+                Company.objects.with_actual_counts(),
+                {
+                    "departments_count": _count_subquery(Department, "company"),
+                    "employees_count": _count_subquery(Employee, "company"),
+                },
+            ),
+            (
+                "departments",
+                Department,
+                Department.objects.with_actual_counts(),
+                {"employees_count": _count_subquery(Employee, "department")},
+            ),
+        ]
+        fixed = {}
+        for label, model, queryset, columns in targets:
+            pairs = [(column, f"actual_{column}") for column in columns]
+            fixed[label] = 0
+            last_pk = 0
+            while True:
+                batch = list(
+                    queryset.filter(pk__gt=last_pk)
+                    .order_by("pk")
+                    .values_list("pk", flat=True)[:batch_size]
+                )
+                if not batch:
+                    break
+                last_pk = batch[-1]
+                drifted = list(
+                    CounterService._drifted(
+                        queryset.filter(pk__in=batch), pairs
+                    ).values_list("pk", flat=True)
+                )
+                fixed[label] += len(drifted)
+                if drifted and not dry_run:
+                    with transaction.atomic():
+                        model._base_manager.filter(pk__in=drifted).update(**columns)
+        return fixed
@@ -1,22 +1,139 @@
+from django.conf import settings
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+
 from ..models import Company, Department, Employee
+from .cache_service import VersionedCache
 
 
 class DashboardService:
 
+    cache = VersionedCache(
+        "dashboard",
+        [Company, Department, Employee],
+        timeout=getattr(settings, "DASHBOARD_CACHE_TIMEOUT", 300),
+    )
+
+    # employee_status -> summary key
+    STATUS_TOTALS = {
+        "hired": "hired_employees",
+        "application_received": "pending_applications",
+        "interview_scheduled": "scheduled_interviews",
+        "not_accepted": "not_selected_employees",
+    }
+
+    BREAKDOWNS = ("company",)
+
+    @staticmethod
+    def _status_counts(prefix="", scope=None):
+        """Conditional ``COUNT`` aggregates for the total and every status"""
+        scope = scope or Q()
+        counts = {"total_employees": Count(f"{prefix}pk", filter=scope or None)}
+        for status, key in DashboardService.STATUS_TOTALS.items():
+            counts[key] = Count(
+                f"{prefix}pk",
+                filter=scope & Q(**{f"{prefix}employee_status": status}),
+            )
+        return counts
+
+    @staticmethod
+    def get_summary(company=None, department=None, breakdown=None):
+        """
+        Summary counts in a constant number of queries: one for
+        companies/departments, one conditional aggregation over employees and
+        one ``GROUP BY`` when ``breakdown="company"``.
+        """
+        summary = {}
+        for queryset, aggregates in DashboardService._summary_queries(company, department):
+            summary.update(queryset.aggregate(**aggregates))
+        if breakdown == "company":
+            summary["breakdown"] = DashboardService.get_company_breakdown(
+                company=company, department=department
+            )
+        return summary
+
+    @staticmethod
+    async def aget_summary(company=None, department=None, breakdown=None):
+        """``get_summary`` through the async ORM"""
+        summary = {}
+        for queryset, aggregates in DashboardService._summary_queries(company, department):
+            summary.update(await queryset.aaggregate(**aggregates))
+        if breakdown == "company":
+            rows = DashboardService._breakdown_rows(company, department)
+            summary["breakdown"] = [
+                DashboardService._breakdown_row(row) async for row in rows
+            ]
+        return summary
+
+    @staticmethod
+    def _summary_queries(company, department):
+        """The (queryset, aggregates) pairs behind the summary totals"""
+        employees = Employee.objects.all()
+        if company:
+            employees = employees.filter(company_id=company)
+        if department:
+            employees = employees.filter(department_id=department)
+
+        if department:
+            scope = Department.objects.filter(pk=department)
+            if company:
+                scope = scope.filter(company_id=company)
+            totals = {
+                "total_companies": Count("company", distinct=True),
+                "total_departments": Count("pk"),
+            }
+        else:
+            scope = Company.objects.all()
+            if company:
+                scope = scope.filter(pk=company)
+            totals = {
+                "total_companies": Count("pk"),
+                "total_departments": Coalesce(Sum("departments_count"), 0),
+            }
+        return [(scope, totals), (employees, DashboardService._status_counts())]
+
+    @staticmethod
+    def get_cached_summary(company=None, department=None, breakdown=None, version=None):
+        """``get_summary`` served from the versioned cache"""
+        params = {"company": company, "department": department, "breakdown": breakdown}
+        return DashboardService.cache.get_or_set(
+            lambda: DashboardService.get_summary(**params),
+            params={key: value for key, value in params.items() if value},
+            version=version,
+        )
+
+    @staticmethod
+    async def aget_cached_summary(company=None, department=None, breakdown=None, version=None):
+        """``aget_summary`` served from the versioned cache"""
+        params = {"company": company, "department": department, "breakdown": breakdown}
+        return await DashboardService.cache.aget_or_set(
+            lambda: DashboardService.aget_summary(**params),
+            params={key: value for key, value in params.items() if value},
+            version=version,
+        )
+
+    @staticmethod
+    def get_company_breakdown(company=None, department=None):
+        """Per-company status counts from a single ``GROUP BY`` query"""
+        rows = DashboardService._breakdown_rows(company, department)
+        return [DashboardService._breakdown_row(row) for row in rows]
+
+    @staticmethod
+    def _breakdown_rows(company, department):
+        companies = Company.objects.all()
+        if company:
+            companies = companies.filter(pk=company)
+        scope = None
+        if department:
+            companies = companies.filter(departments__pk=department)
+            scope = Q(employees__department_id=department)
+        counts = DashboardService._status_counts(prefix="employees__", scope=scope)
+        return (
+            companies.order_by("company_name")
+            .values("id", "company_name")
+            .annotate(**counts)
+        )
+
     @staticmethod
-    def get_summary():
-        return {
-            "total_companies": Company.objects.count(),
-            "total_departments": Department.objects.count(),
-            "total_employees": Employee.objects.count(),
-            "hired_employees": Employee.objects.filter(employee_status="hired").count(),
-            "pending_applications": Employee.objects.filter(
-                employee_status="application_received"
-            ).count(),
-            "scheduled_interviews": Employee.objects.filter(
-                employee_status="interview_scheduled"
-            ).count(),
-            "not_selected_employees": Employee.objects.filter(
-                employee_status="not_accepted"
-            ).count(),
-        }
+    def _breakdown_row(row):
+        return {"company_id": row.pop("id"), **row}
@@ -0,0 +1,99 @@
+import csv
+import io
+
+from django.conf import settings
+from django.db import transaction
+from rest_framework import serializers
+
+from ..models import Company, Department, Employee
+from ..serializers import EmployeeImportSerializer
+
+
+class EmployeeImportService:
+
+    MODES = ("atomic", "partial")
+
+    @staticmethod
+    def parse_csv(upload):
+        """Rows of an uploaded CSV file, blank cells read as missing"""
+        text = io.TextIOWrapper(upload, encoding="utf-8-sig")
+        return [
+            {key: value for key, value in row.items() if value not in ("", None)}
+            for row in csv.DictReader(text)
+        ]
+
+    @staticmethod
+    def _ids(rows, key):
+        ids = set()
+        for row in rows:
+            if not isinstance(row, dict):
+                continue  # Reported per row by validate()
+            try:
+                ids.add(int(row.get(key)))
+            except (TypeError, ValueError):
+                continue
+        return ids
+
+    @staticmethod
+    def validate(rows):
+        """
+        Validate every row against company/department maps loaded with two
+        queries. Returns ``(valid, errors)``: ``valid`` holds
+        ``(row_number, data)`` pairs and ``errors`` the per-row messages.
+        """
+        companies = set(
+            Company.objects.filter(
+                pk__in=EmployeeImportService._ids(rows, "company")
+            ).values_list("pk", flat=True)
+        )
+        departments = dict(
+            Department.objects.filter(
+                pk__in=EmployeeImportService._ids(rows, "department")
+            ).values_list("pk", "company_id")
+        )
+        serializer = EmployeeImportSerializer(
+            context={"companies": companies, "departments": departments}
+        )
+
+        valid, errors = [], []
+        for number, row in enumerate(rows, start=1):
+            if not isinstance(row, dict):
+                errors.append(
+                    {"row": number, "errors": {"non_field_errors": ["Expected an object."]}}
+                )
+                continue
+            try:
+                valid.append((number, serializer.run_validation(row)))
+            except serializers.ValidationError as e:
+                errors.append({"row": number, "errors": e.detail})
+        return valid, errors
+
+    @staticmethod
+    def _build(data):
+        data = dict(data)
+        data["company_id"] = data.pop("company")
+        data["department_id"] = data.pop("department", None)
+        return Employee(**data)
+
+    @staticmethod
+    def import_rows(rows, mode="atomic", batch_size=None):
+        """
+        Validate ``rows`` together and insert the valid ones with
+        ``bulk_create``. In ``atomic`` mode any invalid row rejects the whole
+        import; in ``partial`` mode valid rows are inserted regardless.
+        """
+        batch_size = batch_size or settings.EMPLOYEE_IMPORT_BATCH_SIZE
+        valid, errors = EmployeeImportService.validate(rows)
+
+        created = []
+        if valid and not (errors and mode == "atomic"):
+            employees = [EmployeeImportService._build(data) for _, data in valid]
+            with transaction.atomic():
+                created = Employee.objects.bulk_create(employees, batch_size=batch_size)
+
+        return {
+            "created": len(created),
+            "failed": len(errors),
+            "ids": [employee.pk for employee in created],
+            "errors": errors,
+        }
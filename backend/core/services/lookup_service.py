@@ -0,0 +1,197 @@
+import string
+import threading
+import time
+from bisect import bisect_left, insort
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.functions import Lower
+
+from ..models import Company, DataVersion, Department, Employee
+
+
+class NameIndex:
+    """
+    Sorted in-process index of one model's names for prefix lookups.
+
+    Loaded on first use. Saves and deletes in this worker update it in place
+    through model signals once their transaction commits; writes that skip signals (bulk_create, update())
+    or happen in another worker are caught by comparing the model's
+    DataVersion at most every LOOKUP_INDEX_CHECK_INTERVAL seconds.
+    """
+
+    # SQLite's LOWER() folds ASCII letters only, so the index folds the same
+    # way to give the answers of the query() fallback
+    _ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+    def __init__(self, model, field, extra=()):
+        self.model = model
+        self.field = field
+        self.extra = tuple(extra)
+        self.attnames = [model._meta.get_field(name).attname for name in self.extra]
+        self.key = model._meta.label_lower
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._keys = None  # sorted (folded name, id)
+        self._rows = {}  # id -> (folded name, row dict)
+        self._version = None
+        self._checked_at = 0.0
+
+    @staticmethod
+    def fold(name):
+        return name.translate(NameIndex._ASCII_LOWER)
+
+    def _row(self, pk, name, *extra):
+        return {"id": pk, "name": name, **dict(zip(self.extra, extra))}
+
+    # Loading
+
+    def _fresh(self):
+        if self._keys is None:
+            return False
+        if time.monotonic() - self._checked_at < settings.LOOKUP_INDEX_CHECK_INTERVAL:
+            return True
+        if DataVersion.current(self.key)[0] == self._version:
+            self._checked_at = time.monotonic()
+            return True
+        return False
+
+    def _load(self):
+        version = DataVersion.current(self.key)[0]
+        rows = {}
+        for pk, name, *extra in self.model.objects.order_by().values_list(
+            "id", self.field, *self.extra
+        ).iterator(chunk_size=10000):
+            rows[pk] = (self.fold(name), self._row(pk, name, *extra))
+        keys = sorted((folded, pk) for pk, (folded, _) in rows.items())
+        with self._lock:
+            self._keys, self._rows = keys, rows
+            self._version, self._checked_at = version, time.monotonic()
+
+    def ready(self):
+        """
+        Whether lookups can be answered from memory, (re)loading the index
+        if needed. Returns False when another thread is loading it, so that
+        requests never queue behind a load.
+        """
+        if self._fresh():
+            return True
+        if not self._load_lock.acquire(blocking=False):
+            return False
+        try:
+            if not self._fresh():
+                self._load()
+            return True
+        finally:
+            self._load_lock.release()
+
+    # Signal updates
+
+    def saved(self, instance):
+        if self._keys is None:
+            return
+        row = self._row(
+            instance.pk,
+            getattr(instance, self.field),
+            *(getattr(instance, attname) for attname in self.attnames),
+        )
+        self._on_commit(instance.pk, row)
+
+    def deleted(self, instance):
+        if self._keys is None:
+            return
+        self._on_commit(instance.pk, None)
+
+    def _on_commit(self, pk, row):
+        # The signal runs after DataVersion.bump, so this is the version the
+        # write produced; a rolled back write never reaches the index
+        version = DataVersion.current(self.key)[0]
+        transaction.on_commit(lambda: self._apply(pk, row, version))
+
+    def _apply(self, pk, row, version):
+        with self._lock:
+            if self._keys is None:
+                return
+            self._discard(pk)
+            if row is not None:
+                folded = self.fold(row["name"])
+                self._rows[pk] = (folded, row)
+                insort(self._keys, (folded, pk))
+            # When the version moved by exactly this write the index is still
+            # complete, otherwise another writer got in between and the next
+            # check reloads
+            if self._version is not None and version == self._version + 1:
+                self._version = version
+
+    def _discard(self, pk):
+        previous = self._rows.pop(pk, None)
+        if previous is not None:
+            index = bisect_left(self._keys, (previous[0], pk))
+            del self._keys[index]
+
+    # Queries
+
+    def search(self, prefix, limit, filters=None):
+        prefix = self.fold(prefix)
+        filters = filters or {}
+        results = []
+        with self._lock:
+            keys, rows = self._keys, self._rows
+            index = bisect_left(keys, (prefix,))
+            while index < len(keys) and len(results) < limit:
+                folded, pk = keys[index]
+                if not folded.startswith(prefix):
+                    break
+                row = rows[pk][1]
+                if all(row[name] == value for name, value in filters.items()):
+                    results.append(row)
+                index += 1
+        return results
+
+    def query(self, prefix, limit, filters=None):
+        """The same lookup as a range scan of the LOWER(name) index"""
+        prefix = self.fold(prefix)
+        queryset = (
+            self.model.objects.annotate(folded_name=Lower(self.field))
+            .filter(folded_name__gte=prefix, folded_name__lt=prefix + "\U0010ffff")
+            .filter(**(filters or {}))
+            .order_by("folded_name", "id")
+            .values_list("id", self.field, *self.extra)[:limit]
+        )
+        return [self._row(*values) for values in queryset]
+
+
+class LookupService:
+    INDEXES = {
+        "company": NameIndex(Company, "company_name"),
+        "department": NameIndex(Department, "department_name", extra=("company",)),
+        "employee": NameIndex(Employee, "employee_name", extra=("company", "department")),
+    }
+
+    @staticmethod
+    def index_for(model):
+        for index in LookupService.INDEXES.values():
+            if index.model is model:
+                return index
+        return None
+
+    @staticmethod
+    def lookup(type_, prefix, limit=10, filters=None):
+        """
+        Up to ``limit`` ``{"id", "name", ...}`` rows of ``type_`` whose name
+        starts with ``prefix``, case-insensitively and in name order
+        """
+        index = LookupService.INDEXES[type_]
+        if index.ready():
+            return index.search(prefix, limit, filters)
+        return index.query(prefix, limit, filters)
+
+    @staticmethod
+    def reset():
+        """Drop every loaded index, e.g. between tests"""
+        for index in LookupService.INDEXES.values():
+            with index._lock:
+                index._reset()
@@ -0,0 +1,40 @@
+from django.conf import settings
+
+from ..models import Company, Department, Employee
+from .cache_service import VersionedCache
+
+
+class OptionsService:
+
+    cache = VersionedCache(
+        "options",
+        [Company, Department],
+        timeout=getattr(settings, "OPTIONS_CACHE_TIMEOUT", 300),
+    )
+
+    @staticmethod
+    def get_options():
+        """
+        Ids and names the employee/department forms choose from, as arrays
+        rather than objects, read with two narrow queries
+        """
+        return {
+            "companies": [
+                list(row)
+                for row in Company.objects.order_by("company_name").values_list(
+                    "id", "company_name"
+                )
+            ],
+            "departments": [
+                list(row)
+                for row in Department.objects.order_by("department_name", "id").values_list(
+                    "id", "company_id", "department_name"
+                )
+            ],
+            "statuses": [list(choice) for choice in Employee.STATUS_CHOICES],
+        }
+
+    @staticmethod
+    def get_cached_options(version=None):
+        """``get_options`` served from the versioned cache"""
+        return OptionsService.cache.get_or_set(OptionsService.get_options, version=version)
@@ -0,0 +1,78 @@
+import csv
+import json
+from datetime import date
+
+from ..models import Employee
+
+
+class _Echo:
+    """File-like object whose write() hands the encoded line back"""
+
+    def write(self, value):
+        return value
+
+
+class ReportService:
+
+    # Same columns, in the same order, as EmployeeReportSerializer
+    COLUMNS = [
+        "employee_name",
+        "email_address",
+        "mobile_number",
+        "position",
+        "hired_on",
+        "days_employed",
+        "company_name",
+        "department_name",
+    ]
+
+    CHUNK_SIZE = 2000
+
+    @staticmethod
+    def hired_rows(queryset=None):
+        """
+        Yield report rows as tuples in ``COLUMNS`` order, reading the database
+        in ``CHUNK_SIZE`` batches so memory stays flat for any row count.
+        """
+        queryset = Employee.objects.all() if queryset is None else queryset
+        today = date.today()
+        rows = (
+            queryset.filter(employee_status="hired")
+            .values_list(
+                "employee_name",
+                "email_address",
+                "mobile_number",
+                "designation",
+                "hired_on",
+                "company__company_name",
+                "department__department_name",
+            )
+            .iterator(chunk_size=ReportService.CHUNK_SIZE)
+        )
+        for name, email, mobile, position, hired_on, company, department in rows:
+            days_employed = (today - hired_on).days if hired_on else None
+            yield (
+                name,
+                email,
+                mobile,
+                position,
+                hired_on,
+                days_employed,
+                company,
+                department,
+            )
+
+    @staticmethod
+    def stream_csv(queryset=None):
+        writer = csv.writer(_Echo())
+        yield writer.writerow(ReportService.COLUMNS)
+        for row in ReportService.hired_rows(queryset):
+            yield writer.writerow(row)
+
+    @staticmethod
+    def stream_ndjson(queryset=None):
+        for row in ReportService.hired_rows(queryset):
+            record = dict(zip(ReportService.COLUMNS, row))
+            if record["hired_on"] is not None:
+                record["hired_on"] = record["hired_on"].isoformat()
+            yield json.dumps(record) + "\n"
@@ -0,0 +1,120 @@
+import re
+
+from django.db import connection
+from django.db.models import FloatField, Q
+from django.db.models.expressions import RawSQL
+
+
+class SearchService:
+    """
+    Full-text search over employees through the ``employees_fts`` FTS5 table.
+
+    The table indexes ``employees`` as external content: triggers keep it in
+    step with every INSERT, DELETE and UPDATE of the searched columns,
+    including bulk_create and queryset updates, and ``rebuild_employee_search``
+    recreates it from ``employees``.
+    """
+
+    TABLE = "employees_fts"
+    COLUMNS = (
+        "employee_name",
+        "email_address",
+        "mobile_number",
+        "designation",
+        "address",
+    )
+    MAX_TERMS = 10
+
+    @staticmethod
+    def schema():
+        """Statements creating the FTS table and its sync triggers"""
+        table, columns = SearchService.TABLE, ", ".join(SearchService.COLUMNS)
+        new = ", ".join(f"new.{column}" for column in SearchService.COLUMNS)
+        old = ", ".join(f"old.{column}" for column in SearchService.COLUMNS)
+        delete_old = (
+            f"INSERT INTO {table}({table}, rowid, {columns}) "
+            f"VALUES ('delete', old.id, {old});"
+        )
+        insert_new = f"INSERT INTO {table}(rowid, {columns}) VALUES (new.id, {new});"
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5("
+            f"{columns}, content='employees', content_rowid='id', "
+            f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_insert AFTER INSERT ON employees "
+            f"BEGIN {insert_new} END",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_delete AFTER DELETE ON employees "
+            f"BEGIN {delete_old} END",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_update AFTER UPDATE OF {columns} "
+            f"ON employees BEGIN {delete_old} {insert_new} END",
+        ]
+
+    @staticmethod
+    def drop():
+        table = SearchService.TABLE
+        return [
+            f"DROP TRIGGER IF EXISTS {table}_insert",
+            f"DROP TRIGGER IF EXISTS {table}_delete",
+            f"DROP TRIGGER IF EXISTS {table}_update",
+            f"DROP TABLE IF EXISTS {table}",
+        ]
+
+    @staticmethod
+    def available(using=connection):
+        return using.vendor == "sqlite"
+
+    @staticmethod
+    def rebuild(using=connection):
+        """
+        Recreate any missing table or trigger, e.g. after a migration rebuilt
+        ``employees``, and reindex every employee
+        """
+        with using.cursor() as cursor:
+            for statement in SearchService.schema():
+                cursor.execute(statement)
+            cursor.execute(
+                f"INSERT INTO {SearchService.TABLE}({SearchService.TABLE}) "
+                f"VALUES ('rebuild')"
+            )
+
+    @staticmethod
+    def match_expression(query):
+        """
+        FTS5 query matching rows containing every word of ``query`` as a
+        prefix, so "jo deve" finds "John Doe, Developer". Punctuation only
+        separates words: user input never reaches the FTS5 query syntax.
+        """
+        terms = re.findall(r"\w+", query)[: SearchService.MAX_TERMS]
+        if not terms:
+            raise ValueError("Search query must contain letters or digits")
+        return " ".join(f'"{term}"*' for term in terms)
+
+    @staticmethod
+    def search(queryset, query):
+        """
+        ``queryset`` narrowed to employees matching ``query``, annotated with
+        ``search_rank`` (bm25, lower is better) for ordering
+        """
+        expression = SearchService.match_expression(query)
+        if not SearchService.available(connection):
+            terms = Q()
+            for term in re.findall(r"\w+", query)[: SearchService.MAX_TERMS]:
+                terms &= Q(
+                    *[Q(**{f"{column}__icontains": term}) for column in SearchService.COLUMNS],
+                    _connector=Q.OR,
+                )
+            return queryset.filter(terms).annotate(
+                search_rank=RawSQL("0", (), output_field=FloatField())
+            )
+
+        table = SearchService.TABLE
+        # Joining the FTS table lets SQLite drive the query from the MATCH
+        # and read each hit's rank from the same cursor. The unary + hides
+        # the rowid constraint from FTS5: otherwise a filter such as company
+        # can make SQLite scan employees and rerun the MATCH for every row.
+        return queryset.extra(
+            tables=[table],
+            where=[f"+{table}.rowid = employees.id", f"{table} MATCH %s"],
+            params=[expression],
+        ).annotate(
+            search_rank=RawSQL(f"{table}.rank", (), output_field=FloatField())
+        )
@@ -0,0 +1,71 @@
+from collections import defaultdict
+
+from django.db import transaction
+from django.utils import timezone
+
+from ..models import Employee
+
+
+class TransitionService:
+
+    @staticmethod
+    def scope(ids=None, filters=None):
+        """Employees selected by explicit ids or by the list filters"""
+        if ids is not None:
+            return Employee.objects.filter(pk__in=ids)
+        queryset = Employee.objects.all()
+        if filters.get("company"):
+            queryset = queryset.filter(company_id=filters["company"])
+        if filters.get("department"):
+            queryset = queryset.filter(department_id=filters["department"])
+        if filters.get("status"):
+            queryset = queryset.filter(employee_status=filters["status"])
+        return queryset
+
+    @staticmethod
+    def transition(queryset, new_status, hired_on=None):
+        """
+        Move every employee in ``queryset`` that may legally reach
+        ``new_status`` with one conditional UPDATE per source status.
+        Returns the moved ids and the rejected ids with their status.
+        """
+        sources = Employee.transition_sources(new_status)
+        values = {"employee_status": new_status, "updated_at": timezone.now()}
+        if new_status == "hired":
+            values["hired_on"] = hired_on
+
+        moved, rejected = [], []
+        with transaction.atomic():
+            by_status = defaultdict(list)
+            rows = queryset.select_for_update().order_by().values_list(
+                "pk", "employee_status"
+            )
+            for pk, old_status in rows:
+                by_status[old_status].append(pk)
+
+            for old_status, pks in by_status.items():
+                if old_status not in sources:
+                    rejected.extend(
+                        {"id": pk, "employee_status": old_status} for pk in pks
+                    )
+                    continue
+                # Re-check the source status in the WHERE clause so a row
+                # changed since it was read is left alone
+                updated = Employee.objects.filter(
+                    pk__in=pks, employee_status=old_status
+                ).update(**values)
+                if updated == len(pks):
+                    moved.extend(pks)
+                    continue
+                # select_for_update is a no-op on SQLite: find which rows this
+                # UPDATE wrote by its timestamp, the others changed under us
+                current = Employee.objects.filter(pk__in=pks).values_list(
+                    "pk", "employee_status", "updated_at"
+                )
+                for pk, status, updated_at in current:
+                    if status == new_status and updated_at == values["updated_at"]:
+                        moved.append(pk)
+                    else:
+                        rejected.append({"id": pk, "employee_status": status})
+
+        return {"moved": sorted(moved), "rejected": rejected}
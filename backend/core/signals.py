@@ -0,0 +1,93 @@
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from config.sqlite_pragmas import apply_profile
+
+from .models import Company, DataVersion, Department, Employee
+from .services.counter_service import CounterService
+from .services.lookup_service import LookupService
+
+
+@receiver(connection_created)
+def connection_opened(sender, connection, **kwargs):
+    """Apply the SQLITE_PROFILE pragmas to every new SQLite connection"""
+    apply_profile(connection)
+
+
+@receiver(post_save, sender=Employee)
+def employee_saved(sender, instance, created, raw=False, **kwargs):
+    """Keep company/department employee counters in step with saves"""
+    if raw:
+        return
+    current = (instance.company_id, instance.department_id)
+    if created:
+        CounterService.employee_added(*current)
+    elif hasattr(instance, "_loaded_values"):
+        loaded = instance._loaded_values
+        previous = (
+            loaded.get("company_id", instance.company_id),
+            loaded.get("department_id", instance.department_id),
+        )
+        CounterService.employee_moved(previous, current)
+
+
+@receiver(post_delete, sender=Employee)
+def employee_deleted(sender, instance, **kwargs):
+    CounterService.employee_added(
+        instance.company_id, instance.department_id, delta=-1
+    )
+
+
+@receiver(post_save, sender=Department)
+def department_saved(sender, instance, created, raw=False, **kwargs):
+    """Keep the company department counter in step with saves"""
+    if raw:
+        return
+    if created:
+        CounterService.department_added(instance.company_id)
+    elif hasattr(instance, "_loaded_values"):
+        previous = instance._loaded_values.get("company_id", instance.company_id)
+        if previous != instance.company_id:
+            CounterService.department_added(previous, delta=-1)
+            CounterService.department_added(instance.company_id)
+
+
+@receiver(post_delete, sender=Department)
+def department_deleted(sender, instance, **kwargs):
+    CounterService.department_added(instance.company_id, delta=-1)
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_save, sender=Department)
+@receiver(post_save, sender=Employee)
+@receiver(post_delete, sender=Company)
+@receiver(post_delete, sender=Department)
+@receiver(post_delete, sender=Employee)
+def bump_data_version(sender, **kwargs):
+    """Invalidate cached results that read ``sender`` rows"""
+    DataVersion.bump(sender._meta.label_lower)
+
+
+@receiver(post_delete, sender=Company)
+@receiver(post_delete, sender=Department)
+@receiver(post_delete, sender=Employee)
+def bump_deletion_version(sender, **kwargs):
+    """Change the conditional-GET validators of querysets that lost a row"""
+    DataVersion.bump(DataVersion.deletion_key(sender))
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_save, sender=Department)
+@receiver(post_save, sender=Employee)
+def lookup_saved(sender, instance, raw=False, **kwargs):
+    """Keep this worker's name lookup index current; runs after the version bump"""
+    if not raw:
+        LookupService.index_for(sender).saved(instance)
+
+
+@receiver(post_delete, sender=Company)
+@receiver(post_delete, sender=Department)
+@receiver(post_delete, sender=Employee)
+def lookup_deleted(sender, instance, **kwargs):
+    LookupService.index_for(sender).deleted(instance)
@@ -1,10 +1,45 @@
-from django.test import TestCase
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.core.management import call_command
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.contrib.auth import get_user_model
 from rest_framework.test import APITestCase, APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework import status
+from django.core.cache import cache, caches
+from django.db import connection, connections, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from config.db_routers import (
+    PIN_HEADER,
+    ReplicaRouter,
+    start_replica_reads,
+    stop_replica_reads,
+)
+from config.log_handlers import QueueLogHandler
+from config.sqlite_pragmas import current_pragmas
+from config.parsers import FastJSONParser
+from config.renderers import FastJSONRenderer
 from .models import Company, Department, Employee
-from datetime import date, timedelta
+from .serializers import (
+    CompanySerializer,
+    DepartmentSerializer,
+    EmployeeReportSerializer,
+    EmployeeSerializer,
+)
+from .services.fast_read_service import FastReadService
+from .services.lookup_service import LookupService
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+import csv
 import json
+import logging
+import os
+import tempfile
+from io import BytesIO, StringIO
+from unittest import mock
 
 User = get_user_model()
 
@@ -157,6 +192,196 @@ class EmployeeModelTest(TestCase):
         with self.assertRaises(ValidationError):
             employee.full_clean()
 
+    def test_department_company_validation_without_snapshot(self):
+        """Test a constructed, not loaded, instance of a saved row is checked"""
+        other_company = Company.objects.create(company_name="Other Company")
+        employee = Employee(
+            pk=self.employee.pk,
+            company=other_company,
+            department=self.department,
+            employee_name=self.employee.employee_name,
+            email_address=self.employee.email_address,
+            mobile_number=self.employee.mobile_number,
+            address=self.employee.address,
+            designation=self.employee.designation,
+        )
+        employee._state.adding = False
+
+        from django.core.exceptions import ValidationError
+
+        with self.assertRaises(ValidationError) as error:
+            employee.full_clean()
+        self.assertIn("department", error.exception.message_dict)
+
+
+class CounterColumnTest(TestCase):
+    """Unit tests for the stored company/department counters"""
+
+    def setUp(self):
+        self.company = Company.objects.create(company_name="Test Company")
+        self.other_company = Company.objects.create(company_name="Other Company")
+        self.department = Department.objects.create(
+            company=self.company, department_name="IT"
+        )
+        self.other_department = Department.objects.create(
+            company=self.company, department_name="HR"
+        )
+
+    def _employee(self, **kwargs):
+        data = {
+            "company": self.company,
+            "department": self.department,
+            "employee_name": "Test Employee",
+            "email_address": "employee@example.com",
+            "mobile_number": "+1234567890",
+            "address": "789 Pine St",
+            "designation": "Developer",
+        }
+        data.update(kwargs)
+        return Employee(**data)
+
+    def _assert_counts(self, company, departments, employees):
+        company.refresh_from_db()
+        self.assertEqual(company.departments_count, departments)
+        self.assertEqual(company.employees_count, employees)
+
+    def test_counters_follow_create_and_delete(self):
+        """Test counters are incremented and decremented on save/delete"""
+        employee = self._employee()
+        employee.save()
+        self._assert_counts(self.company, 2, 1)
+        self.department.refresh_from_db()
+        self.assertEqual(self.department.employees_count, 1)
+
+        employee.delete()
+        self._assert_counts(self.company, 2, 0)
+        self.department.refresh_from_db()
+        self.assertEqual(self.department.employees_count, 0)
+
+    def test_counters_follow_department_move(self):
+        """Test moving an employee between departments moves the counter"""
+        self._employee().save()
+        employee = Employee.objects.get()
+        employee.department = self.other_department
+        employee.save()
+        self.department.refresh_from_db()
+        self.other_department.refresh_from_db()
+        self.assertEqual(self.department.employees_count, 0)
+        self.assertEqual(self.other_department.employees_count, 1)
+
+    def test_counters_follow_bulk_paths(self):
+        """Test bulk_create and queryset.update keep counters in step"""
+        Employee.objects.bulk_create([self._employee() for _ in range(3)])
+        self._assert_counts(self.company, 2, 3)
+
+        Employee.objects.filter(department=self.department).update(
+            company=self.other_company, department=None
+        )
+        self._assert_counts(self.company, 2, 0)
+        self._assert_counts(self.other_company, 0, 3)
+        self.department.refresh_from_db()
+        self.assertEqual(self.department.employees_count, 0)
+
+    def test_reconcile_counters_fixes_drift(self):
+        """Test reconcile_counters repairs counters written out of band"""
+        self._employee().save()
+        Company.objects.filter(pk=self.company.pk).update(
+            departments_count=7, employees_count=0
+        )
+        call_command("reconcile_counters", batch_size=1, stdout=StringIO())
+        self._assert_counts(self.company, 2, 1)
+
+    def test_counters_after_refresh_from_db(self):
+        """Test a refreshed instance moves counters from its reloaded company"""
+        self._employee().save()
+        employee = Employee.objects.get()
+        other_department = Department.objects.create(
+            company=self.other_company, department_name="IT"
+        )
+        moved = Employee.objects.get()
+        moved.company, moved.department = self.other_company, other_department
+        moved.save()
+
+        employee.refresh_from_db()
+        employee.designation = "Manager"
+        employee.save()
+        self._assert_counts(self.company, 2, 0)
+        self._assert_counts(self.other_company, 1, 1)
+        other_department.refresh_from_db()
+        self.assertEqual(other_department.employees_count, 1)
+
+
+class DirtyFieldTrackingTest(TestCase):
+    """Unit tests for loaded-value tracking and partial saves"""
+
+    def setUp(self):
+        self.company = Company.objects.create(company_name="Test Company")
+        self.department = Department.objects.create(
+            company=self.company, department_name="IT"
+        )
+        Employee.objects.create(
+            company=self.company,
+            department=self.department,
+            employee_name="Test Employee",
+            email_address="employee@example.com",
+            mobile_number="+1234567890",
+            address="789 Pine St",
+            designation="Developer",
+        )
+
+    def test_save_writes_only_changed_columns(self):
+        """Test a status change is validated and saved without re-fetching"""
+        employee = Employee.objects.get()
+        employee.employee_status = "interview_scheduled"
+        self.assertEqual(
+            employee.get_dirty_fields(), {"employee_status": "application_received"}
+        )
+        with CaptureQueriesContext(connection) as context:
+            employee.save()
+        statements = [query["sql"] for query in context.captured_queries]
+        self.assertFalse(
+            [sql for sql in statements if sql.startswith("SELECT")], statements
+        )
+        update = next(sql for sql in statements if sql.startswith('UPDATE "employees"'))
+        self.assertIn('"employee_status"', update)
+        self.assertIn('"updated_at"', update)
+        self.assertNotIn('"address"', update)
+        self.assertEqual(employee.get_dirty_fields(), {})
+
+    def test_invalid_transition_uses_loaded_status(self):
+        """Test workflow validation compares against the loaded status"""
+        from django.core.exceptions import ValidationError
+
+        employee = Employee.objects.get()
+        employee.employee_status = "hired"
+        employee.hired_on = date.today()
+        with self.assertRaises(ValidationError):
+            employee.save()
+
+    def test_transition_uses_refreshed_status(self):
+        """Test workflow validation compares against the status after a refresh"""
+        employee = Employee.objects.get()
+        moved = Employee.objects.get()
+        moved.employee_status = "interview_scheduled"
+        moved.save()
+        employee.refresh_from_db()
+        self.assertEqual(employee.get_dirty_fields(), {})
+        employee.employee_status = "hired"
+        employee.hired_on = date.today()
+        employee.save()
+        self.assertEqual(Employee.objects.get().employee_status, "hired")
+
+    def test_save_does_not_overwrite_counters(self):
+        """Test saving a stale company keeps counters written since loading"""
+        company = Company.objects.get(pk=self.company.pk)
+        Department.objects.create(company=self.company, department_name="HR")
+        company.company_name = "Renamed Company"
+        company.save()
+        company.refresh_from_db()
+        self.assertEqual(company.company_name, "Renamed Company")
+        self.assertEqual(company.departments_count, 2)
+        self.assertEqual(company.employees_count, 1)
+
 
 class AuthenticationAPITest(APITestCase):
     """Integration tests for authentication endpoints"""
@@ -198,6 +423,78 @@ class AuthenticationAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
 
+class CachedJWTAuthenticationTest(APITestCase):
+    """Tests that JWT requests resolve users from the cache until they change"""
+
+    def setUp(self):
+        caches[settings.AUTH_USER_CACHE].clear()
+        self.user = User.objects.create_user(
+            username="employee",
+            email="employee@example.com",
+            password="employee123",
+            role="employee",
+        )
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def _user_queries(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        queries = [q["sql"] for q in ctx.captured_queries if '"users"' in q["sql"]]
+        return len(queries), response
+
+    def test_user_resolved_from_cache(self):
+        """Test only the first request queries the users table"""
+        queries, response = self._user_queries("/accounts/api/user/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(queries, 1)
+        queries, response = self._user_queries("/accounts/api/user/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["data"]["email"], "employee@example.com")
+        self.assertEqual(queries, 0)
+
+    def test_role_change_applies_immediately(self):
+        """Test saving a new role (e.g. through the admin) evicts the cached user"""
+        self.client.get("/api/logs/stats/")
+        response = self.client.get("/api/logs/stats/")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.user.role = "admin"
+        self.user.save()
+        response = self.client.get("/api/logs/stats/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_deactivated_user_rejected(self):
+        """Test a deactivated user is no longer authenticated from the cache"""
+        self.client.get("/accounts/api/user/")
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.get("/accounts/api/user/")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_views_evict_cached_user(self):
+        """Test UserUpdateView and ChangePasswordView evict the cached user"""
+        self.client.get("/accounts/api/user/")
+        response = self.client.patch(
+            "/accounts/api/user/update/", {"first_name": "Jane"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get("/accounts/api/user/")
+        self.assertEqual(response.data["data"]["first_name"], "Jane")
+
+        response = self.client.put(
+            "/accounts/api/user/change_password/",
+            {
+                "old_password": "employee123",
+                "new_password": "newpass456",
+                "confirm_password": "newpass456",
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        queries, _ = self._user_queries("/accounts/api/user/")
+        self.assertEqual(queries, 1)
+
+
 class CompanyAPITest(APITestCase):
     """Integration tests for Company API endpoints"""
 
@@ -377,10 +674,300 @@ class EmployeeAPITest(APITestCase):
         self.assertTrue(len(response.data["data"]) > 0)
 
 
+class EmployeeBulkTransitionTest(APITestCase):
+    """Integration tests for POST /api/employees/transition/"""
+
+    def setUp(self):
+        self.manager_user = User.objects.create_user(
+            username="manager",
+            email="manager@example.com",
+            password="manager123",
+            role="manager",
+        )
+        self.client.force_authenticate(user=self.manager_user)
+        self.company = Company.objects.create(company_name="Test Company")
+        self.employees = {}
+        for employee_status in ["application_received", "interview_scheduled", "not_accepted"]:
+            self.employees[employee_status] = Employee.objects.create(
+                company=self.company,
+                employee_name=employee_status,
+                email_address=f"{employee_status}@example.com",
+                mobile_number="+1234567890",
+                address="123 Test St",
+                designation="Developer",
+                employee_status=employee_status,
+            )
+
+    def test_transition_by_ids(self):
+        """Test valid sources move and the rest are rejected"""
+        ids = [employee.id for employee in self.employees.values()] + [999999]
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(
+                "/api/employees/transition/",
+                {"ids": ids, "employee_status": "not_accepted"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.data["data"]
+        self.assertEqual(
+            data["moved"],
+            sorted([
+                self.employees["application_received"].id,
+                self.employees["interview_scheduled"].id,
+            ]),
+        )
+        self.assertEqual(
+            data["rejected"],
+            [{"id": self.employees["not_accepted"].id, "employee_status": "not_accepted"}],
+        )
+        self.assertEqual(data["not_found"], [999999])
+        self.assertEqual(
+            Employee.objects.filter(employee_status="not_accepted").count(), 3
+        )
+        updates = [
+            q for q in context.captured_queries if q["sql"].startswith('UPDATE "employees"')
+        ]
+        self.assertEqual(len(updates), 2)
+
+    def test_transition_by_filter_to_hired(self):
+        """Test filter scope and hired_on for hired transitions"""
+        response = self.client.post(
+            "/api/employees/transition/",
+            {
+                "filter": {"company": self.company.id},
+                "employee_status": "hired",
+                "hired_on": date.today().isoformat(),
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["data"]["moved"], [self.employees["interview_scheduled"].id]
+        )
+        hired = Employee.objects.get(employee_status="hired")
+        self.assertEqual(hired.hired_on, date.today())
+
+    def test_rows_changed_since_read_are_rejected(self):
+        """Test only rows the UPDATE actually wrote are reported as moved"""
+        skipped = self.employees["interview_scheduled"]
+        with connection.cursor() as cursor:
+            # Stands in for a writer changing the row between SELECT and UPDATE
+            cursor.execute(
+                "CREATE TRIGGER skip_update BEFORE UPDATE ON employees "
+                f"WHEN OLD.id = {skipped.id} BEGIN SELECT RAISE(IGNORE); END"
+            )
+        self.addCleanup(
+            lambda: connection.cursor().execute("DROP TRIGGER IF EXISTS skip_update")
+        )
+        response = self.client.post(
+            "/api/employees/transition/",
+            {
+                "ids": [self.employees["application_received"].id, skipped.id],
+                "employee_status": "not_accepted",
+            },
+            format="json",
+        )
+        data = response.data["data"]
+        self.assertEqual(data["moved"], [self.employees["application_received"].id])
+        self.assertEqual(
+            data["rejected"],
+            [{"id": skipped.id, "employee_status": "interview_scheduled"}],
+        )
+        self.assertEqual(data["not_found"], [])
+
+    def test_transition_to_hired_requires_date(self):
+        """Test hired transitions without hired_on are rejected"""
+        response = self.client.post(
+            "/api/employees/transition/",
+            {"ids": [self.employees["interview_scheduled"].id], "employee_status": "hired"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class EmployeeBulkImportTest(APITestCase):
+    """Integration tests for POST /api/employees/bulk/"""
+
+    def setUp(self):
+        self.manager_user = User.objects.create_user(
+            username="manager",
+            email="manager@example.com",
+            password="manager123",
+            role="manager",
+        )
+        self.client.force_authenticate(user=self.manager_user)
+        self.company = Company.objects.create(company_name="Test Company")
+        self.department = Department.objects.create(
+            company=self.company, department_name="IT"
+        )
+        other_company = Company.objects.create(company_name="Other Company")
+        self.other_department = Department.objects.create(
+            company=other_company, department_name="HR"
+        )
+
+    def _row(self, i, **kwargs):
+        row = {
+            "company": self.company.id,
+            "department": self.department.id,
+            "employee_name": f"Employee {i}",
+            "email_address": f"employee{i}@example.com",
+            "mobile_number": "+1234567890",
+            "address": "123 Test St",
+            "designation": "Developer",
+        }
+        row.update(kwargs)
+        return row
+
+    def test_bulk_import_json(self):
+        """Test a valid JSON array is inserted and counters follow"""
+        rows = [self._row(i) for i in range(25)]
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(
+                "/api/employees/bulk/?batch_size=10", rows, format="json"
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["data"]["created"], 25)
+        self.assertEqual(Employee.objects.count(), 25)
+        self.company.refresh_from_db()
+        self.assertEqual(self.company.employees_count, 25)
+        inserts = [
+            q for q in context.captured_queries if q["sql"].startswith("INSERT")
+        ]
+        self.assertEqual(len(inserts), 3)
+
+    def test_bulk_import_atomic_rejects_all(self):
+        """Test one invalid row rejects the whole atomic import"""
+        rows = [
+            self._row(1),
+            self._row(2, department=self.other_department.id),
+            self._row(3, employee_status="hired"),
+            self._row(4, email_address="not-an-email"),
+        ]
+        response = self.client.post("/api/employees/bulk/", rows, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.data["data"]["errors"]
+        self.assertEqual([error["row"] for error in errors], [2, 3, 4])
+        self.assertIn("department", errors[0]["errors"])
+        self.assertIn("hired_on", errors[1]["errors"])
+        self.assertIn("email_address", errors[2]["errors"])
+        self.assertEqual(Employee.objects.count(), 0)
+
+    def test_bulk_import_partial(self):
+        """Test partial mode inserts valid rows and reports the rest"""
+        rows = [self._row(1), self._row(2, company=999999), self._row(3)]
+        response = self.client.post(
+            "/api/employees/bulk/?mode=partial", rows, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["data"]["created"], 2)
+        self.assertEqual(response.data["data"]["errors"][0]["row"], 2)
+        self.assertEqual(Employee.objects.count(), 2)
+
+    def test_bulk_import_partial_skips_non_objects(self):
+        """Test rows that are not objects are reported without failing the import"""
+        rows = [["foo"], self._row(1), "bar"]
+        response = self.client.post(
+            "/api/employees/bulk/?mode=partial", rows, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["data"]["created"], 1)
+        errors = response.data["data"]["errors"]
+        self.assertEqual([error["row"] for error in errors], [1, 3])
+        self.assertIn("non_field_errors", errors[0]["errors"])
+        self.assertEqual(Employee.objects.count(), 1)
+
+    def test_bulk_import_csv(self):
+        """Test a CSV upload is parsed and imported"""
+        rows = [self._row(i, department="") for i in range(3)]
+        buffer = StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+        upload = SimpleUploadedFile(
+            "employees.csv", buffer.getvalue().encode(), content_type="text/csv"
+        )
+        response = self.client.post(
+            "/api/employees/bulk/", {"file": upload}, format="multipart"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Employee.objects.filter(department=None).count(), 3)
+
+    def test_bulk_import_forbidden_for_employees(self):
+        """Test employees cannot bulk import"""
+        user = User.objects.create_user(
+            username="employee",
+            email="employee@example.com",
+            password="employee123",
+            role="employee",
+        )
+        self.client.force_authenticate(user=user)
+        response = self.client.post("/api/employees/bulk/", [self._row(1)], format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class EmployeeReportExportTest(APITestCase):
+    """Integration tests for the streaming report exports"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="test123",
+            role="employee",
+        )
+        self.client.force_authenticate(user=self.user)
+        company = Company.objects.create(company_name="Test Company")
+        department = Department.objects.create(company=company, department_name="IT")
+        for i, employee_status in enumerate(["hired", "hired", "interview_scheduled"]):
+            Employee.objects.create(
+                company=company,
+                department=department if i else None,
+                employee_name=f"Employee {i}",
+                email_address=f"employee{i}@example.com",
+                mobile_number="+1234567890",
+                address="123 Test St",
+                designation="Developer",
+                employee_status=employee_status,
+                hired_on=date.today() - timedelta(days=10)
+                if employee_status == "hired"
+                else None,
+            )
+
+    def _json_report(self):
+        response = self.client.get("/api/employees/report/")
+        return sorted(response.data["data"], key=lambda row: row["employee_name"])
+
+    def test_report_csv_matches_json(self):
+        """Test the CSV export streams the JSON report columns"""
+        response = self.client.get("/api/employees/report/?format=csv")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        body = b"".join(response.streaming_content).decode()
+        rows = list(csv.DictReader(body.splitlines()))
+        expected = self._json_report()
+        self.assertEqual(list(rows[0].keys()), list(expected[0].keys()))
+        rows.sort(key=lambda row: row["employee_name"])
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0]["days_employed"], "10")
+        self.assertEqual(rows[0]["department_name"], "")
+        self.assertEqual(rows[1]["department_name"], "IT")
+
+    def test_report_ndjson_matches_json(self):
+        """Test the NDJSON export streams one JSON report row per line"""
+        response = self.client.get("/api/employees/report/?format=ndjson")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = b"".join(response.streaming_content).decode()
+        rows = [json.loads(line) for line in body.splitlines()]
+        rows.sort(key=lambda row: row["employee_name"])
+        self.assertEqual(rows, json.loads(json.dumps(self._json_report())))
+
+
 class DashboardAPITest(APITestCase):
     """Integration tests for Dashboard endpoint"""
 
     def setUp(self):
+        cache.clear()
         self.user = User.objects.create_user(
             username="testuser",
             email="test@example.com",
@@ -402,3 +989,1709 @@ class DashboardAPITest(APITestCase):
         self.assertIn("data", response.data)
         self.assertIn("total_companies", response.data["data"])
         self.assertEqual(response.data["data"]["total_companies"], 2)
+
+    def _create_company(self, name, statuses):
+        company = Company.objects.create(company_name=name)
+        department = Department.objects.create(company=company, department_name="IT")
+        Employee.objects.bulk_create(
+            Employee(
+                company=company,
+                department=department,
+                employee_name=f"{name} {i}",
+                email_address=f"employee{i}@example.com",
+                mobile_number="+1234567890",
+                address="123 Test St",
+                designation="Developer",
+                employee_status=employee_status,
+                hired_on=date.today() if employee_status == "hired" else None,
+            )
+            for i, employee_status in enumerate(statuses)
+        )
+        return company, department
+
+    def test_dashboard_status_totals_and_scope(self):
+        """Test status totals and the company/department scope"""
+        self.client.force_authenticate(user=self.user)
+        company, department = self._create_company(
+            "Company 1", ["hired", "hired", "interview_scheduled"]
+        )
+        self._create_company("Company 2", ["application_received", "not_accepted"])
+
+        data = self.client.get("/api/dashboard/").data["data"]
+        self.assertEqual(data["total_companies"], 2)
+        self.assertEqual(data["total_departments"], 2)
+        self.assertEqual(data["total_employees"], 5)
+        self.assertEqual(data["hired_employees"], 2)
+        self.assertEqual(data["pending_applications"], 1)
+        self.assertEqual(data["scheduled_interviews"], 1)
+        self.assertEqual(data["not_selected_employees"], 1)
+
+        data = self.client.get(f"/api/dashboard/?company={company.id}").data["data"]
+        self.assertEqual(data["total_companies"], 1)
+        self.assertEqual(data["total_employees"], 3)
+
+        data = self.client.get(
+            f"/api/dashboard/?department={department.id}"
+        ).data["data"]
+        self.assertEqual(data["total_departments"], 1)
+        self.assertEqual(data["hired_employees"], 2)
+
+    def test_dashboard_company_breakdown_query_count_is_constant(self):
+        """Test the company breakdown does not issue a query per company"""
+        self.client.force_authenticate(user=self.user)
+        self._create_company("Company 1", ["hired", "interview_scheduled"])
+        with CaptureQueriesContext(connection) as baseline:
+            self.client.get("/api/dashboard/?breakdown=company")
+        for i in range(2, 6):
+            self._create_company(f"Company {i}", ["application_received"])
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get("/api/dashboard/?breakdown=company")
+        self.assertEqual(len(context.captured_queries), len(baseline.captured_queries))
+
+        breakdown = response.data["data"]["breakdown"]
+        self.assertEqual(len(breakdown), 5)
+        self.assertEqual(breakdown[0]["company_name"], "Company 1")
+        self.assertEqual(breakdown[0]["hired_employees"], 1)
+        self.assertEqual(breakdown[1]["pending_applications"], 1)
+
+    def test_dashboard_cache_invalidated_by_writes(self):
+        """Test cached summaries are reused until a write bumps the version"""
+        self.client.force_authenticate(user=self.user)
+        company, department = self._create_company("Company 1", ["hired"])
+        self.client.get("/api/dashboard/")
+        with CaptureQueriesContext(connection) as context:
+            data = self.client.get("/api/dashboard/").data["data"]
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertEqual(data["total_employees"], 1)
+
+        Employee.objects.create(
+            company=company,
+            department=department,
+            employee_name="New Employee",
+            email_address="new@example.com",
+            mobile_number="+1234567890",
+            address="123 Test St",
+            designation="Developer",
+        )
+        data = self.client.get("/api/dashboard/").data["data"]
+        self.assertEqual(data["total_employees"], 2)
+        self.assertEqual(data["pending_applications"], 1)
+
+    def test_dashboard_cache_stats_admin_only(self):
+        """Test cache counters are exposed to admins only"""
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get("/api/dashboard/cache/")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        admin = User.objects.create_user(
+            username="admin",
+            email="admin@example.com",
+            password="admin123",
+            role="admin",
+        )
+        self.client.force_authenticate(user=admin)
+        response = self.client.get("/api/dashboard/cache/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("hit_ratio", response.data["data"])
+
+    def test_dashboard_rejects_unknown_breakdown(self):
+        """Test unsupported breakdown values are rejected"""
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get("/api/dashboard/?breakdown=planet")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ListQueryCountTest(APITestCase):
+    """Regression tests for N+1 queries on list endpoints"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="test123",
+            role="employee",
+        )
+        self.client.force_authenticate(user=self.user)
+        self._create_companies(1)
+
+    def _create_companies(self, count):
+        start = Company.objects.count()
+        for i in range(start, start + count):
+            company = Company.objects.create(company_name=f"Company {i}")
+            department = Department.objects.create(
+                company=company, department_name="IT"
+            )
+            Employee.objects.create(
+                company=company,
+                department=department,
+                employee_name=f"Employee {i}",
+                email_address=f"employee{i}@example.com",
+                mobile_number="+1234567890",
+                address="123 Test St",
+                designation="Developer",
+            )
+
+    def _count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries), response
+
+    def test_company_list_query_count_is_constant(self):
+        """Test company list does not issue a query per company"""
+        baseline, _ = self._count_queries("/api/companies/")
+        self._create_companies(5)
+        queries, response = self._count_queries("/api/companies/")
+        self.assertEqual(queries, baseline)
+        for company in response.data["data"]:
+            self.assertEqual(company["number_of_departments"], 1)
+            self.assertEqual(company["number_of_employees"], 1)
+
+    def test_department_list_query_count_is_constant(self):
+        """Test department list does not issue a query per department"""
+        baseline, _ = self._count_queries("/api/departments/")
+        self._create_companies(5)
+        queries, response = self._count_queries("/api/departments/")
+        self.assertEqual(queries, baseline)
+        for department in response.data["data"]:
+            self.assertEqual(department["number_of_employees"], 1)
+
+
+class DetailTreeQueryTest(APITestCase):
+    """Tests for the prefetched company and department detail trees"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="test123",
+            role="employee",
+        )
+        self.client.force_authenticate(user=self.user)
+        self.company = Company.objects.create(company_name="Tech Corp")
+        self._grow(departments=1, employees=1)
+
+    def _grow(self, departments, employees):
+        start = Employee.objects.count()
+        for i in range(departments):
+            department = Department.objects.create(
+                company=self.company,
+                department_name=f"Department {Department.objects.count()}",
+            )
+            for j in range(employees):
+                number = start + i * employees + j
+                Employee.objects.create(
+                    company=self.company,
+                    department=department,
+                    employee_name=f"Employee {number}",
+                    email_address=f"employee{number}@example.com",
+                    mobile_number="+1234567890",
+                    address="123 Test St",
+                    designation="Developer",
+                )
+
+    def _count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries), response.data["data"]
+
+    def test_company_tree_query_count_is_constant(self):
+        """Test company detail issues one query per tree level"""
+        url = f"/api/companies/{self.company.id}/?depth=2"
+        baseline, _ = self._count_queries(url)
+        self._grow(departments=4, employees=3)
+        queries, data = self._count_queries(url)
+        self.assertEqual(queries, baseline)
+        self.assertEqual(data["number_of_departments"], 5)
+        self.assertEqual(data["number_of_employees"], 13)
+        employees = [e for d in data["departments"] for e in d["employees"]]
+        self.assertEqual(len(employees), 13)
+        self.assertEqual(employees[0]["company_name"], "Tech Corp")
+
+    def test_department_tree_query_count_is_constant(self):
+        """Test department detail does not issue a query per employee"""
+        department = Department.objects.get()
+        url = f"/api/departments/{department.id}/?depth=1"
+        baseline, _ = self._count_queries(url)
+        for _ in range(3):
+            Employee.objects.create(
+                company=self.company,
+                department=department,
+                employee_name="Extra",
+                email_address=f"extra{Employee.objects.count()}@example.com",
+                mobile_number="+1234567890",
+                address="123 Test St",
+                designation="Developer",
+            )
+        queries, data = self._count_queries(url)
+        self.assertEqual(queries, baseline)
+        self.assertEqual(len(data["employees"]), 4)
+
+    def test_employees_limit_caps_each_department(self):
+        """Test employees_limit trims nested lists but not the counts"""
+        self._grow(departments=2, employees=3)
+        _, data = self._count_queries(
+            f"/api/companies/{self.company.id}/?depth=2&employees_limit=2"
+        )
+        for department in data["departments"]:
+            self.assertLessEqual(len(department["employees"]), 2)
+        self.assertEqual(data["departments"][1]["number_of_employees"], 3)
+
+    def test_depth_limits_nesting(self):
+        """Test depth drops nested levels and their queries"""
+        url = f"/api/companies/{self.company.id}/"
+        full, _ = self._count_queries(url + "?depth=2")
+        shallow, data = self._count_queries(url + "?depth=1")
+        self.assertEqual(shallow, full - 1)
+        self.assertNotIn("employees", data["departments"][0])
+        _, data = self._count_queries(url + "?depth=0")
+        self.assertNotIn("departments", data)
+
+        department = Department.objects.get()
+        _, data = self._count_queries(f"/api/departments/{department.id}/?depth=0")
+        self.assertNotIn("employees", data)
+        self.assertEqual(data["number_of_employees"], 1)
+
+    def test_invalid_tree_params(self):
+        """Test invalid depth or employees_limit is rejected"""
+        for query in ("depth=3", "depth=x", "employees_limit=0"):
+            response = self.client.get(f"/api/companies/{self.company.id}/?{query}")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class EmployeeSubresourceTest(APITestCase):
+    """Tests for the companies/departments {id}/employees/ sub-resources"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="test123",
+            role="employee",
+        )
+        self.client.force_authenticate(user=self.user)
+        self.company = Company.objects.create(company_name="Tech Corp")
+        self.department = Department.objects.create(
+            company=self.company, department_name="IT"
+        )
+        self.other = Department.objects.create(
+            company=self.company, department_name="HR"
+        )
+        for i in range(5):
+            Employee.objects.create(
+                company=self.company,
+                department=self.department if i < 3 else self.other,
+                employee_status="hired" if i % 2 else "application_received",
+                hired_on=date.today() if i % 2 else None,
+                employee_name=f"Employee {i}",
+                email_address=f"employee{i}@example.com",
+                mobile_number="+1234567890",
+                address="123 Test St",
+                designation="Developer",
+            )
+
+    def _collect(self, url):
+        names = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            names.extend(e["employee_name"] for e in response.data["data"])
+            url = response.data["pagination"]["next"]
+        return names
+
+    def test_department_employees_are_paginated(self):
+        """Test department employees are listed newest first across pages"""
+        names = self._collect(
+            f"/api/departments/{self.department.id}/employees/?page_size=2"
+        )
+        self.assertEqual(names, ["Employee 2", "Employee 1", "Employee 0"])
+
+    def test_company_employees_support_status_filter(self):
+        """Test company employees honour the status filter"""
+        names = self._collect(
+            f"/api/companies/{self.company.id}/employees/?status=hired"
+        )
+        self.assertEqual(names, ["Employee 3", "Employee 1"])
+
+    def test_unknown_parent_returns_404(self):
+        """Test the sub-resource of a missing parent returns 404"""
+        response = self.client.get("/api/departments/9999/employees/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_detail_payloads_carry_counts_and_links(self):
+        """Test detail responses link to the employees instead of embedding them"""
+        response = self.client.get(f"/api/departments/{self.department.id}/")
+        data = response.data["data"]
+        self.assertNotIn("employees", data)
+        self.assertEqual(data["number_of_employees"], 3)
+        self.assertTrue(
+            data["employees_url"].endswith(
+                f"/api/departments/{self.department.id}/employees/"
+            )
+        )
+
+        response = self.client.get(f"/api/companies/{self.company.id}/")
+        data = response.data["data"]
+        self.assertEqual(data["number_of_employees"], 5)
+        self.assertTrue(
+            data["employees_url"].endswith(f"/api/companies/{self.company.id}/employees/")
+        )
+        self.assertEqual(len(data["departments"]), 2)
+        for department in data["departments"]:
+            self.assertNotIn("employees", department)
+            self.assertIn("employees_url", department)
+
+
+class ConditionalGetTest(APITestCase):
+    """Tests for ETag/Last-Modified validators and 304 responses"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="test123",
+            role="employee",
+        )
+        self.client.force_authenticate(user=self.user)
+        self.company = Company.objects.create(company_name="Tech Corp")
+        self.department = Department.objects.create(
+            company=self.company, department_name="IT"
+        )
+        self.employee = self._create_employee("hired")
+
+    def _create_employee(self, employee_status="application_received"):
+        number = Employee.objects.count()
+        return Employee.objects.create(
+            company=self.company,
+            department=self.department,
+            employee_status=employee_status,
+            hired_on=date.today() if employee_status == "hired" else None,
+            employee_name=f"Employee {number}",
+            email_address=f"employee{number}@example.com",
+            mobile_number="+1234567890",
+            address="123 Test St",
+            designation="Developer",
+        )
+
+    def _revalidate(self, url, etag):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    def test_unchanged_resources_return_304(self):
+        """Test every covered GET answers a matching ETag with 304"""
+        urls = [
+            "/api/companies/",
+            f"/api/companies/{self.company.id}/",
+            "/api/departments/",
+            f"/api/departments/{self.department.id}/",
+            f"/api/departments/{self.department.id}/employees/",
+            "/api/employees/",
+            f"/api/employees/{self.employee.id}/",
+            "/api/employees/report/",
+            "/api/employees/report/?format=csv",
+            "/api/dashboard/",
+        ]
+        for url in urls:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK, url)
+            self.assertIn("ETag", response, url)
+            self.assertIn("Last-Modified", response, url)
+            response = self._revalidate(url, response["ETag"])
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED, url)
+            self.assertEqual(response.content, b"", url)
+
+    def test_304_skips_loading_and_serializing(self):
+        """Test a revalidated detail costs only the validator queries"""
+        url = f"/api/companies/{self.company.id}/?depth=2"
+        etag = self.client.get(url)["ETag"]
+        with CaptureQueriesContext(connection) as context:
+            response = self._revalidate(url, etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(len(context.captured_queries), 2)
+
+    def test_writes_change_the_etag(self):
+        """Test updates, inserts and deletions each produce a new ETag"""
+        url = "/api/employees/"
+        etag = self.client.get(url)["ETag"]
+
+        self.employee.designation = "Lead"
+        self.employee.save()
+        response = self._revalidate(url, etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response["ETag"]
+
+        extra = self._create_employee()
+        response = self._revalidate(url, etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response["ETag"]
+
+        extra.delete()
+        response = self._revalidate(url, etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["data"]), 1)
+
+    def test_related_writes_change_the_etag(self):
+        """Test payloads change when counters or related names change"""
+        companies = self.client.get("/api/companies/")["ETag"]
+        employees = self.client.get("/api/employees/")["ETag"]
+
+        self._create_employee()
+        response = self._revalidate("/api/companies/", companies)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["data"][0]["number_of_employees"], 2)
+
+        employees = self.client.get("/api/employees/")["ETag"]
+        self.company.company_name = "Renamed Corp"
+        self.company.save()
+        response = self._revalidate("/api/employees/", employees)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["data"][0]["company_name"], "Renamed Corp")
+
+    def test_dashboard_etag_follows_writes(self):
+        """Test the dashboard revalidates until a write lands"""
+        etag = self.client.get("/api/dashboard/")["ETag"]
+        self._create_employee()
+        response = self._revalidate("/api/dashboard/", etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["data"]["total_employees"], 2)
+
+    def test_representations_have_distinct_etags(self):
+        """Test query strings and formats are part of the ETag"""
+        report = self.client.get("/api/employees/report/")["ETag"]
+        export = self.client.get("/api/employees/report/?format=csv")["ETag"]
+        filtered = self.client.get("/api/employees/?status=hired")["ETag"]
+        unfiltered = self.client.get("/api/employees/")["ETag"]
+        self.assertNotEqual(report, export)
+        self.assertNotEqual(filtered, unfiltered)
+
+    def test_if_modified_since(self):
+        """Test If-Modified-Since answers 304 until the data changes"""
+        response = self.client.get("/api/departments/")
+        last_modified = response["Last-Modified"]
+        response = self.client.get(
+            "/api/departments/", HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        response = self.client.get(
+            "/api/departments/", HTTP_IF_MODIFIED_SINCE="Mon, 01 Jan 2001 00:00:00 GMT"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_department_move_changes_company_etag(self):
+        """Test a move between departments of one company revalidates its detail"""
+        other = Department.objects.create(company=self.company, department_name="HR")
+        url = f"/api/companies/{self.company.id}/"
+        etag = self.client.get(url)["ETag"]
+
+        Employee.objects.filter(pk=self.employee.pk).update(department=other)
+        response = self._revalidate(url, etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [
+                (department["department_name"], department["number_of_employees"])
+                for department in response.data["data"]["departments"]
+            ],
+            [("HR", 1), ("IT", 0)],
+        )
+
+    def test_days_employed_payloads_revalidate_daily(self):
+        """Test payloads with days_employed get a new ETag when the date changes"""
+
+        class Tomorrow(date):
+            @classmethod
+            def today(cls):
+                return date.today() + timedelta(days=1)
+
+        dated = [
+            f"/api/companies/{self.company.id}/?depth=2",
+            f"/api/departments/{self.department.id}/?depth=1",
+            f"/api/departments/{self.department.id}/employees/",
+            "/api/employees/",
+            f"/api/employees/{self.employee.id}/",
+            "/api/async/employees/",
+            f"/api/async/employees/{self.employee.id}/",
+        ]
+        undated = [
+            "/api/companies/",
+            f"/api/companies/{self.company.id}/",
+            f"/api/departments/{self.department.id}/",
+        ]
+        etags = {url: self.client.get(url)["ETag"] for url in dated + undated}
+        with mock.patch("core.views.date", Tomorrow):
+            for url in dated:
+                response = self._revalidate(url, etags[url])
+                self.assertEqual(response.status_code, status.HTTP_200_OK, url)
+            for url in undated:
+                response = self._revalidate(url, etags[url])
+                self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED, url)
+
+    def test_malformed_ids_return_404(self):
+        """Test non-numeric and missing ids answer 404"""
+        for url in [
+            "/api/companies/abc/",
+            "/api/departments/abc/",
+            "/api/employees/abc/",
+            "/api/companies/abc/employees/",
+            "/api/departments/abc/employees/",
+            "/api/employees/999999/",
+        ]:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND, url)
+
+
+@override_settings(RESPONSE_CACHE_ENABLED=True)
+class ResponseCacheTest(APITestCase):
+    """Tests for the opt-in response cache on viewset read actions"""
+
+    def setUp(self):
+        caches["responses"].clear()
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="test123",
+            role="employee",
+        )
+        self.admin = User.objects.create_user(
+            username="admin",
+            email="admin@example.com",
+            password="admin123",
+            role="admin",
+        )
+        self.client.force_authenticate(user=self.user)
+        self.company = Company.objects.create(company_name="Tech Corp")
+        self.department = Department.objects.create(
+            company=self.company, department_name="IT"
+        )
+        self._create_employee()
+
+    def _create_employee(self):
+        number = Employee.objects.count()
+        return Employee.objects.create(
+            company=self.company,
+            department=self.department,
+            employee_name=f"Employee {number}",
+            email_address=f"employee{number}@example.com",
+            mobile_number="+1234567890",
+            address="123 Test St",
+            designation="Developer",
+        )
+
+    def _get(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries), response
+
+    def test_department_move_refreshes_cached_company(self):
+        """Test a move between departments of one company refreshes its cached detail"""
+        other = Department.objects.create(company=self.company, department_name="HR")
+        url = f"/api/companies/{self.company.id}/"
+        self._get(url)
+        Employee.objects.update(department=other)
+        _, response = self._get(url)
+        self.assertEqual(
+            [
+                (department["department_name"], department["number_of_employees"])
+                for department in response.data["data"]["departments"]
+            ],
+            [("HR", 1), ("IT", 0)],
+        )
+
+    def test_repeated_reads_are_served_from_cache(self):
+        """Test a cache hit costs one version query and returns the same body"""
+        for url in (
+            "/api/employees/?status=application_received",
+            f"/api/companies/{self.company.id}/",
+            f"/api/departments/{self.department.id}/employees/",
+        ):
+            _, first = self._get(url)
+            queries, second = self._get(url)
+            self.assertEqual(queries, 1, url)
+            self.assertEqual(second.content, first.content, url)
+            self.assertEqual(second["ETag"], first["ETag"], url)
+
+    def test_writes_invalidate_entries(self):
+        """Test a write bumps the data version and misses the cache"""
+        self._get("/api/companies/")
+        self._create_employee()
+        queries, response = self._get("/api/companies/")
+        self.assertGreater(queries, 1)
+        self.assertEqual(response.data["data"][0]["number_of_employees"], 2)
+
+    def test_keys_normalize_query_and_include_role(self):
+        """Test parameter order and blank values share an entry, roles do not"""
+        self._get(f"/api/employees/?status=hired&company={self.company.id}")
+        queries, _ = self._get(
+            f"/api/employees/?company={self.company.id}&department=&status=hired"
+        )
+        self.assertEqual(queries, 1)
+
+        self.client.force_authenticate(user=self.admin)
+        queries, _ = self._get(f"/api/employees/?status=hired&company={self.company.id}")
+        self.assertGreater(queries, 1)
+
+    def test_cache_hit_honours_conditional_get(self):
+        """Test a cached entry still answers If-None-Match with 304"""
+        _, response = self._get("/api/departments/")
+        response = self.client.get(
+            "/api/departments/", HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    @override_settings(RESPONSE_CACHE_ENABLED=False)
+    def test_disabled_cache_is_bypassed(self):
+        """Test reads hit the database when the cache is not enabled"""
+        self._get("/api/companies/")
+        queries, _ = self._get("/api/companies/")
+        self.assertGreater(queries, 1)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test the entry limit evicts the least recently used response"""
+        responses = {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "lru-test",
+            "OPTIONS": {"MAX_ENTRIES": 2, "CULL_FREQUENCY": 2},
+        }
+        with self.settings(CACHES={**settings.CACHES, "responses": responses}):
+            self._get("/api/companies/")
+            self._get("/api/departments/")
+            self._get("/api/companies/")
+            self._get("/api/employees/")
+            queries, _ = self._get("/api/companies/")
+            self.assertEqual(queries, 1)
+            queries, _ = self._get("/api/departments/")
+            self.assertGreater(queries, 1)
+
+    def test_stats_report_hit_ratio(self):
+        """Test admins can read the per-viewset hit ratios"""
+        self._get("/api/companies/")
+        self._get("/api/companies/")
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get("/api/cache/responses/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.data["data"]
+        self.assertTrue(data["enabled"])
+        self.assertGreaterEqual(data["companies"]["hits"], 1)
+        self.assertIsNotNone(data["hit_ratio"])
+
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get("/api/cache/responses/")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class FastReadPathTest(TestCase):
+    """Tests that the values() fast path renders like the serializers"""
+
+    def setUp(self):
+        company = Company.objects.create(company_name="Tech Corp")
+        department = Department.objects.create(company=company, department_name="IT")
+        Company.objects.create(company_name="Empty Corp")
+        for i, (employee_status, hired_on, dept) in enumerate([
+            ("hired", date.today() - timedelta(days=40), department),
+            ("hired", date.today(), None),
+            ("application_received", None, department),
+            ("not_accepted", None, None),
+        ]):
+            Employee.objects.create(
+                company=company,
+                department=dept,
+                employee_status=employee_status,
+                hired_on=hired_on,
+                employee_name=f"Employee {i}",
+                email_address=f"employee{i}@example.com",
+                mobile_number="+1234567890",
+                address="123 Test St",
+                designation="Developer",
+            )
+
+    def assertRendersLike(self, fast, serializer):
+        renderer = JSONRenderer()
+        self.assertEqual(fast, serializer.data)
+        self.assertEqual(renderer.render(fast), renderer.render(serializer.data))
+
+    def _fast(self, queryset, spec):
+        plan = FastReadService.plan(spec)
+        return plan.render(queryset.values(*plan.columns))
+
+    def test_companies(self):
+        """Test company rows match CompanySerializer"""
+        queryset = Company.objects.all()
+        self.assertRendersLike(
+            self._fast(queryset, FastReadService.COMPANY_FIELDS),
+            CompanySerializer(queryset, many=True),
+        )
+
+    def test_departments(self):
+        """Test department rows match DepartmentSerializer"""
+        queryset = Department.objects.all()
+        self.assertRendersLike(
+            self._fast(queryset, FastReadService.DEPARTMENT_FIELDS),
+            DepartmentSerializer(queryset, many=True),
+        )
+
+    def test_employees(self):
+        """Test employee rows match EmployeeSerializer"""
+        queryset = Employee.objects.all()
+        self.assertRendersLike(
+            self._fast(queryset, FastReadService.EMPLOYEE_FIELDS),
+            EmployeeSerializer(queryset, many=True),
+        )
+
+    def test_report(self):
+        """Test report rows match EmployeeReportSerializer"""
+        self.assertRendersLike(
+            FastReadService.report(),
+            EmployeeReportSerializer(
+                Employee.objects.filter(employee_status="hired"), many=True
+            ),
+        )
+
+
+class FastJSONTest(APITestCase):
+    """Tests that FastJSONRenderer/FastJSONParser match DRF's JSON classes"""
+
+    def test_renders_like_json_renderer(self):
+        """Test dates, datetimes, Decimals and special characters render identically"""
+        data = {
+            "status_code": 200,
+            "data": [
+                {
+                    "created_at": datetime(2024, 5, 1, 12, 30, 15, 123456, dt_timezone.utc),
+                    "naive": datetime(2024, 5, 1, 12, 30),
+                    "hired_on": date(2024, 5, 1),
+                    "salary": Decimal("1234.50"),
+                    "name": "Zoë \u2028 \u2029 \"quoted\"",
+                    1: None,
+                }
+            ],
+            "message": "Success",
+        }
+        self.assertEqual(
+            FastJSONRenderer().render(data), JSONRenderer().render(data)
+        )
+        self.assertEqual(
+            FastJSONRenderer().render(data, "application/json; indent=2"),
+            JSONRenderer().render(data, "application/json; indent=2"),
+        )
+
+    def test_employee_list_envelope(self):
+        """Test the employee list response is unchanged by the fast renderer"""
+        user = User.objects.create_user(
+            username="testuser", email="test@example.com",
+            password="test123", role="employee",
+        )
+        self.client.force_authenticate(user=user)
+        company = Company.objects.create(company_name="Tech Corp")
+        Employee.objects.create(
+            company=company,
+            employee_status="hired",
+            hired_on=date.today(),
+            employee_name="John Doe",
+            email_address="john@example.com",
+            mobile_number="+1234567890",
+            address="123 Test St",
+            designation="Developer",
+        )
+        response = self.client.get("/api/employees/")
+        self.assertEqual(response.content, JSONRenderer().render(response.data))
+
+    def test_parser(self):
+        """Test request bodies decode like JSONParser and errors return 400"""
+        body = '{"name": "Zoë", "ids": [1, 2.5, null, true]}'.encode()
+        self.assertEqual(
+            FastJSONParser().parse(BytesIO(body)),
+            {"name": "Zoë", "ids": [1, 2.5, None, True]},
+        )
+        for invalid in (b"", b"{", b'{"a": NaN}'):
+            with self.assertRaises(ParseError):
+                FastJSONParser().parse(BytesIO(invalid))
+
+
+class SparseFieldsTest(APITestCase):
+    """Tests for ?fields= and ?expand= on the core viewsets"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="test123",
+            role="employee",
+        )
+        self.client.force_authenticate(user=self.user)
+        self.company = Company.objects.create(company_name="Tech Corp")
+        self.department = Department.objects.create(
+            company=self.company, department_name="IT"
+        )
+        self.employee = Employee.objects.create(
+            company=self.company,
+            department=self.department,
+            employee_name="John Doe",
+            email_address="john@example.com",
+            mobile_number="+1234567890",
+            address="123 Test St",
+            designation="Developer",
+        )
+
+    def _get(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        sql = [
+            query["sql"] for query in context.captured_queries
+            if 'FROM "employees"' in query["sql"] and "COUNT" not in query["sql"]
+        ]
+        return response, sql
+
+    def test_fields_trim_output_and_projection(self):
+        """Test ?fields= drops unused keys, columns and joins"""
+        response, sql = self._get("/api/employees/?fields=id,employee_name")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(response.data["data"][0]), ["id", "employee_name"])
+        self.assertNotIn('"address"', sql[-1])
+        self.assertNotIn("JOIN", sql[-1])
+
+    def test_expand_nests_relations(self):
+        """Test ?expand= nests company and department references"""
+        response, sql = self._get(
+            "/api/employees/?fields=id&expand=company,department"
+        )
+        row = response.data["data"][0]
+        self.assertEqual(list(row), ["id", "company", "department"])
+        self.assertEqual(
+            row["company"], {"id": self.company.id, "company_name": "Tech Corp"}
+        )
+        self.assertEqual(
+            row["department"], {"id": self.department.id, "department_name": "IT"}
+        )
+        self.assertIn("JOIN", sql[-1])
+
+    def test_list_and_detail_agree(self):
+        """Test the fast list path and the serializer detail path render alike"""
+        query = "fields=id,employee_name,days_employed,created_at&expand=company"
+        listed, _ = self._get(f"/api/employees/?{query}")
+        detail, sql = self._get(f"/api/employees/{self.employee.id}/?{query}")
+        self.assertEqual(detail.data["data"], listed.data["data"][0])
+        self.assertNotIn('"address"', sql[-1])
+        self.assertNotIn('"departments"', sql[-1])
+
+    def test_unknown_names_are_rejected(self):
+        """Test unknown fields or expansions return 400"""
+        for url in (
+            "/api/employees/?fields=id,salary",
+            "/api/employees/?expand=manager",
+            f"/api/employees/{self.employee.id}/?fields=salary",
+            "/api/companies/?expand=company",
+            f"/api/departments/{self.department.id}/?fields=nope",
+            f"/api/departments/{self.department.id}/employees/?fields=nope",
+        ):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, url)
+
+    def test_detail_fields_skip_nested_trees(self):
+        """Test trimming a detail view also drops its prefetch queries"""
+        url = f"/api/companies/{self.company.id}/"
+        with CaptureQueriesContext(connection) as full:
+            self.client.get(url + "?depth=2")
+        with CaptureQueriesContext(connection) as trimmed:
+            response = self.client.get(
+                url + "?depth=2&fields=company_name,number_of_employees"
+            )
+        self.assertEqual(
+            response.data["data"],
+            {"company_name": "Tech Corp", "number_of_employees": 1},
+        )
+        self.assertEqual(len(trimmed.captured_queries), len(full.captured_queries) - 2)
+
+        response = self.client.get(
+            f"/api/departments/{self.department.id}/?fields=department_name&expand=company"
+        )
+        self.assertEqual(
+            response.data["data"],
+            {
+                "company": {"id": self.company.id, "company_name": "Tech Corp"},
+                "department_name": "IT",
+            },
+        )
+
+
+class QueueLogHandlerTest(APITestCase):
+    """Tests for the queued, size-rotated logging pipeline"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "app.log")
+        self.handler = QueueLogHandler(
+            filename=self.path, max_bytes=200, backup_count=2,
+            queue_size=3, console=False,
+        )
+        self.addCleanup(self.handler.close)
+        self.handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+        self.logger = logging.getLogger("core.tests.queue")
+        self.logger.propagate = False
+        self.logger.addHandler(self.handler)
+        self.addCleanup(self.logger.removeHandler, self.handler)
+
+    def _read_logs(self):
+        lines = []
+        for name in sorted(os.listdir(self.tmp.name), reverse=True):
+            with open(os.path.join(self.tmp.name, name), encoding="utf-8") as f:
+                lines.extend(f.read().splitlines())
+        return lines
+
+    def test_formats_lazily_on_listener(self):
+        """Test records are formatted with their %-args by the listener thread"""
+        self.logger.info("Companies listed by user: %s", "admin@example.com")
+        self.handler.flush()
+        self.assertEqual(
+            self._read_logs(), ["INFO Companies listed by user: admin@example.com"]
+        )
+
+    def test_snapshots_mutable_args_on_caller(self):
+        """Test non-primitive args are formatted before the record is queued"""
+        self.handler.listener.stop()
+        names = ["Tech Corp"]
+        self.logger.info("Companies: %s", names)
+        names.append("Acme")
+        self.handler.listener.start()
+        self.handler.flush()
+        self.assertEqual(self._read_logs(), ["INFO Companies: ['Tech Corp']"])
+
+    def test_renders_traceback_on_caller(self):
+        """Test exception tracebacks are rendered before the record is queued"""
+        self.handler.listener.stop()
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            self.logger.exception("Failed for %s", "admin@example.com")
+        queued = self.handler.queue.queue[0]
+        self.assertIsNone(queued.exc_info)
+        self.assertIn("ValueError: boom", queued.exc_text)
+        self.handler.listener.start()
+        self.handler.flush()
+        lines = self._read_logs()
+        self.assertEqual(lines[0], "ERROR Failed for admin@example.com")
+        self.assertEqual(lines[-1], "ValueError: boom")
+
+    def test_rotates_by_size(self):
+        """Test the file rotates at max_bytes and keeps backup_count backups"""
+        for i in range(30):
+            self.logger.info("record %s %s", i, "x" * 20)
+            self.handler.flush()
+        self.assertEqual(
+            sorted(os.listdir(self.tmp.name)), ["app.log", "app.log.1", "app.log.2"]
+        )
+        for name in os.listdir(self.tmp.name):
+            self.assertLessEqual(os.path.getsize(os.path.join(self.tmp.name, name)), 200)
+
+    def test_full_queue_drops_and_reports(self):
+        """Test records beyond the queue size are dropped, counted and reported"""
+        self.handler.listener.stop()
+        for i in range(5):
+            self.logger.info("record %s", i)
+        self.assertEqual(
+            self.handler.stats(), {"queued": 3, "capacity": 3, "dropped": 2}
+        )
+
+        self.handler.listener.start()
+        self.handler.flush()
+        self.logger.info("after")
+        self.handler.flush()
+        self.assertEqual(self._read_logs(), [
+            "INFO record 0",
+            "INFO record 1",
+            "INFO record 2",
+            "WARNING 2 log records dropped, logging queue full",
+            "INFO after",
+        ])
+
+    def test_stats_endpoint(self):
+        """Test admins can read the logging queue counters"""
+        admin = User.objects.create_user(
+            username="admin", email="admin@example.com",
+            password="admin123", role="admin",
+        )
+        self.client.force_authenticate(user=admin)
+        response = self.client.get("/api/logs/stats/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            set(response.data["data"]), {"queued", "capacity", "dropped"}
+        )
+        self.assertGreater(response.data["data"]["capacity"], 0)
+
+
+class KeysetPaginationTest(APITestCase):
+    """Integration tests for cursor pagination on list endpoints"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="test123",
+            role="employee",
+        )
+        self.client.force_authenticate(user=self.user)
+        self.company = Company.objects.create(company_name="Test Company")
+        for i in range(5):
+            Employee.objects.create(
+                company=self.company,
+                employee_name=f"Employee {i}",
+                email_address=f"employee{i}@example.com",
+                mobile_number="+1234567890",
+                address="123 Test St",
+                designation="Developer",
+            )
+
+    def test_walk_employee_pages(self):
+        """Test following next cursors returns every employee once, newest first"""
+        url = "/api/employees/?page_size=2"
+        seen = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen.extend(row["id"] for row in response.data["data"])
+            url = response.data["pagination"]["next"]
+        expected = list(
+            Employee.objects.order_by("-created_at", "-id").values_list("id", flat=True)
+        )
+        self.assertEqual(seen, expected)
+
+    def test_previous_cursor_returns_previous_page(self):
+        """Test the previous cursor of page two returns page one"""
+        first = self.client.get("/api/employees/?page_size=2")
+        self.assertIsNone(first.data["pagination"]["previous"])
+        second = self.client.get(first.data["pagination"]["next"])
+        back = self.client.get(second.data["pagination"]["previous"])
+        self.assertEqual(back.data["data"], first.data["data"])
+
+    def test_company_pages_ordered_by_name(self):
+        """Test company pages follow company_name ordering"""
+        Company.objects.create(company_name="Another Company")
+        response = self.client.get("/api/companies/?page_size=1")
+        self.assertEqual(response.data["data"][0]["company_name"], "Another Company")
+        response = self.client.get(response.data["pagination"]["next"])
+        self.assertEqual(response.data["data"][0]["company_name"], "Test Company")
+        self.assertIsNone(response.data["pagination"]["next"])
+
+    def test_invalid_cursor(self):
+        """Test a malformed cursor is rejected"""
+        response = self.client.get("/api/employees/?cursor=not-a-cursor")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class EmployeeSearchTest(APITestCase):
+    """Integration tests for ?q= full-text search on the employee list"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="test123",
+            role="employee",
+        )
+        self.client.force_authenticate(user=self.user)
+        self.company = Company.objects.create(company_name="Tech Corp")
+        self.other = Company.objects.create(company_name="Other Corp")
+        rows = [
+            (self.company, "John Smith", "john.smith@example.com", "Developer", "1 Main St"),
+            (self.company, "Jane Doe", "jane@example.com", "Designer", "2 Smith Road"),
+            (self.other, "Johnny Walker", "walker@example.com", "Developer", "3 High St"),
+            (self.company, "Zoë Müller", "zoe@example.com", "Manager", "4 Park Ave"),
+        ]
+        for company, name, email, designation, address in rows:
+            Employee.objects.create(
+                company=company,
+                employee_name=name,
+                email_address=email,
+                mobile_number="+1234567890",
+                address=address,
+                designation=designation,
+            )
+
+    def _names(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [row["employee_name"] for row in response.data["data"]]
+
+    def test_prefix_search_all_terms(self):
+        """Test every word must match the start of a word in any column"""
+        self.assertEqual(
+            sorted(self._names("/api/employees/?q=joh")), ["John Smith", "Johnny Walker"]
+        )
+        self.assertEqual(self._names("/api/employees/?q=joh dev walk"), ["Johnny Walker"])
+        self.assertEqual(self._names("/api/employees/?q=muller"), ["Zoë Müller"])
+        self.assertEqual(self._names("/api/employees/?q=nobody"), [])
+
+    def test_ranked_by_relevance(self):
+        """Test rows matching the term more often rank first"""
+        self.assertEqual(
+            self._names("/api/employees/?q=smith"), ["John Smith", "Jane Doe"]
+        )
+
+    def test_combines_with_filters(self):
+        """Test search results honour the company filter"""
+        self.assertEqual(
+            self._names(f"/api/employees/?q=john&company={self.company.id}"),
+            ["John Smith"],
+        )
+
+    def test_paginates_results(self):
+        """Test next cursors walk the ranked results once each"""
+        url = "/api/employees/?q=example&page_size=1"
+        seen = []
+        while url:
+            response = self.client.get(url)
+            seen.extend(row["id"] for row in response.data["data"])
+            url = response.data["pagination"]["next"]
+        self.assertEqual(sorted(seen), sorted(Employee.objects.values_list("id", flat=True)))
+
+    def test_index_follows_writes(self):
+        """Test updates, deletes and bulk inserts are searchable immediately"""
+        employee = Employee.objects.get(employee_name="Jane Doe")
+        employee.employee_name = "Janet Doe"
+        employee.save()
+        self.assertEqual(self._names("/api/employees/?q=janet"), ["Janet Doe"])
+        Employee.objects.filter(pk=employee.pk).delete()
+        self.assertEqual(self._names("/api/employees/?q=janet"), [])
+        Employee.objects.bulk_create([
+            Employee(
+                company=self.company,
+                employee_name="Bulk Person",
+                email_address="bulk@example.com",
+                mobile_number="+1234567890",
+                address="5 Side St",
+                designation="Tester",
+            )
+        ])
+        self.assertEqual(self._names("/api/employees/?q=bulk"), ["Bulk Person"])
+
+    def test_rebuild_command(self):
+        """Test the rebuild command restores a dropped trigger and the index"""
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TRIGGER employees_fts_insert")
+        Employee.objects.create(
+            company=self.company,
+            employee_name="Late Arrival",
+            email_address="late@example.com",
+            mobile_number="+1234567890",
+            address="6 Side St",
+            designation="Tester",
+        )
+        self.assertEqual(self._names("/api/employees/?q=late"), [])
+        call_command("rebuild_employee_search", stdout=StringIO())
+        self.assertEqual(self._names("/api/employees/?q=late"), ["Late Arrival"])
+
+    def test_query_without_words(self):
+        """Test a query with no letters or digits is rejected"""
+        response = self.client.get("/api/employees/?q=%22*()")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class LookupTest(APITestCase):
+    """Integration tests for the /api/lookup/ name autocomplete"""
+
+    def setUp(self):
+        LookupService.reset()
+        self.addCleanup(LookupService.reset)
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="test123",
+            role="employee",
+        )
+        self.client.force_authenticate(user=self.user)
+        self.tech = Company.objects.create(company_name="Tech Corp")
+        self.other = Company.objects.create(company_name="Techno Labs")
+        Company.objects.create(company_name="Acme")
+        self.it = Department.objects.create(company=self.tech, department_name="IT")
+        Department.objects.create(company=self.other, department_name="Innovation")
+
+    def _lookup(self, query):
+        response = self.client.get(f"/api/lookup/?{query}")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data["data"]
+
+    def test_prefix_lookup(self):
+        """Test case-insensitive prefix matches come back in name order"""
+        self.assertEqual(
+            [row["name"] for row in self._lookup("type=company&prefix=tech")],
+            ["Tech Corp", "Techno Labs"],
+        )
+        self.assertEqual(self._lookup("type=company&prefix=techn&limit=5"), [
+            {"id": self.other.id, "name": "Techno Labs"},
+        ])
+
+    def test_filters_by_company(self):
+        """Test department lookups can be narrowed to one company"""
+        self.assertEqual(
+            self._lookup(f"type=department&prefix=i&company={self.tech.id}"),
+            [{"id": self.it.id, "name": "IT", "company": self.tech.id}],
+        )
+
+    def test_loaded_once_then_signals(self):
+        """Test the index is loaded lazily and kept current by saves and deletes"""
+        self._lookup("type=company&prefix=a")
+        with CaptureQueriesContext(connection) as ctx:
+            self._lookup("type=company&prefix=a")
+        self.assertEqual(
+            [q for q in ctx.captured_queries if '"companies"' in q["sql"]], []
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tech.company_name = "Alpha Tech"
+            self.tech.save()
+            Company.objects.get(company_name="Acme").delete()
+        self.assertEqual(
+            [row["name"] for row in self._lookup("type=company&prefix=a")],
+            ["Alpha Tech"],
+        )
+        self.assertEqual(
+            [row["name"] for row in self._lookup("type=company&prefix=tech")],
+            ["Techno Labs"],
+        )
+
+    @override_settings(LOOKUP_INDEX_CHECK_INTERVAL=0)
+    def test_rolled_back_writes_skip_index(self):
+        """Test the index only takes writes whose transaction committed"""
+        self._lookup("type=company&prefix=a")
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                Company.objects.create(company_name="Abandoned Co")
+                raise RuntimeError
+            self.tech.company_name = "Alpha Tech"
+            self.tech.save()
+        with CaptureQueriesContext(connection) as ctx:
+            names = [row["name"] for row in self._lookup("type=company&prefix=a")]
+        self.assertEqual(names, ["Acme", "Alpha Tech"])
+        # Still current, so answered without a reload
+        self.assertEqual(
+            [q for q in ctx.captured_queries if '"companies"' in q["sql"]], []
+        )
+
+    @override_settings(LOOKUP_INDEX_CHECK_INTERVAL=0)
+    def test_bulk_writes_reload(self):
+        """Test writes that skip signals are picked up through the data version"""
+        self._lookup("type=company&prefix=b")
+        Company.objects.bulk_create([Company(company_name="Bulk Co")])
+        self.assertEqual(
+            [row["name"] for row in self._lookup("type=company&prefix=b")], ["Bulk Co"]
+        )
+
+    def test_query_fallback_matches_index(self):
+        """Test the LOWER(name) range query returns what the index returns"""
+        Company.objects.create(company_name="Émile Straße")
+        Company.objects.create(company_name="émile")
+        index = LookupService.INDEXES["company"]
+        self.assertTrue(index.ready())
+        for prefix in ("t", "TECH", "acme", "z", "", "É", "é", "ÉMILE STRASSE"):
+            self.assertEqual(index.query(prefix, 10), index.search(prefix, 10))
+
+    def test_invalid_params(self):
+        """Test unknown types and non-numeric filters are rejected"""
+        response = self.client.get("/api/lookup/?type=user&prefix=a")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get("/api/lookup/?type=department&company=x")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class FormOptionsTest(APITestCase):
+    """Integration tests for the compact /api/options/ endpoint"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="test123",
+            role="employee",
+        )
+        self.client.force_authenticate(user=self.user)
+        self.company = Company.objects.create(company_name="Tech Corp")
+        self.other = Company.objects.create(company_name="Acme")
+        self.department = Department.objects.create(
+            company=self.company, department_name="IT"
+        )
+        for i in range(3):
+            Employee.objects.create(
+                company=self.company,
+                department=self.department,
+                employee_name=f"Employee {i}",
+                email_address=f"employee{i}@example.com",
+                mobile_number="+1234567890",
+                address="123 Test St",
+                designation="Developer",
+            )
+
+    def test_compact_payload(self):
+        """Test companies, departments and statuses are returned as arrays"""
+        response = self.client.get("/api/options/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["data"], {
+            "companies": [[self.other.id, "Acme"], [self.company.id, "Tech Corp"]],
+            "departments": [[self.department.id, self.company.id, "IT"]],
+            "statuses": [list(choice) for choice in Employee.STATUS_CHOICES],
+        })
+
+    def test_cached_under_data_version(self):
+        """Test repeat calls only read the data version until a company changes"""
+        self.client.get("/api/options/")
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get("/api/options/")
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+        self.other.company_name = "Acme Inc"
+        self.other.save()
+        response = self.client.get("/api/options/")
+        self.assertIn([self.other.id, "Acme Inc"], response.data["data"]["companies"])
+
+    def test_etag(self):
+        """Test If-None-Match returns 304 until a department changes"""
+        etag = self.client.get("/api/options/")["ETag"]
+        response = self.client.get("/api/options/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        Department.objects.create(company=self.other, department_name="Sales")
+        response = self.client.get("/api/options/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_smaller_than_list_calls(self):
+        """Test the payload is smaller than the company and department lists"""
+        options = len(self.client.get("/api/options/").content)
+        lists = len(self.client.get("/api/companies/").content) + len(
+            self.client.get("/api/departments/").content
+        )
+        self.assertLess(options, lists / 2)
+
+
+@override_settings(DATABASE_REPLICAS=["replica"])
+class ReplicaRoutingTest(TransactionTestCase):
+    """Integration tests for routing read endpoints to DATABASE_REPLICAS"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # A second connection to the shared in-memory test database stands
+        # in for a replica that is always in sync
+        connections.settings["replica"] = dict(connections["default"].settings_dict)
+        cls.databases = {"default", "replica"}
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        cls.databases = {"default"}
+        connections["replica"].close()
+        del connections["replica"]
+        del connections.settings["replica"]
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="admin",
+            email="admin@example.com",
+            password="admin123",
+            role="admin",
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.company = Company.objects.create(company_name="Tech Corp")
+
+    def _queries(self, method, url, data=None, pin=None):
+        headers = {PIN_HEADER: pin} if pin else {}
+        with CaptureQueriesContext(connection) as primary, CaptureQueriesContext(
+            connections["replica"]
+        ) as replica:
+            response = getattr(self.client, method)(
+                url, data, format="json", headers=headers
+            )
+        self.assertLess(response.status_code, 400, response.content)
+        self.response = response
+        return len(primary.captured_queries), len(replica.captured_queries)
+
+    def test_reads_use_replica(self):
+        """Test list, detail and dashboard reads only query the replica"""
+        for url in [
+            "/api/companies/",
+            f"/api/companies/{self.company.id}/",
+            "/api/employees/",
+            "/api/dashboard/",
+            "/api/async/employees/",
+            f"/api/async/companies/{self.company.id}/",
+            "/api/async/dashboard/",
+        ]:
+            primary, replica = self._queries("get", url)
+            self.assertEqual(primary, 0, url)
+            self.assertGreater(replica, 0, url)
+
+    def test_streamed_report_uses_replica(self):
+        """Test streamed exports read from the replica picked for the request"""
+        for export_format in ("csv", "ndjson"):
+            response = self.client.get(f"/api/employees/report/?format={export_format}")
+            with CaptureQueriesContext(connection) as primary, CaptureQueriesContext(
+                connections["replica"]
+            ) as replica:
+                b"".join(response.streaming_content)
+            self.assertEqual(len(primary.captured_queries), 0, export_format)
+            self.assertEqual(len(replica.captured_queries), 1, export_format)
+
+    def test_writes_use_primary(self):
+        """Test writes and the reads they make go to the primary"""
+        primary, replica = self._queries(
+            "patch", f"/api/companies/{self.company.id}/", {"company_name": "Acme"}
+        )
+        self.assertGreater(primary, 0)
+        self.assertEqual(replica, 0)
+        self.assertEqual(
+            Company.objects.get(pk=self.company.pk).company_name, "Acme"
+        )
+
+    def test_sticky_after_write(self):
+        """Test a user's reads stay on the primary right after a write"""
+        self._queries("post", "/api/companies/", {"company_name": "Acme"})
+        pin = self.response[PIN_HEADER]
+        primary, replica = self._queries("get", "/api/companies/", pin=pin)
+        self.assertGreater(primary, 0)
+        self.assertEqual(replica, 0)
+
+        # Without the pin, or once it expired, reads go back to the replica
+        primary, replica = self._queries("get", "/api/companies/")
+        self.assertEqual(primary, 0)
+        with override_settings(REPLICA_STICKY_SECONDS=-1):
+            primary, replica = self._queries("get", "/api/companies/", pin=pin)
+        self.assertEqual(primary, 0)
+        primary, replica = self._queries("get", "/api/companies/", pin=pin + "x")
+        self.assertEqual(primary, 0)
+
+    def test_pin_is_per_user(self):
+        """Test another user presenting the pin still reads a replica"""
+        self._queries("post", "/api/companies/", {"company_name": "Acme"})
+        pin = self.response[PIN_HEADER]
+        other = User.objects.create_user(
+            username="other", email="other@example.com", password="other123"
+        )
+        self.client.force_authenticate(user=other)
+        primary, replica = self._queries("get", "/api/companies/", pin=pin)
+        self.assertEqual(primary, 0)
+
+    def test_one_replica_per_request(self):
+        """Test every read of a request goes to the replica picked at its start"""
+        with override_settings(DATABASE_REPLICAS=["replica", "replica2", "replica3"]):
+            for _ in range(10):
+                token = start_replica_reads(None)
+                try:
+                    aliases = {ReplicaRouter().db_for_read(Company) for _ in range(20)}
+                finally:
+                    stop_replica_reads(token)
+                self.assertEqual(len(aliases), 1)
+        self.assertEqual(ReplicaRouter().db_for_read(Company), "default")
+
+    def test_replica_instances_saved_to_primary(self):
+        """Test instances read from a replica are written to the primary"""
+        token = start_replica_reads(None)
+        try:
+            company = Company.objects.get(pk=self.company.pk)
+        finally:
+            stop_replica_reads(token)
+        self.assertEqual(company._state.db, "replica")
+        company.company_name = "Acme"
+        with CaptureQueriesContext(connections["replica"]) as replica:
+            company.save()
+        self.assertEqual(len(replica.captured_queries), 0)
+        self.assertEqual(
+            Company.objects.get(pk=self.company.pk).company_name, "Acme"
+        )
+
+
+class SqliteProfileTest(TestCase):
+    """Unit tests for the SQLITE_PROFILE pragmas applied to new connections"""
+
+    def _connect(self, profile):
+        # A file database: in-memory ones ignore journal_mode=WAL
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings_dict = {
+            **connection.settings_dict,
+            "NAME": os.path.join(directory.name, "profile.sqlite3"),
+        }
+        with override_settings(SQLITE_PROFILE=profile):
+            wrapper = connections["default"].__class__(settings_dict, alias="profile")
+            self.addCleanup(wrapper.close)
+            wrapper.ensure_connection()
+        return wrapper
+
+    def test_wal_profile(self):
+        """Test the wal profile's pragmas and transaction mode are applied"""
+        wrapper = self._connect("wal")
+        self.assertEqual(current_pragmas(wrapper), {
+            "journal_mode": "wal",
+            "synchronous": 1,
+            "busy_timeout": 5000,
+            "cache_size": -20000,
+            "mmap_size": 256 * 1024 * 1024,
+            "temp_store": 2,
+        })
+        self.assertEqual(wrapper.transaction_mode, "IMMEDIATE")
+
+    def test_stock_profile(self):
+        """Test the stock profile leaves SQLite's defaults alone"""
+        wrapper = self._connect("stock")
+        self.assertEqual(current_pragmas(wrapper)["journal_mode"], "delete")
+        self.assertIsNone(wrapper.transaction_mode)
+
+    def test_invalid_profiles(self):
+        """Test unknown profiles, keys and values are rejected"""
+        with self.assertRaises(ImproperlyConfigured):
+            self._connect("missing")
+        profiles = {"bad_key": {"page_size": 1024}, "bad_value": {"synchronous": "1; DROP"}}
+        with override_settings(SQLITE_PROFILES=profiles):
+            for name in profiles:
+                with self.subTest(name), self.assertRaises(ImproperlyConfigured):
+                    self._connect(name)
+
+
+class AsyncReadPathTest(APITestCase):
+    """Integration tests for the async-native /api/async/ read endpoints"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="test123",
+            role="employee",
+        )
+        self.client.force_authenticate(user=self.user)
+        self.company = Company.objects.create(company_name="Tech Corp")
+        Company.objects.create(company_name="Acme")
+        self.department = Department.objects.create(
+            company=self.company, department_name="IT"
+        )
+        self.employees = [
+            Employee.objects.create(
+                company=self.company,
+                department=self.department,
+                employee_name=f"Employee {i}",
+                email_address=f"employee{i}@example.com",
+                mobile_number="+1234567890",
+                address="123 Test St",
+                designation="Developer",
+                employee_status="hired" if i % 2 else "application_received",
+                hired_on=date(2024, 1, 1) if i % 2 else None,
+            )
+            for i in range(5)
+        ]
+
+    def _pair(self, path):
+        """The sync and async responses to the same GET"""
+        sync = self.client.get(f"/api/{path}")
+        asynchronous = self.client.get(f"/api/async/{path}")
+        return sync, asynchronous
+
+    def test_same_payload_as_sync(self):
+        """Test every async endpoint returns the sync endpoint's payload"""
+        employee = self.employees[0]
+        paths = [
+            "companies/",
+            "companies/?fields=id,company_name&page_size=1",
+            f"companies/{self.company.id}/",
+            f"companies/{self.company.id}/?depth=2&employees_limit=2",
+            "departments/",
+            f"departments/?company={self.company.id}&expand=company",
+            f"departments/{self.department.id}/?depth=1",
+            "employees/",
+            "employees/?status=hired&page_size=2&fields=id,employee_name",
+            f"employees/?q=employee&department={self.department.id}",
+            f"employees/{employee.id}/",
+            f"employees/{employee.id}/?expand=company,department",
+            "dashboard/",
+            f"dashboard/?company={self.company.id}&breakdown=company",
+        ]
+        for path in paths:
+            with self.subTest(path):
+                sync, asynchronous = self._pair(path)
+                self.assertEqual(asynchronous.status_code, status.HTTP_200_OK)
+                expected = json.loads(sync.content)
+                actual = asynchronous.json()
+                self.assertEqual(actual["data"], expected["data"])
+                if "pagination" in expected:
+                    self.assertEqual(
+                        actual["pagination"]["next_cursor"],
+                        expected["pagination"]["next_cursor"],
+                    )
+
+    def test_cursor_pages(self):
+        """Test following next_cursor walks every employee once"""
+        seen, cursor = [], None
+        while True:
+            query = f"&cursor={cursor}" if cursor else ""
+            body = self.client.get(f"/api/async/employees/?page_size=2{query}").json()
+            seen += [row["id"] for row in body["data"]]
+            cursor = body["pagination"]["next_cursor"]
+            if cursor is None:
+                break
+        self.assertEqual(sorted(seen), sorted(e.id for e in self.employees))
+
+    def test_authentication_required(self):
+        """Test anonymous requests are rejected like the sync endpoints"""
+        self.client.force_authenticate(user=None)
+        for path in ["employees/", f"companies/{self.company.id}/", "dashboard/"]:
+            with self.subTest(path):
+                sync, asynchronous = self._pair(path)
+                self.assertEqual(asynchronous.status_code, sync.status_code)
+                self.assertEqual(asynchronous.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_jwt_authentication(self):
+        """Test a bearer token authenticates through the async path"""
+        self.client.force_authenticate(user=None)
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        response = self.client.get("/api/async/employees/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["data"]), 5)
+
+    def test_only_get_allowed(self):
+        """Test the async endpoints are read-only"""
+        self.client.force_authenticate(user=User.objects.create_user(
+            username="admin", email="admin@example.com", password="admin123", role="admin"
+        ))
+        response = self.client.post(
+            "/api/async/companies/", {"company_name": "New"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+        self.assertFalse(Company.objects.filter(company_name="New").exists())
+
+    def test_not_found(self):
+        """Test unknown ids return 404"""
+        for path, message in [
+            ("employees/999999/", "Employee not found"),
+            ("companies/999999/", "Company not found"),
+            ("departments/999999/", "Department not found"),
+        ]:
+            with self.subTest(path):
+                response = self.client.get(f"/api/async/{path}")
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+                self.assertEqual(response.json()["message"], message)
+
+    def test_invalid_parameters(self):
+        """Test invalid parameters are rejected like the sync endpoints"""
+        for path in [
+            "employees/?fields=salary",
+            "employees/?cursor=bogus",
+            f"companies/{self.company.id}/?depth=3",
+            "dashboard/?company=abc",
+        ]:
+            with self.subTest(path):
+                sync, asynchronous = self._pair(path)
+                self.assertEqual(asynchronous.status_code, sync.status_code)
+                self.assertEqual(
+                    asynchronous.json()["message"], json.loads(sync.content)["message"]
+                )
+
+    def test_etag(self):
+        """Test If-None-Match returns 304 until an employee changes"""
+        url = f"/api/async/employees/{self.employees[0].id}/"
+        etag = self.client.get(url)["ETag"]
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.employees[0].designation = "Lead"
+        self.employees[0].save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -1,10 +1,22 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import (
+    AsyncCompanyDetail,
+    AsyncCompanyList,
+    AsyncDashboardSummary,
+    AsyncDepartmentDetail,
+    AsyncDepartmentList,
+    AsyncEmployeeDetail,
+    AsyncEmployeeList,
     CompanyViewSet,
     DepartmentViewSet,
     EmployeeViewSet,
     dashboard_summary,
+    lookup_names,
+    form_options,
+    dashboard_cache_stats,
+    response_cache_stats,
+    log_queue_stats,
 )
 
 # Create router for viewsets
@@ -16,6 +28,33 @@ router.register(r"employees", EmployeeViewSet, basename="employee")
 urlpatterns = [
     # Dashboard endpoint
     path("dashboard/", dashboard_summary, name="dashboard"),
+    path("dashboard/cache/", dashboard_cache_stats, name="dashboard-cache"),
+    path("options/", form_options, name="options"),
+    path("lookup/", lookup_names, name="lookup"),
+    path("cache/responses/", response_cache_stats, name="response-cache"),
+    path("logs/stats/", log_queue_stats, name="log-stats"),
+    # Async-native read endpoints, for ASGI deployments
+    path("async/companies/", AsyncCompanyList.as_view(), name="async-company-list"),
+    path(
+        "async/companies/<int:pk>/",
+        AsyncCompanyDetail.as_view(),
+        name="async-company-detail",
+    ),
+    path(
+        "async/departments/", AsyncDepartmentList.as_view(), name="async-department-list"
+    ),
+    path(
+        "async/departments/<int:pk>/",
+        AsyncDepartmentDetail.as_view(),
+        name="async-department-detail",
+    ),
+    path("async/employees/", AsyncEmployeeList.as_view(), name="async-employee-list"),
+    path(
+        "async/employees/<int:pk>/",
+        AsyncEmployeeDetail.as_view(),
+        name="async-employee-detail",
+    ),
+    path("async/dashboard/", AsyncDashboardSummary.as_view(), name="async-dashboard"),
     # Include router URLs
     path("", include(router.urls)),
 ]
@@ -1,27 +1,310 @@
 from rest_framework import viewsets, status
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.parsers import MultiPartParser
+from rest_framework.settings import api_settings
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import router
 from django.db.models import ProtectedError
+from django.http import Http404, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date
 
+from core.services.cache_service import VersionedCache
+from core.services.conditional_service import ConditionalService
 from core.services.dashboard_service import DashboardService
+from core.services.fast_read_service import FastReadService
+from core.services.import_service import EmployeeImportService
+from core.services.lookup_service import LookupService
+from core.services.options_service import OptionsService
+from core.services.transition_service import TransitionService
+from core.services.report_service import ReportService
+from core.services.search_service import SearchService
 from .models import Company, Department, Employee
 from .serializers import (
     CompanySerializer,
     DepartmentSerializer,
     EmployeeSerializer,
-    EmployeeReportSerializer,
+    EmployeeTransitionSerializer,
     DepartmentDetailsSerializer,
     CompanyDetailsSerializer,
 )
-from config.permissions import CompanyPermission, DepartmentPermission, EmployeePermission
+from config.permissions import (
+    CompanyPermission,
+    DepartmentPermission,
+    EmployeePermission,
+    IsAdmin,
+)
+from config.async_views import AsyncAPIView
+from config.db_routers import ReplicaReadMixin, use_replica
+from config.log_handlers import queue_handlers
+from config.pagination import InvalidCursor
+from config.renderers import CSVRenderer, NDJSONRenderer
 from config.response import CustomResponse
+from datetime import date
+from functools import wraps
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _tree_params(request, max_depth, default_depth):
+    """
+    Parse ``?depth=`` (levels of nesting) and ``?employees_limit=``
+    (employees per department) for the detail trees
+    """
+    depth = request.query_params.get("depth") or str(default_depth)
+    limit = request.query_params.get("employees_limit") or None
+    if not depth.isdigit() or int(depth) > max_depth:
+        raise ValueError(f"depth must be an integer between 0 and {max_depth}")
+    if limit is not None and (not limit.isdigit() or int(limit) < 1):
+        raise ValueError("employees_limit must be a positive integer")
+    return int(depth), int(limit) if limit is not None else None
+
+
+def _sparse_params(request, allowed, expandable=()):
+    """
+    Parse ``?fields=`` and ``?expand=`` into ``(fields or None, expand)``,
+    rejecting names the endpoint cannot render
+    """
+
+    def names(param):
+        value = request.query_params.get(param) or ""
+        return [name.strip() for name in value.split(",") if name.strip()]
+
+    fields, expand = names("fields"), names("expand")
+    unknown = [name for name in fields if name not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    unknown = [name for name in expand if name not in expandable]
+    if unknown:
+        raise ValueError(f"Cannot expand: {', '.join(unknown)}")
+    return fields or None, tuple(expand)
+
+
+def _list_plan(request, spec, ordering, expandable=()):
+    """ReadPlan of a list page, always fetching the keyset ordering columns"""
+    fields, expand = _sparse_params(request, spec, expandable)
+    return FastReadService.plan(
+        spec, fields, expand, required=[name.lstrip("-") for name in ordering]
+    )
+
+
+def _conditional(request, queryset=None, related=(), extra="", snapshot=None):
+    """
+    Validators of the payload a GET would build, plus a ready 304 response
+    when the client's copy is still current (``None`` otherwise), so the
+    view can return before loading and serializing anything
+    """
+    validators = ConditionalService.validators(
+        queryset, related, extra=_payload_key(request, extra), snapshot=snapshot
+    )
+    return validators, _not_modified(request, validators)
+
+
+async def _aconditional(request, queryset=None, related=(), extra="", snapshot=None):
+    """``_conditional`` through the async ORM"""
+    validators = await ConditionalService.avalidators(
+        queryset, related, extra=_payload_key(request, extra), snapshot=snapshot
+    )
+    return validators, _not_modified(request, validators)
+
+
+def _days_employed_key(queryset, related):
+    """
+    ``extra`` of a payload with employee rows, whose days_employed counts up
+    with the date rather than with any write
+    """
+    if queryset.model is Employee or Employee in related:
+        return date.today().isoformat()
+    return ""
+
+
+def _filter_or_404(queryset, **lookups):
+    """``queryset.filter(**lookups)``, a malformed id is a 404 as in get_object"""
+    try:
+        return queryset.filter(**lookups)
+    except (TypeError, ValueError, ValidationError):
+        raise Http404
+
+
+def _bad_query_param(error):
+    """400 response for a malformed cursor or list filter"""
+    message = error.detail[0] if isinstance(error, InvalidCursor) else error
+    return CustomResponse(message=str(message), status=status.HTTP_400_BAD_REQUEST)
+
+
+def _payload_key(request, extra):
+    return f"{request.get_full_path()}|{request.accepted_media_type}|{extra}"
+
+
+def _not_modified(request, validators):
+    response = get_conditional_response(
+        request, etag=validators[0], last_modified=validators[1]
+    )
+    if response is not None:
+        _set_validators(response, validators)
+    return response
+
+
+def _set_validators(response, validators):
+    etag, last_modified = validators
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    return response
+
+
+def _response_cache_params(view, request, kwargs):
+    """Cache key parameters: the action, role, format and normalized query"""
+    params = {
+        "action": view.action,
+        "pk": kwargs.get("pk", ""),
+        "role": getattr(request.user, "role", ""),
+        "host": request.get_host(),
+        "media_type": request.accepted_media_type,
+        # days_employed in employee payloads changes with the date
+        "date": date.today().isoformat(),
+    }
+    for key in sorted(request.query_params):
+        values = sorted(value for value in request.query_params.getlist(key) if value)
+        if values:
+            params[f"query.{key}"] = ",".join(values)
+    return params
+
+
+def cached_read(view_method):
+    """
+    Serve a read action from the viewset's ``response_cache`` when
+    RESPONSE_CACHE_ENABLED is set. Only 200 responses are stored, with their
+    validators, so a hit still honours If-None-Match / If-Modified-Since.
+    """
+
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        cache = getattr(self, "response_cache", None)
+        if cache is None or not settings.RESPONSE_CACHE_ENABLED:
+            return view_method(self, request, *args, **kwargs)
+
+        params = _response_cache_params(self, request, kwargs)
+        version = cache.version()
+        entry = cache.get(params, version)
+        if entry is not None:
+            validators = entry["validators"]
+            not_modified = get_conditional_response(
+                request, etag=validators[0], last_modified=validators[1]
+            )
+            if not_modified is not None:
+                return _set_validators(not_modified, validators)
+            response = CustomResponse(
+                entry["data"], status=status.HTTP_200_OK, pagination=entry["pagination"]
+            )
+            return _set_validators(response, validators)
+
+        response = view_method(self, request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK and "ETag" in response:
+            last_modified = response.get("Last-Modified")
+            cache.set(
+                {
+                    "data": response.data["data"],
+                    "pagination": response.data.get("pagination"),
+                    "validators": (
+                        response["ETag"],
+                        parse_http_date(last_modified) if last_modified else None,
+                    ),
+                },
+                params,
+                version,
+            )
+        return response
+
+    return wrapper
+
+
+def _response_cache(name):
+    return VersionedCache(
+        f"responses:{name}",
+        [Company, Department, Employee],
+        timeout=settings.RESPONSE_CACHE_TIMEOUT,
+        alias="responses",
+    )
+
+
+class EmployeeSubresourceMixin:
+    """
+    Keyset-paginated ``{id}/employees/`` sub-resource of a parent viewset,
+    filtered on ``employee_parent_field`` and supporting ``?status=``
+    """
+
+    employee_parent_field = None
+    # The employee list's ordering, which its pages are cursored on
+    employees_keyset_ordering = ("-created_at", "-id")
+
+    def get_keyset_ordering(self):
+        if self.action == "employees":
+            return self.employees_keyset_ordering
+        return self.keyset_ordering
+
+    def get_queryset(self):
+        if self.action == "retrieve":
+            return self.detail_query(self.request, self.kwargs["pk"])[1]
+        return super().get_queryset()
+
+    @action(detail=True, methods=["get"], url_path="employees")
+    @cached_read
+    def employees(self, request, pk=None):
+        """List the employees of one company or department"""
+        try:
+            plan = _list_plan(
+                request,
+                FastReadService.EMPLOYEE_FIELDS,
+                self.employees_keyset_ordering,
+                expandable=EmployeeViewSet.expandable,
+            )
+            employees = _filter_or_404(
+                Employee.objects.all(), **{f"{self.employee_parent_field}_id": pk}
+            )
+
+            status_filter = request.query_params.get("status", None)
+            if status_filter:
+                employees = employees.filter(employee_status=status_filter)
+
+            related = (Company, Department)
+            validators, not_modified = _conditional(
+                request,
+                employees,
+                related=related,
+                extra=_days_employed_key(employees, related),
+            )
+            if not_modified:
+                return not_modified
+
+            self.get_object()
+            employees = self.paginate_queryset(employees.values(*plan.columns))
+            response = CustomResponse(
+                plan.render(employees),
+                status=status.HTTP_200_OK,
+                pagination=self.paginator.get_pagination(),
+            )
+            return _set_validators(response, validators)
+        except Http404:
+            return CustomResponse(
+                message=f"{self.employee_parent_field.capitalize()} not found",
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        except (InvalidCursor, ValueError) as e:
+            return _bad_query_param(e)
+        except Exception as e:
+            logger.error("Error listing %s employees: %s", self.employee_parent_field, e)
+            return CustomResponse(
+                message="Failed to retrieve employees",
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+
 # Company ViewSet
-class CompanyViewSet(viewsets.ModelViewSet):
+class CompanyViewSet(ReplicaReadMixin, EmployeeSubresourceMixin, viewsets.ModelViewSet):
     """
     ViewSet for Company CRUD operations
     GET: All authenticated users
@@ -31,34 +314,103 @@ class CompanyViewSet(viewsets.ModelViewSet):
     queryset = Company.objects.all()
     serializer_class = CompanySerializer
     permission_classes = [CompanyPermission]
+    keyset_ordering = ("company_name", "id")
+    # Models the list payload reads besides its own rows
+    list_related = ()
+    employee_parent_field = "company"
+    response_cache = _response_cache("companies")
+    replica_actions = ("list", "retrieve", "employees")
 
+    def list_query(self, request):
+        """The list action's ReadPlan and filtered queryset"""
+        plan = _list_plan(request, FastReadService.COMPANY_FIELDS, self.keyset_ordering)
+        return plan, self.get_queryset()
+
+    @cached_read
     def list(self, request):
         """List all companies"""
         try:
-            companies = self.get_queryset()
-            serializer = self.get_serializer(companies, many=True)
-            logger.info(f"Companies listed by user: {request.user.email}")
-            return CustomResponse(serializer.data, status=status.HTTP_200_OK)
+            plan, companies = self.list_query(request)
+            validators, not_modified = _conditional(
+                request,
+                companies,
+                related=self.list_related,
+                extra=_days_employed_key(companies, self.list_related),
+            )
+            if not_modified:
+                return not_modified
+
+            companies = self.paginate_queryset(companies.values(*plan.columns))
+            logger.info("Companies listed by user: %s", request.user.email)
+            response = CustomResponse(
+                plan.render(companies),
+                status=status.HTTP_200_OK,
+                pagination=self.paginator.get_pagination(),
+            )
+            return _set_validators(response, validators)
+        except (InvalidCursor, ValueError) as e:
+            return _bad_query_param(e)
         except Exception as e:
-            logger.error(f"Error listing companies: {str(e)}")
+            logger.error("Error listing companies: %s", e)
             return CustomResponse(
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 message=str(e),
             )
 
+    def detail_query(self, request, pk):
+        """
+        The retrieve action's validator models, queryset and serializer:
+        ``(related, queryset, serializer(instance))``
+        """
+        depth, employees_limit = _tree_params(request, max_depth=2, default_depth=1)
+        fields, _ = _sparse_params(request, CompanyDetailsSerializer.Meta.fields)
+        if fields is not None and "departments" not in fields:
+            depth = 0
+        columns, _ = FastReadService.columns(FastReadService.COMPANY_FIELDS, fields)
+        queryset = Company.objects.with_department_tree(
+            depth=depth, employees_limit=employees_limit
+        ).only(*columns)
+        context = {
+            "request": request,
+            "fields": fields,
+            "include_departments": depth >= 1,
+            "include_employees": depth >= 2,
+        }
+        return (
+            (Department, Employee)[:depth],
+            queryset,
+            lambda company: CompanyDetailsSerializer(company, context=context),
+        )
+
+    @cached_read
     def retrieve(self, request, pk=None):
         """Retrieve a single company"""
         try:
+            related, _, serializer = self.detail_query(request, pk)
+            matching = _filter_or_404(Company.objects.all(), pk=pk)
+            validators, not_modified = _conditional(
+                request,
+                matching,
+                related=related,
+                extra=_days_employed_key(matching, related),
+            )
+            if not_modified:
+                return not_modified
+
             company = self.get_object()
-            serializer = CompanyDetailsSerializer(company)
-            return CustomResponse(serializer.data, status=status.HTTP_200_OK)
-        except Company.DoesNotExist:
+            response = CustomResponse(serializer(company).data, status=status.HTTP_200_OK)
+            return _set_validators(response, validators)
+        except ValueError as e:
+            return CustomResponse(
+                message=str(e), status=status.HTTP_400_BAD_REQUEST
+            )
+        except (Company.DoesNotExist, Http404):
             return CustomResponse(
                 status=status.HTTP_404_NOT_FOUND,
                 message="Company not found",
             )
         except Exception as e:
-            logger.error(f"Error retrieving company: {str(e)}")
+            logger.error("Error retrieving company: %s", e)
             return CustomResponse(
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 message=str(e),
@@ -71,11 +423,13 @@ class CompanyViewSet(viewsets.ModelViewSet):
             serializer.is_valid(raise_exception=True)
             serializer.save()
             logger.info(
-                f"Company created by {request.user.email}: {serializer.data['company_name']}"
+                "Company created by %s: %s",
+                request.user.email,
+                serializer.data["company_name"],
             )
             return CustomResponse(serializer.data, status=status.HTTP_201_CREATED)
         except Exception as e:
-            logger.error(f"Error creating company: {str(e)}")
+            logger.error("Error creating company: %s", e)
             return CustomResponse(message=str(e), status=status.HTTP_400_BAD_REQUEST)
 
     def update(self, request, pk=None):
@@ -86,7 +440,7 @@ class CompanyViewSet(viewsets.ModelViewSet):
             serializer.is_valid(raise_exception=True)
             serializer.save()
             logger.info(
-                f"Company updated by {request.user.email}: {company.company_name}"
+                "Company updated by %s: %s", request.user.email, company.company_name
             )
             return CustomResponse(serializer.data, status=status.HTTP_200_OK)
         except Company.DoesNotExist:
@@ -94,7 +448,7 @@ class CompanyViewSet(viewsets.ModelViewSet):
                 message="Company not found", status=status.HTTP_404_NOT_FOUND
             )
         except Exception as e:
-            logger.error(f"Error updating company: {str(e)}")
+            logger.error("Error updating company: %s", e)
             return CustomResponse(message=str(e), status=status.HTTP_400_BAD_REQUEST)
 
     def partial_update(self, request, pk=None):
@@ -105,7 +459,9 @@ class CompanyViewSet(viewsets.ModelViewSet):
             serializer.is_valid(raise_exception=True)
             serializer.save()
             logger.info(
-                f"Company partially updated by {request.user.email}: {company.company_name}"
+                "Company partially updated by %s: %s",
+                request.user.email,
+                company.company_name,
             )
             return CustomResponse(serializer.data, status=status.HTTP_200_OK)
         except Company.DoesNotExist:
@@ -113,7 +469,7 @@ class CompanyViewSet(viewsets.ModelViewSet):
                 message="Company not found", status=status.HTTP_404_NOT_FOUND
             )
         except Exception as e:
-            logger.error(f"Error updating company: {str(e)}")
+            logger.error("Error updating company: %s", e)
             return CustomResponse( message=str(e), status=status.HTTP_400_BAD_REQUEST)
 
     def destroy(self, request, pk=None):
@@ -122,7 +478,7 @@ class CompanyViewSet(viewsets.ModelViewSet):
             company = self.get_object()
             company_name = company.company_name
             company.delete()
-            logger.info(f"Company deleted by {request.user.email}: {company_name}")
+            logger.info("Company deleted by %s: %s", request.user.email, company_name)
             return CustomResponse(
                 status=status.HTTP_204_NO_CONTENT,
                 message="Company deleted successfully",
@@ -138,7 +494,7 @@ class CompanyViewSet(viewsets.ModelViewSet):
                 message="Cannot delete company with associated departments or employees",
             )
         except Exception as e:
-            logger.error(f"Error deleting company: {str(e)}")
+            logger.error("Error deleting company: %s", e)
             return CustomResponse(
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 message=str(e),
@@ -146,7 +502,7 @@ class CompanyViewSet(viewsets.ModelViewSet):
 
 
 # Department ViewSet
-class DepartmentViewSet(viewsets.ModelViewSet):
+class DepartmentViewSet(ReplicaReadMixin, EmployeeSubresourceMixin, viewsets.ModelViewSet):
     """
     ViewSet for Department CRUD operations
     GET: All authenticated users
@@ -156,36 +512,116 @@ class DepartmentViewSet(viewsets.ModelViewSet):
     queryset = Department.objects.select_related("company").all()
     serializer_class = DepartmentSerializer
     permission_classes = [DepartmentPermission]
+    keyset_ordering = ("department_name", "id")
+    list_related = (Company,)
+    employee_parent_field = "department"
+    response_cache = _response_cache("departments")
+    replica_actions = ("list", "retrieve", "employees")
+    expandable = ("company",)
+
+    def list_query(self, request):
+        """The list action's ReadPlan and filtered queryset"""
+        plan = _list_plan(
+            request,
+            FastReadService.DEPARTMENT_FIELDS,
+            self.keyset_ordering,
+            expandable=self.expandable,
+        )
+        departments = self.get_queryset()
+        company_id = request.query_params.get("company", None)
+        if company_id:
+            departments = departments.filter(company_id=company_id)
+        return plan, departments
 
+    @cached_read
     def list(self, request):
         """List all departments with optional company filter"""
         try:
-            departments = self.get_queryset()
-            company_id = request.query_params.get("company", None)
-            if company_id:
-                departments = departments.filter(company_id=company_id)
+            plan, departments = self.list_query(request)
+            validators, not_modified = _conditional(
+                request,
+                departments,
+                related=self.list_related,
+                extra=_days_employed_key(departments, self.list_related),
+            )
+            if not_modified:
+                return not_modified
 
-            serializer = self.get_serializer(departments, many=True)
-            return CustomResponse(serializer.data, status=status.HTTP_200_OK)
+            departments = self.paginate_queryset(departments.values(*plan.columns))
+            response = CustomResponse(
+                plan.render(departments),
+                status=status.HTTP_200_OK,
+                pagination=self.paginator.get_pagination(),
+            )
+            return _set_validators(response, validators)
+        except (InvalidCursor, ValueError) as e:
+            return _bad_query_param(e)
         except Exception as e:
-            logger.error(f"Error listing departments: {str(e)}")
+            logger.error("Error listing departments: %s", e)
             return CustomResponse(
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 message=str(e),
             )
 
+    def detail_query(self, request, pk):
+        """
+        The retrieve action's validator models, queryset and serializer:
+        ``(related, queryset, serializer(instance))``
+        """
+        depth, employees_limit = _tree_params(request, max_depth=1, default_depth=0)
+        fields, expand = _sparse_params(
+            request, DepartmentDetailsSerializer.Meta.fields, self.expandable
+        )
+        if fields is not None and "employees" not in fields:
+            depth = 0
+        columns, relations = FastReadService.columns(
+            FastReadService.DEPARTMENT_FIELDS, fields, expand
+        )
+        queryset = Department.objects.select_related(*relations).only(*columns)
+        if depth >= 1:
+            queryset = queryset.with_employees(limit=employees_limit)
+        context = {
+            "request": request,
+            "fields": fields,
+            "expand": expand,
+            "include_employees": depth >= 1,
+        }
+        return (
+            (Company, Employee)[: depth + 1],
+            queryset,
+            lambda department: DepartmentDetailsSerializer(department, context=context),
+        )
+
+    @cached_read
     def retrieve(self, request, pk=None):
         """Retrieve a single department"""
         try:
+            related, _, serializer = self.detail_query(request, pk)
+            matching = _filter_or_404(Department.objects.all(), pk=pk)
+            validators, not_modified = _conditional(
+                request,
+                matching,
+                related=related,
+                extra=_days_employed_key(matching, related),
+            )
+            if not_modified:
+                return not_modified
+
             department = self.get_object()
-            serializer = DepartmentDetailsSerializer(department)
-            return CustomResponse(serializer.data, status=status.HTTP_200_OK)
-        except Department.DoesNotExist:
+            response = CustomResponse(
+                serializer(department).data, status=status.HTTP_200_OK
+            )
+            return _set_validators(response, validators)
+        except ValueError as e:
+            return CustomResponse(
+                message=str(e), status=status.HTTP_400_BAD_REQUEST
+            )
+        except (Department.DoesNotExist, Http404):
             return CustomResponse(
                 message="Department not found", status=status.HTTP_404_NOT_FOUND
             )
         except Exception as e:
-            logger.error(f"Error retrieving department: {str(e)}")
+            logger.error("Error retrieving department: %s", e)
             return CustomResponse(
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 message=str(e)
@@ -197,10 +633,10 @@ class DepartmentViewSet(viewsets.ModelViewSet):
             serializer = self.get_serializer(data=request.data)
             serializer.is_valid(raise_exception=True)
             serializer.save()
-            logger.info(f"Department created by {request.user.email}")
+            logger.info("Department created by %s", request.user.email)
             return CustomResponse(serializer.data, status=status.HTTP_201_CREATED)
         except Exception as e:
-            logger.error(f"Error creating department: {str(e)}")
+            logger.error("Error creating department: %s", e)
             return CustomResponse(message=str(e), status=status.HTTP_400_BAD_REQUEST)
 
     def update(self, request, pk=None):
@@ -210,14 +646,14 @@ class DepartmentViewSet(viewsets.ModelViewSet):
             serializer = self.get_serializer(department, data=request.data)
             serializer.is_valid(raise_exception=True)
             serializer.save()
-            logger.info(f"Department updated by {request.user.email}")
+            logger.info("Department updated by %s", request.user.email)
             return CustomResponse(serializer.data, status=status.HTTP_200_OK)
         except Department.DoesNotExist:
             return CustomResponse(
                 message="Department not found", status=status.HTTP_404_NOT_FOUND
             )
         except Exception as e:
-            logger.error(f"Error updating department: {str(e)}")
+            logger.error("Error updating department: %s", e)
             return CustomResponse(message=str(e), status=status.HTTP_400_BAD_REQUEST)
 
     def partial_update(self, request, pk=None):
@@ -229,14 +665,14 @@ class DepartmentViewSet(viewsets.ModelViewSet):
             )
             serializer.is_valid(raise_exception=True)
             serializer.save()
-            logger.info(f"Department partially updated by {request.user.email}")
+            logger.info("Department partially updated by %s", request.user.email)
             return CustomResponse(serializer.data, status=status.HTTP_200_OK)
         except Department.DoesNotExist:
             return CustomResponse(
                 message="Department not found", status=status.HTTP_404_NOT_FOUND
             )
         except Exception as e:
-            logger.error(f"Error updating department: {str(e)}")
+            logger.error("Error updating department: %s", e)
             return CustomResponse(message=str(e), status=status.HTTP_400_BAD_REQUEST)
 
     def destroy(self, request, pk=None):
@@ -247,7 +683,7 @@ class DepartmentViewSet(viewsets.ModelViewSet):
 
             department.delete()
 
-            logger.info(f"Department deleted by {request.user.email}: {department_name}")
+            logger.info("Department deleted by %s: %s", request.user.email, department_name)
             return CustomResponse(
                 message="Department deleted successfully",
                 status=status.HTTP_204_NO_CONTENT,
@@ -262,14 +698,14 @@ class DepartmentViewSet(viewsets.ModelViewSet):
                 message="Department not found", status=status.HTTP_404_NOT_FOUND
             )
         except Exception as e:
-            logger.error(f"Error deleting department: {str(e)}")
+            logger.error("Error deleting department: %s", e)
             return CustomResponse(
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR, message=str(e)
             )
 
 
 # Employee ViewSet
-class EmployeeViewSet(viewsets.ModelViewSet):
+class EmployeeViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
     """
     ViewSet for Employee CRUD operations
     GET: All authenticated users
@@ -279,48 +715,130 @@ class EmployeeViewSet(viewsets.ModelViewSet):
     queryset = Employee.objects.select_related("company", "department").all()
     serializer_class = EmployeeSerializer
     permission_classes = [EmployeePermission]
+    keyset_ordering = ("-created_at", "-id")
+    list_related = (Company, Department)
+    # ?q= results, best match first
+    search_ordering = ("search_rank", "-id")
+    response_cache = _response_cache("employees")
+    replica_actions = ("list", "retrieve", "report")
+    expandable = ("company", "department")
 
-    def list(self, request):
-        """List all employees with optional filters"""
-        try:
-            employees = self.get_queryset()
+    def get_keyset_ordering(self):
+        if self.request.query_params.get("q", "").strip():
+            return self.search_ordering
+        return self.keyset_ordering
 
-            # Filter by company
-            company_id = request.query_params.get("company", None)
-            if company_id:
-                employees = employees.filter(company_id=company_id)
+    def get_queryset(self):
+        if self.action == "retrieve":
+            return self.detail_query(self.request, self.kwargs["pk"])[1]
+        return super().get_queryset()
 
-            # Filter by department
-            department_id = request.query_params.get("department", None)
-            if department_id:
-                employees = employees.filter(department_id=department_id)
+    def list_query(self, request):
+        """The list action's ReadPlan and filtered queryset"""
+        query = request.query_params.get("q", "").strip()
+        plan = _list_plan(
+            request,
+            FastReadService.EMPLOYEE_FIELDS,
+            self.get_keyset_ordering(),
+            expandable=self.expandable,
+        )
+        employees = self.get_queryset()
+        if query:
+            employees = SearchService.search(employees, query)
 
-            # Filter by status
-            status_filter = request.query_params.get("status", None)
-            if status_filter:
-                employees = employees.filter(employee_status=status_filter)
+        # Filter by company
+        company_id = request.query_params.get("company", None)
+        if company_id:
+            employees = employees.filter(company_id=company_id)
 
-            serializer = self.get_serializer(employees, many=True)
-            return CustomResponse(serializer.data, status=status.HTTP_200_OK)
+        # Filter by department
+        department_id = request.query_params.get("department", None)
+        if department_id:
+            employees = employees.filter(department_id=department_id)
+
+        # Filter by status
+        status_filter = request.query_params.get("status", None)
+        if status_filter:
+            employees = employees.filter(employee_status=status_filter)
+        return plan, employees
+
+    @cached_read
+    def list(self, request):
+        """List all employees with optional filters and ?q= full-text search"""
+        try:
+            plan, employees = self.list_query(request)
+            validators, not_modified = _conditional(
+                request,
+                employees,
+                related=self.list_related,
+                extra=_days_employed_key(employees, self.list_related),
+            )
+            if not_modified:
+                return not_modified
+
+            employees = self.paginate_queryset(employees.values(*plan.columns))
+            response = CustomResponse(
+                plan.render(employees),
+                status=status.HTTP_200_OK,
+                pagination=self.paginator.get_pagination(),
+            )
+            return _set_validators(response, validators)
+        except (InvalidCursor, ValueError) as e:
+            return _bad_query_param(e)
         except Exception as e:
-            logger.error(f"Error listing employees: {str(e)}")
+            logger.error("Error listing employees: %s", e)
             return CustomResponse(
                 message="Failed to retrieve employees",
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    def detail_query(self, request, pk):
+        """
+        The retrieve action's validator models, queryset and serializer:
+        ``(related, queryset, serializer(instance))``
+        """
+        fields, expand = _sparse_params(
+            request, FastReadService.EMPLOYEE_FIELDS, self.expandable
+        )
+        columns, relations = FastReadService.columns(
+            FastReadService.EMPLOYEE_FIELDS, fields, expand
+        )
+        queryset = Employee.objects.select_related(*relations).only(*columns)
+        context = {**self.get_serializer_context(), "fields": fields, "expand": expand}
+        return (
+            (Company, Department),
+            queryset,
+            lambda employee: self.get_serializer(employee, context=context),
+        )
+
+    @cached_read
     def retrieve(self, request, pk=None):
         """Retrieve a single employee"""
         try:
+            related, _, serializer = self.detail_query(request, pk)
+            matching = _filter_or_404(Employee.objects.all(), pk=pk)
+            validators, not_modified = _conditional(
+                request,
+                matching,
+                related=related,
+                extra=_days_employed_key(matching, related),
+            )
+            if not_modified:
+                return not_modified
+
             employee = self.get_object()
-            serializer = self.get_serializer(employee)
-            return CustomResponse(serializer.data, status=status.HTTP_200_OK)
-        except Employee.DoesNotExist:
+            response = CustomResponse(serializer(employee).data, status=status.HTTP_200_OK)
+            return _set_validators(response, validators)
+        except ValueError as e:
+            return CustomResponse(
+                message=str(e), status=status.HTTP_400_BAD_REQUEST
+            )
+        except (Employee.DoesNotExist, Http404):
             return CustomResponse(
                 message="Employee not found", status=status.HTTP_404_NOT_FOUND
             )
         except Exception as e:
-            logger.error(f"Error retrieving employee: {str(e)}")
+            logger.error("Error retrieving employee: %s", e)
             return CustomResponse(
                 message=str(e),
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -332,10 +850,10 @@ class EmployeeViewSet(viewsets.ModelViewSet):
             serializer = self.get_serializer(data=request.data)
             serializer.is_valid(raise_exception=True)
             serializer.save()
-            logger.info(f"Employee created by {request.user.email}")
+            logger.info("Employee created by %s", request.user.email)
             return CustomResponse(serializer.data, status=status.HTTP_201_CREATED)
         except Exception as e:
-            logger.error(f"Error creating employee: {str(e)}")
+            logger.error("Error creating employee: %s", e)
             return CustomResponse(message=str(e), status=status.HTTP_400_BAD_REQUEST)
 
     def update(self, request, pk=None):
@@ -345,14 +863,14 @@ class EmployeeViewSet(viewsets.ModelViewSet):
             serializer = self.get_serializer(employee, data=request.data)
             serializer.is_valid(raise_exception=True)
             serializer.save()
-            logger.info(f"Employee updated by {request.user.email}")
+            logger.info("Employee updated by %s", request.user.email)
             return CustomResponse(serializer.data, status=status.HTTP_200_OK)
         except Employee.DoesNotExist:
             return CustomResponse(
                 message="Employee not found", status=status.HTTP_404_NOT_FOUND
             )
         except Exception as e:
-            logger.error(f"Error updating employee: {str(e)}")
+            logger.error("Error updating employee: %s", e)
             return CustomResponse(message=str(e), status=status.HTTP_400_BAD_REQUEST)
 
     def partial_update(self, request, pk=None):
@@ -362,14 +880,14 @@ class EmployeeViewSet(viewsets.ModelViewSet):
             serializer = self.get_serializer(employee, data=request.data, partial=True)
             serializer.is_valid(raise_exception=True)
             serializer.save()
-            logger.info(f"Employee partially updated by {request.user.email}")
+            logger.info("Employee partially updated by %s", request.user.email)
             return CustomResponse(serializer.data, status=status.HTTP_200_OK)
         except Employee.DoesNotExist:
             return CustomResponse(
                 message="Employee not found", status=status.HTTP_404_NOT_FOUND
             )
         except Exception as e:
-            logger.error(f"Error updating employee: {str(e)}")
+            logger.error("Error updating employee: %s", e)
             return CustomResponse(message= str(e), status=status.HTTP_400_BAD_REQUEST)
 
     def destroy(self, request, pk=None):
@@ -378,7 +896,7 @@ class EmployeeViewSet(viewsets.ModelViewSet):
             employee = self.get_object()
             employee_name = employee.employee_name
             employee.delete()
-            logger.info(f"Employee deleted by {request.user.email}: {employee_name}")
+            logger.info("Employee deleted by %s: %s", request.user.email, employee_name)
             return CustomResponse(
                 message="Employee deleted successfully",
                 status=status.HTTP_204_NO_CONTENT,
@@ -388,40 +906,470 @@ class EmployeeViewSet(viewsets.ModelViewSet):
                 message="Employee not found", status=status.HTTP_404_NOT_FOUND
             )
         except Exception as e:
-            logger.error(f"Error deleting employee: {str(e)}")
+            logger.error("Error deleting employee: %s", e)
             return CustomResponse(
                 message=str(e),
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-    @action(detail=False, methods=["get"])
+    @action(
+        detail=False,
+        methods=["get"],
+        renderer_classes=[
+            *api_settings.DEFAULT_RENDERER_CLASSES,
+            CSVRenderer,
+            NDJSONRenderer,
+        ],
+    )
     def report(self, request):
-        """Get report of all hired employees"""
+        """Get report of all hired employees (?format=csv|ndjson streams rows)"""
+        hired_employees = self.get_queryset().filter(employee_status="hired")
+        # days_employed is relative to today, so the validators roll daily
+        validators, not_modified = _conditional(
+            request,
+            hired_employees,
+            related=(Company, Department),
+            extra=date.today().isoformat(),
+        )
+        if not_modified:
+            return not_modified
+
+        export_format = request.accepted_renderer.format
+        if export_format in ("csv", "ndjson"):
+            response = self._stream_report(request, export_format)
+            return _set_validators(response, validators)
         try:
-            hired_employees = self.get_queryset().filter(employee_status="hired")
-            serializer = EmployeeReportSerializer(hired_employees, many=True)
-            logger.info(f"Employee report generated by {request.user.email}")
-            return CustomResponse(serializer.data, status=status.HTTP_200_OK)
+            data = FastReadService.report(hired_employees)
+            logger.info("Employee report generated by %s", request.user.email)
+            response = CustomResponse(data, status=status.HTTP_200_OK)
+            return _set_validators(response, validators)
         except Exception as e:
-            logger.error(f"Error generating employee report: {str(e)}")
+            logger.error("Error generating employee report: %s", e)
             return CustomResponse(
                 message=str(e),
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="bulk",
+        parser_classes=[*api_settings.DEFAULT_PARSER_CLASSES, MultiPartParser],
+    )
+    def bulk_import(self, request):
+        """
+        Import employees from a JSON array or an uploaded CSV ``file``
+        ?mode=atomic (default): reject everything if any row is invalid
+        ?mode=partial: insert the valid rows and report the rest
+        ?batch_size=: rows per INSERT
+        """
+        try:
+            mode = request.query_params.get("mode", "atomic")
+            if mode not in EmployeeImportService.MODES:
+                return CustomResponse(
+                    message=f"Unsupported mode: {mode}",
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            try:
+                batch_size = int(
+                    request.query_params.get(
+                        "batch_size", settings.EMPLOYEE_IMPORT_BATCH_SIZE
+                    )
+                )
+            except ValueError:
+                batch_size = 0
+            if batch_size < 1:
+                return CustomResponse(
+                    message="batch_size must be a positive integer",
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            if "file" in request.FILES:
+                rows = EmployeeImportService.parse_csv(request.FILES["file"])
+            else:
+                rows = request.data
+            if not isinstance(rows, list) or not rows:
+                return CustomResponse(
+                    message="Expected a non-empty list of employees or a CSV file",
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            if len(rows) > settings.EMPLOYEE_IMPORT_MAX_ROWS:
+                return CustomResponse(
+                    message=f"At most {settings.EMPLOYEE_IMPORT_MAX_ROWS} rows per import",
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            result = EmployeeImportService.import_rows(
+                rows, mode=mode, batch_size=batch_size
+            )
+            logger.info(
+                "Employees imported by %s: %s created, %s failed",
+                request.user.email,
+                result["created"],
+                result["failed"],
+            )
+            if not result["created"]:
+                return CustomResponse(
+                    result,
+                    message="Import rejected: no employees were created",
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            return CustomResponse(result, status=status.HTTP_201_CREATED)
+        except Exception as e:
+            logger.error("Error importing employees: %s", e)
+            return CustomResponse(message=str(e), status=status.HTTP_400_BAD_REQUEST)
+
+    @action(detail=False, methods=["post"])
+    def transition(self, request):
+        """Move a batch of employees to a new workflow status"""
+        try:
+            serializer = EmployeeTransitionSerializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            data = serializer.validated_data
+            employees = TransitionService.scope(
+                ids=data.get("ids"), filters=data.get("filter")
+            )
+            result = TransitionService.transition(
+                employees, data["employee_status"], hired_on=data.get("hired_on")
+            )
+            if "ids" in data:
+                found = set(result["moved"]) | {
+                    row["id"] for row in result["rejected"]
+                }
+                result["not_found"] = sorted(set(data["ids"]) - found)
+            logger.info(
+                "Bulk transition to %s by %s: %s moved, %s rejected",
+                data["employee_status"],
+                request.user.email,
+                len(result["moved"]),
+                len(result["rejected"]),
+            )
+            return CustomResponse(result, status=status.HTTP_200_OK)
+        except Exception as e:
+            logger.error("Error transitioning employees: %s", e)
+            return CustomResponse(message=str(e), status=status.HTTP_400_BAD_REQUEST)
+
+    def _stream_report(self, request, export_format):
+        """Stream the hired-employee report without building it in memory"""
+        # The rows are read after the view returns and its replica routing
+        # ends, so pin the queryset to the database chosen for this request
+        employees = Employee.objects.using(router.db_for_read(Employee))
+        if export_format == "csv":
+            rows = ReportService.stream_csv(employees)
+            content_type = CSVRenderer.media_type
+        else:
+            rows = ReportService.stream_ndjson(employees)
+            content_type = NDJSONRenderer.media_type
+        response = StreamingHttpResponse(rows, content_type=content_type)
+        response["Content-Disposition"] = (
+            f'attachment; filename="hired_employees.{export_format}"'
+        )
+        logger.info("Employee report exported as %s by %s", export_format, request.user.email)
+        return response
+
+
+def _dashboard_params(request):
+    """Parse ``?company=``, ``?department=`` and ``?breakdown=``"""
+    company_id = request.query_params.get("company") or None
+    department_id = request.query_params.get("department") or None
+    breakdown = request.query_params.get("breakdown") or None
+    if any(
+        value is not None and not value.isdigit()
+        for value in (company_id, department_id)
+    ):
+        raise ValueError("company and department must be numeric ids")
+    if breakdown is not None and breakdown not in DashboardService.BREAKDOWNS:
+        raise ValueError(f"Unsupported breakdown: {breakdown}")
+    return company_id, department_id, breakdown
+
 
 # Dashboard View (Bonus)
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
+@use_replica
 def dashboard_summary(request):
     """Get summary statistics for dashboard"""
     try:
-        data = DashboardService.get_summary()
-        logger.info(f"Dashboard accessed by {request.user.email}")
+        try:
+            company_id, department_id, breakdown = _dashboard_params(request)
+        except ValueError as e:
+            return CustomResponse(status=status.HTTP_400_BAD_REQUEST, message=str(e))
+
+        # One DataVersion read serves both the validators and the cache key
+        snapshot = DashboardService.cache.snapshot()
+        validators, not_modified = _conditional(
+            request, related=(Company, Department, Employee), snapshot=snapshot
+        )
+        if not_modified:
+            return not_modified
+
+        data = DashboardService.get_cached_summary(
+            company=company_id,
+            department=department_id,
+            breakdown=breakdown,
+            version=snapshot[0],
+        )
+        logger.info("Dashboard accessed by %s", request.user.email)
+        response = CustomResponse(data, status=status.HTTP_200_OK)
+        return _set_validators(response, validators)
+    except Exception as e:
+        logger.error("Error generating dashboard: %s", e)
+        return CustomResponse(
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            message=str(e)
+        )
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def form_options(request):
+    """Get company, department and status choices for form dropdowns"""
+    try:
+        snapshot = OptionsService.cache.snapshot()
+        validators, not_modified = _conditional(
+            request, related=(Company, Department), snapshot=snapshot
+        )
+        if not_modified:
+            return not_modified
+
+        data = OptionsService.get_cached_options(version=snapshot[0])
+        response = CustomResponse(data, status=status.HTTP_200_OK)
+        return _set_validators(response, validators)
+    except Exception as e:
+        logger.error("Error loading form options: %s", e)
+        return CustomResponse(
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            message=str(e)
+        )
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def lookup_names(request):
+    """Autocomplete company, department or employee names by prefix"""
+    try:
+        lookup_type = request.query_params.get("type")
+        if lookup_type not in LookupService.INDEXES:
+            return CustomResponse(
+                status=status.HTTP_400_BAD_REQUEST,
+                message=f"type must be one of: {', '.join(LookupService.INDEXES)}",
+            )
+        prefix = request.query_params.get("prefix", "").strip()
+        limit = request.query_params.get("limit") or "10"
+        filters = {
+            name: request.query_params[name]
+            for name in LookupService.INDEXES[lookup_type].extra
+            if request.query_params.get(name)
+        }
+        if not limit.isdigit() or not all(value.isdigit() for value in filters.values()):
+            return CustomResponse(
+                status=status.HTTP_400_BAD_REQUEST,
+                message="limit, company and department must be numeric",
+            )
+        data = LookupService.lookup(
+            lookup_type,
+            prefix,
+            limit=max(1, min(int(limit), 50)),
+            filters={name: int(value) for name, value in filters.items()},
+        )
         return CustomResponse(data, status=status.HTTP_200_OK)
     except Exception as e:
-        logger.error(f"Error generating dashboard: {str(e)}")
+        logger.error("Error looking up names: %s", e)
         return CustomResponse(
             status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             message=str(e)
         )
+
+
+@api_view(["GET"])
+@permission_classes([IsAdmin])
+def dashboard_cache_stats(request):
+    """Get dashboard cache hit/miss counters of this worker"""
+    return CustomResponse(DashboardService.cache.stats(), status=status.HTTP_200_OK)
+
+
+@api_view(["GET"])
+@permission_classes([IsAdmin])
+def response_cache_stats(request):
+    """Get response cache hit/miss counters of this worker, per viewset"""
+    caches = {
+        "companies": CompanyViewSet.response_cache,
+        "departments": DepartmentViewSet.response_cache,
+        "employees": EmployeeViewSet.response_cache,
+    }
+    data = {name: cache.stats() for name, cache in caches.items()}
+    hits = sum(stats["hits"] for stats in data.values())
+    total = hits + sum(stats["misses"] for stats in data.values())
+    data["enabled"] = settings.RESPONSE_CACHE_ENABLED
+    data["hit_ratio"] = round(hits / total, 4) if total else None
+    return CustomResponse(data, status=status.HTTP_200_OK)
+
+
+@api_view(["GET"])
+@permission_classes([IsAdmin])
+def log_queue_stats(request):
+    """Get logging queue fill and dropped record counters of this worker"""
+    data = {"queued": 0, "capacity": 0, "dropped": 0}
+    for handler in queue_handlers():
+        for key, value in handler.stats().items():
+            data[key] += value
+    return CustomResponse(data, status=status.HTTP_200_OK)
+
+
+# Async read endpoints (ASGI)
+class AsyncViewSetRead(ReplicaReadMixin, AsyncAPIView):
+    """
+    Async-native twin of one read action of ``viewset``: the same queries,
+    payload, validators and permission_classes, fetched through the async
+    ORM so that under ASGI a request only holds a thread while a query runs.
+    The response cache (RESPONSE_CACHE_ENABLED) is not consulted.
+    """
+
+    viewset = None
+    action = None
+    label = None
+
+    @property
+    def replica_actions(self):
+        return (self.action,)
+
+    def get_permissions(self):
+        return [permission() for permission in self.viewset.permission_classes]
+
+    def get_viewset(self, request):
+        return self.viewset(
+            request=request,
+            action=self.action,
+            format_kwarg=self.format_kwarg,
+            args=self.args,
+            kwargs=self.kwargs,
+        )
+
+
+class AsyncListView(AsyncViewSetRead):
+    action = "list"
+
+    async def get(self, request):
+        viewset = self.get_viewset(request)
+        try:
+            plan, queryset = viewset.list_query(request)
+            validators, not_modified = await _aconditional(
+                request,
+                queryset,
+                related=viewset.list_related,
+                extra=_days_employed_key(queryset, viewset.list_related),
+            )
+            if not_modified:
+                return not_modified
+
+            rows = await viewset.paginator.apaginate_queryset(
+                queryset.values(*plan.columns), request, view=viewset
+            )
+            response = CustomResponse(
+                plan.render(rows),
+                status=status.HTTP_200_OK,
+                pagination=viewset.paginator.get_pagination(),
+            )
+            return _set_validators(response, validators)
+        except (InvalidCursor, ValueError) as e:
+            return _bad_query_param(e)
+        except Exception as e:
+            logger.error("Error listing %s: %s", self.label, e)
+            return CustomResponse(
+                message=f"Failed to retrieve {self.label}",
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+
+class AsyncDetailView(AsyncViewSetRead):
+    action = "retrieve"
+
+    async def get(self, request, pk):
+        viewset = self.get_viewset(request)
+        model = viewset.queryset.model
+        try:
+            related, queryset, serializer = viewset.detail_query(request, pk)
+            matching = model.objects.filter(pk=pk)
+            validators, not_modified = await _aconditional(
+                request,
+                matching,
+                related=related,
+                extra=_days_employed_key(matching, related),
+            )
+            if not_modified:
+                return not_modified
+
+            instance = await queryset.aget(pk=pk)
+            response = CustomResponse(serializer(instance).data, status=status.HTTP_200_OK)
+            return _set_validators(response, validators)
+        except ValueError as e:
+            return CustomResponse(message=str(e), status=status.HTTP_400_BAD_REQUEST)
+        except model.DoesNotExist:
+            return CustomResponse(
+                message=f"{self.label} not found", status=status.HTTP_404_NOT_FOUND
+            )
+        except Exception as e:
+            logger.error("Error retrieving %s: %s", self.label.lower(), e)
+            return CustomResponse(
+                message=str(e), status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class AsyncCompanyList(AsyncListView):
+    viewset, label = CompanyViewSet, "companies"
+
+
+class AsyncCompanyDetail(AsyncDetailView):
+    viewset, label = CompanyViewSet, "Company"
+
+
+class AsyncDepartmentList(AsyncListView):
+    viewset, label = DepartmentViewSet, "departments"
+
+
+class AsyncDepartmentDetail(AsyncDetailView):
+    viewset, label = DepartmentViewSet, "Department"
+
+
+class AsyncEmployeeList(AsyncListView):
+    viewset, label = EmployeeViewSet, "employees"
+
+
+class AsyncEmployeeDetail(AsyncDetailView):
+    viewset, label = EmployeeViewSet, "Employee"
+
+
+class AsyncDashboardSummary(ReplicaReadMixin, AsyncAPIView):
+    """``dashboard_summary`` through the async ORM"""
+
+    permission_classes = [IsAuthenticated]
+    action = "summary"
+    replica_actions = ("summary",)
+
+    async def get(self, request):
+        try:
+            try:
+                company_id, department_id, breakdown = _dashboard_params(request)
+            except ValueError as e:
+                return CustomResponse(status=status.HTTP_400_BAD_REQUEST, message=str(e))
+
+            snapshot = await DashboardService.cache.asnapshot()
+            validators, not_modified = await _aconditional(
+                request, related=(Company, Department, Employee), snapshot=snapshot
+            )
+            if not_modified:
+                return not_modified
+
+            data = await DashboardService.aget_cached_summary(
+                company=company_id,
+                department=department_id,
+                breakdown=breakdown,
+                version=snapshot[0],
+            )
+            response = CustomResponse(data, status=status.HTTP_200_OK)
+            return _set_validators(response, validators)
+        except Exception as e:
+            logger.error("Error generating dashboard: %s", e)
+            return CustomResponse(
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR, message=str(e)
+            )
@@ -3,20 +3,21 @@
 import { useEffect, useState } from "react";
 import { useParams, useRouter } from "next/navigation";
 
-import { companyAPI } from "@/lib/api";
+import { companyAPI, departmentAPI, handleAPIError } from "@/lib/api";
 import { CompanyDetails } from "@/types";
 
 import { Tabs, TabsContent, TabsList, TabsTrigger } from "@/components/ui/tabs";
 import { Card, CardContent } from "@/components/ui/card";
 import { EmployeesTable } from "@/components/EmployeesTable";
-import { Pagination } from "@/components/Pagination";
+import { CursorPagination } from "@/components/CursorPagination";
 import { Stat } from "@/components/Stats";
 import { Button } from "@/components/ui/button";
 
 import { Building2, Users, Layers, Timer, ArrowLeft } from "lucide-react";
+import { toast } from "sonner";
 
 import { formatDate } from "@/lib/utils";
-import { usePagination } from "@/app/hooks/usePagination";
+import { useCursorPage } from "@/app/hooks/useCursorPage";
 
 const PAGE_SIZE = 10;
 
@@ -26,7 +27,6 @@ const Page = () => {
 
   const [data, setData] = useState<CompanyDetails | null>(null);
   const [activeDeptId, setActiveDeptId] = useState<string | null>(null);
-  const [page, setPage] = useState(1);
 
   useEffect(() => {
     if (!id) return;
@@ -34,19 +34,18 @@ const Page = () => {
     companyAPI.getById(Number(id)).then((res) => {
       setData(res);
       setActiveDeptId(res.departments[0]?.id.toString() ?? null);
-      setPage(1);
     });
   }, [id]);
 
   const activeDepartment =
     data?.departments.find((d) => d.id.toString() === activeDeptId) ?? null;
 
-  const employees = activeDepartment?.employees ?? [];
-
-  const { paginatedData, totalItems } = usePagination(
-    employees,
-    page,
-    PAGE_SIZE
+  // Only the open tab's employees, one page at a time
+  const employeePage = useCursorPage(
+    (params) => departmentAPI.getEmployees(Number(activeDeptId), params),
+    activeDeptId,
+    PAGE_SIZE,
+    (error) => toast.error(handleAPIError(error))
   );
 
   if (!data) {
@@ -119,10 +118,7 @@ const Page = () => {
 
         <Tabs
           value={activeDeptId ?? ""}
-          onValueChange={(value) => {
-            setActiveDeptId(value);
-            setPage(1); // reset pagination on tab change
-          }}
+          onValueChange={setActiveDeptId}
           className="w-full"
         >
           {/* Tabs Header */}
@@ -150,18 +146,26 @@ const Page = () => {
             >
               <Card className="p-0">
                 <CardContent className="p-0">
-                  {dept.employees.length > 0 ? (
+                  {employeePage.loading ? (
+                    <div className="flex justify-center py-20">
+                      <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-primary" />
+                    </div>
+                  ) : employeePage.items.length > 0 ? (
                     <>
                       <EmployeesTable
-                        employees={paginatedData}
+                        employees={employeePage.items}
                         onView={(emp) => router.push(`/employees/${emp.id}`)}
                       />
 
-                      <Pagination
-                        page={page}
+                      <CursorPagination
+                        page={employeePage.page}
                         pageSize={PAGE_SIZE}
-                        totalItems={totalItems}
-                        onPageChange={setPage}
+                        itemCount={employeePage.items.length}
+                        totalItems={activeDepartment?.number_of_employees}
+                        hasNext={employeePage.hasNext}
+                        hasPrevious={employeePage.hasPrevious}
+                        onNext={employeePage.next}
+                        onPrevious={employeePage.previous}
                         className="p-4"
                       />
                     </>
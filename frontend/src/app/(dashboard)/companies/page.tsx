@@ -1,6 +1,6 @@
 "use client";
 
-import { useEffect, useState } from "react";
+import { useState } from "react";
 import { useRouter } from "next/navigation";
 import { Company } from "@/types";
 import { companyAPI, handleAPIError } from "@/lib/api";
@@ -29,13 +29,22 @@ import {
 } from "@/components/ui/alert-dialog";
 import { toast } from "sonner";
 import { CompanyModal } from "@/components/modals/CompanyModal";
+import { CursorPagination } from "@/components/CursorPagination";
+import { useCursorPage } from "@/app/hooks/useCursorPage";
+
+const PAGE_SIZE = 24;
 
 export default function CompaniesPage() {
   const router = useRouter();
   const { user } = useAuthStore();
 
-  const [companies, setCompanies] = useState<Company[]>([]);
-  const [loading, setLoading] = useState(true);
+  const companyPage = useCursorPage(
+    companyAPI.getAll,
+    "companies",
+    PAGE_SIZE,
+    (error) => toast.error(handleAPIError(error))
+  );
+  const companies = companyPage.items;
   const [deleteId, setDeleteId] = useState<number | null>(null);
   const [deleting, setDeleting] = useState(false);
 
@@ -44,21 +53,6 @@ export default function CompaniesPage() {
   const [modalMode, setModalMode] = useState<"create" | "edit">("create");
   const [selectedCompany, setSelectedCompany] = useState<Company | null>(null);
 
-  useEffect(() => {
-    fetchCompanies();
-  }, []);
-
-  const fetchCompanies = async () => {
-    try {
-      const data = await companyAPI.getAll();
-      setCompanies(data);
-    } catch (error) {
-      toast.error(handleAPIError(error));
-    } finally {
-      setLoading(false);
-    }
-  };
-
   const handleDelete = async () => {
     if (!deleteId) return;
 
@@ -66,7 +60,7 @@ export default function CompaniesPage() {
     try {
       await companyAPI.delete(deleteId);
       toast.error("Company deleted successfully");
-      fetchCompanies();
+      companyPage.reload();
     } catch (error) {
       toast.error(handleAPIError(error));
     } finally {
@@ -88,7 +82,7 @@ export default function CompaniesPage() {
   };
 
   const handleModalSuccess = () => {
-    fetchCompanies();
+    companyPage.reload();
     toast.success(
       modalMode === "create"
         ? "Company created successfully"
@@ -96,7 +90,7 @@ export default function CompaniesPage() {
     );
   };
 
-  if (loading) {
+  if (companyPage.loading && companies.length === 0) {
     return (
       <div>
         <div className="flex justify-between items-center mb-8">
@@ -221,6 +215,17 @@ export default function CompaniesPage() {
         </div>
       )}
 
+      <CursorPagination
+        page={companyPage.page}
+        pageSize={PAGE_SIZE}
+        itemCount={companies.length}
+        hasNext={companyPage.hasNext}
+        hasPrevious={companyPage.hasPrevious}
+        onNext={companyPage.next}
+        onPrevious={companyPage.previous}
+        className="mt-6"
+      />
+
       <CompanyModal
         open={modalOpen}
         onOpenChange={setModalOpen}
@@ -1,7 +1,7 @@
 "use client";
 
-import { departmentAPI } from "@/lib/api";
-import { DepartmentDetails } from "@/types";
+import { departmentAPI, handleAPIError } from "@/lib/api";
+import { Department } from "@/types";
 import { useEffect, useState } from "react";
 import { useParams, useRouter } from "next/navigation";
 
@@ -9,38 +9,34 @@ import { Card, CardContent } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 
 import { ArrowLeft, Briefcase, Building2, Timer, Users } from "lucide-react";
+import { toast } from "sonner";
 
 import { formatDate } from "@/lib/utils";
 import { EmployeesTable } from "@/components/EmployeesTable";
 import { Stat } from "@/components/Stats";
 
-import { Pagination } from "@/components/Pagination";
-import { usePagination } from "@/app/hooks/usePagination";
+import { CursorPagination } from "@/components/CursorPagination";
+import { useCursorPage } from "@/app/hooks/useCursorPage";
 
 const Page = () => {
   const { id } = useParams<{ id: string }>();
   const router = useRouter();
 
-  const [data, setData] = useState<DepartmentDetails | null>(null);
+  const [data, setData] = useState<Department | null>(null);
 
-  const [page, setPage] = useState(1);
   const pageSize = 10;
 
   useEffect(() => {
     if (!id) return;
 
-    departmentAPI.getById(Number(id)).then((response) => {
-      setData(response as DepartmentDetails);
-      setPage(1); // reset page on load
-    });
+    departmentAPI.getById(Number(id)).then(setData);
   }, [id]);
 
-  const employees = data?.employees ?? [];
-
-  const { paginatedData, totalItems } = usePagination(
-    employees,
-    page,
-    pageSize
+  const employeePage = useCursorPage(
+    (params) => departmentAPI.getEmployees(Number(id), params),
+    id ?? null,
+    pageSize,
+    (error) => toast.error(handleAPIError(error))
   );
 
   if (!data) {
@@ -115,19 +111,27 @@ const Page = () => {
 
         <Card className="p-0">
           <CardContent className="p-0">
-            {employees.length > 0 ? (
+            {employeePage.loading ? (
+              <div className="flex justify-center py-20">
+                <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-primary"></div>
+              </div>
+            ) : employeePage.items.length > 0 ? (
               <>
                 <EmployeesTable
-                  employees={paginatedData}
+                  employees={employeePage.items}
                   onView={(emp) => router.push(`/employees/${emp.id}`)}
                 />
 
                 {/* Pagination */}
-                <Pagination
-                  page={page}
+                <CursorPagination
+                  page={employeePage.page}
                   pageSize={pageSize}
-                  totalItems={totalItems}
-                  onPageChange={setPage}
+                  itemCount={employeePage.items.length}
+                  totalItems={data.number_of_employees}
+                  hasNext={employeePage.hasNext}
+                  hasPrevious={employeePage.hasPrevious}
+                  onNext={employeePage.next}
+                  onPrevious={employeePage.previous}
                   className="p-4"
                 />
               </>
@@ -2,8 +2,8 @@
 
 import { useEffect, useState } from "react";
 import { useRouter, useSearchParams } from "next/navigation";
-import { Department, Company } from "@/types";
-import { departmentAPI, companyAPI, handleAPIError } from "@/lib/api";
+import { Department, CompanyOption } from "@/types";
+import { departmentAPI, optionsAPI, handleAPIError } from "@/lib/api";
 import { useAuthStore } from "@/store/authStore";
 import { Button } from "@/components/ui/button";
 import { Card, CardContent } from "@/components/ui/card";
@@ -36,15 +36,17 @@ import {
 } from "@/components/ui/alert-dialog";
 import { toast } from "sonner";
 import { DepartmentModal } from "@/components/modals/DepartmentModal";
+import { CursorPagination } from "@/components/CursorPagination";
+import { useCursorPage } from "@/app/hooks/useCursorPage";
+
+const PAGE_SIZE = 24;
 
 export default function DepartmentsPage() {
   const router = useRouter();
   const searchParams = useSearchParams();
   const { user } = useAuthStore();
 
-  const [departments, setDepartments] = useState<Department[]>([]);
-  const [companies, setCompanies] = useState<Company[]>([]);
-  const [loading, setLoading] = useState(true);
+  const [companies, setCompanies] = useState<CompanyOption[]>([]);
   const [deleteId, setDeleteId] = useState<number | null>(null);
   const [deleting, setDeleting] = useState(false);
   const [companyFilter, setCompanyFilter] = useState<string>("");
@@ -55,31 +57,33 @@ export default function DepartmentsPage() {
 
   const canEdit = user?.role === "admin" || user?.role === "manager";
 
+  const companyId = searchParams.get("company");
+
   useEffect(() => {
-    const companyId = searchParams.get("company");
     if (companyId) {
       setCompanyFilter(companyId);
     }
-    fetchData();
-  }, [searchParams]);
+  }, [companyId]);
 
-  const fetchData = async () => {
-    try {
-      const companyId = searchParams.get("company");
-      const filters = companyId ? { company: parseInt(companyId) } : undefined;
+  useEffect(() => {
+    optionsAPI
+      .get()
+      .then((options) => setCompanies(options.companies))
+      .catch((error) => toast.error(handleAPIError(error)));
+  }, []);
 
-      const [deptData, compData] = await Promise.all([
-        departmentAPI.getAll(filters),
-        companyAPI.getAll(),
-      ]);
-      setDepartments(deptData);
-      setCompanies(compData);
-    } catch (error) {
-      toast.error(handleAPIError(error));
-    } finally {
-      setLoading(false);
-    }
-  };
+  // One page of the (filtered) departments, starting over when the filter changes
+  const departmentPage = useCursorPage(
+    (params) =>
+      departmentAPI.getAll(
+        companyId ? { company: parseInt(companyId) } : undefined,
+        params
+      ),
+    companyId ?? "all",
+    PAGE_SIZE,
+    (error) => toast.error(handleAPIError(error))
+  );
+  const departments = departmentPage.items;
 
   const handleDelete = async () => {
     if (!deleteId) return;
@@ -88,7 +92,7 @@ export default function DepartmentsPage() {
     try {
       await departmentAPI.delete(deleteId);
       toast.success("Department deleted successfully");
-      fetchData();
+      departmentPage.reload();
     } catch (error) {
       toast.error(handleAPIError(error));
     } finally {
@@ -119,7 +123,7 @@ export default function DepartmentsPage() {
   };
 
   const handleModalSuccess = () => {
-    fetchData();
+    departmentPage.reload();
     toast.success(
       modalMode === "create"
         ? "Department created successfully"
@@ -127,7 +131,7 @@ export default function DepartmentsPage() {
     );
   };
 
-  if (loading) {
+  if (departmentPage.loading && departments.length === 0) {
     return (
       <div>
         <div className="flex justify-between items-center mb-8">
@@ -274,6 +278,17 @@ export default function DepartmentsPage() {
         </div>
       )}
 
+      <CursorPagination
+        page={departmentPage.page}
+        pageSize={PAGE_SIZE}
+        itemCount={departments.length}
+        hasNext={departmentPage.hasNext}
+        hasPrevious={departmentPage.hasPrevious}
+        onNext={departmentPage.next}
+        onPrevious={departmentPage.previous}
+        className="mt-6"
+      />
+
       <DepartmentModal
         open={modalOpen}
         onOpenChange={setModalOpen}
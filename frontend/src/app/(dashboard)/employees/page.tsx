@@ -3,13 +3,8 @@
 import { useEffect, useState } from "react";
 import { useRouter } from "next/navigation";
 
-import { Employee, EmployeeFilters } from "@/types";
-import {
-  employeeAPI,
-  handleAPIError,
-  companyAPI,
-  departmentAPI,
-} from "@/lib/api";
+import { CompanyOption, DepartmentOption, Employee, EmployeeFilters } from "@/types";
+import { employeeAPI, handleAPIError, optionsAPI } from "@/lib/api";
 
 import { useAuthStore } from "@/store/authStore";
 
@@ -39,27 +34,25 @@ import {
 
 import { EmployeesTable } from "@/components/EmployeesTable";
 import { EmployeeModal } from "@/components/modals/EmployeeModal";
-import { Pagination } from "@/components/Pagination";
+import { CursorPagination } from "@/components/CursorPagination";
 
 import { Plus, Search, Users } from "lucide-react";
 import { toast } from "sonner";
-import { usePagination } from "@/app/hooks/usePagination";
+import { useCursorPage } from "@/app/hooks/useCursorPage";
+
+const PAGE_SIZE = 10;
 
 export default function EmployeesPage() {
   const router = useRouter();
   const { user } = useAuthStore();
   const canEdit = user?.role === "admin" || user?.role === "manager";
 
-  const [employees, setEmployees] = useState<Employee[]>([]);
-  const [filteredEmployees, setFilteredEmployees] = useState<Employee[]>([]);
-
-  const [companies, setCompanies] = useState<any[]>([]);
-  const [departments, setDepartments] = useState<any[]>([]);
+  const [companies, setCompanies] = useState<CompanyOption[]>([]);
+  const [departments, setDepartments] = useState<DepartmentOption[]>([]);
 
   const [filters, setFilters] = useState<EmployeeFilters>({});
   const [search, setSearch] = useState("");
-
-  const [loading, setLoading] = useState(true);
+  const [query, setQuery] = useState("");
 
   const [deleteId, setDeleteId] = useState<number | null>(null);
   const [deleting, setDeleting] = useState(false);
@@ -70,67 +63,30 @@ export default function EmployeesPage() {
     null
   );
 
-  const [page, setPage] = useState(1);
-  const pageSize = 10;
-
   useEffect(() => {
-    const loadStaticData = async () => {
-      try {
-        const [companiesData, departmentsData] = await Promise.all([
-          companyAPI.getAll(),
-          departmentAPI.getAll(),
-        ]);
-        setCompanies(companiesData);
-        setDepartments(departmentsData);
-      } catch (error) {
-        toast.error(handleAPIError(error));
-      }
-    };
-    loadStaticData();
+    optionsAPI
+      .get()
+      .then((options) => {
+        setCompanies(options.companies);
+        setDepartments(options.departments);
+      })
+      .catch((error) => toast.error(handleAPIError(error)));
   }, []);
 
-  const fetchEmployees = async () => {
-    setLoading(true);
-    try {
-      const data = await employeeAPI.getAll(filters);
-      setEmployees(data);
-      setFilteredEmployees(data);
-    } catch (error) {
-      toast.error(handleAPIError(error));
-    } finally {
-      setLoading(false);
-    }
-  };
-
-  useEffect(() => {
-    fetchEmployees();
-  }, [filters]);
-
-  useEffect(() => {
-    if (!search) {
-      setFilteredEmployees(employees);
-      return;
-    }
-
-    const filtered = employees.filter(
-      (emp) =>
-        emp.employee_name.toLowerCase().includes(search.toLowerCase()) ||
-        emp.email_address.toLowerCase().includes(search.toLowerCase()) ||
-        emp.designation.toLowerCase().includes(search.toLowerCase())
-    );
-
-    setFilteredEmployees(filtered);
-  }, [search, employees]);
-
+  // Search on the server once typing pauses, not on every keystroke
   useEffect(() => {
-    setPage(1);
-  }, [search, filters]);
-
-  const { paginatedData, totalItems } = usePagination(
-    filteredEmployees,
-    page,
-    pageSize
+    const timeout = setTimeout(() => setQuery(search.trim()), 300);
+    return () => clearTimeout(timeout);
+  }, [search]);
+
+  // One page of the filtered employees, starting over when a filter changes
+  const employeePage = useCursorPage(
+    (params) => employeeAPI.getAll({ ...filters, q: query || undefined }, params),
+    JSON.stringify({ ...filters, query }),
+    PAGE_SIZE,
+    (error) => toast.error(handleAPIError(error))
   );
+  const employees = employeePage.items;
 
   const clearFilters = () => {
     setFilters({});
@@ -144,8 +100,7 @@ export default function EmployeesPage() {
     try {
       await employeeAPI.delete(deleteId);
       toast.success("Employee deleted successfully");
-      fetchEmployees();
-      setPage(1);
+      employeePage.reload();
     } catch (error) {
       toast.error(handleAPIError(error));
     } finally {
@@ -167,7 +122,7 @@ export default function EmployeesPage() {
   };
 
   const onModalSuccess = () => {
-    fetchEmployees();
+    employeePage.reload();
     toast.success(
       modalMode === "create"
         ? "Employee created successfully"
@@ -175,7 +130,9 @@ export default function EmployeesPage() {
     );
   };
 
-  if (loading) {
+  // Skeleton on the first load only, filtering keeps the controls mounted
+  const filtering = Boolean(query) || Object.values(filters).some(Boolean);
+  if (employeePage.loading && employees.length === 0 && !filtering) {
     return (
       <div>
         <Skeleton className="h-8 w-48 mb-8" />
@@ -300,7 +257,7 @@ export default function EmployeesPage() {
       </Card>
 
       {/* Table */}
-      {paginatedData.length === 0 ? (
+      {employees.length === 0 ? (
         <Card>
           <CardContent className="flex flex-col items-center py-16">
             <Users className="h-14 w-14 text-muted-foreground mb-4" />
@@ -314,7 +271,7 @@ export default function EmployeesPage() {
         <Card className="p-0">
           <CardContent className="p-0">
             <EmployeesTable
-              employees={paginatedData}
+              employees={employees}
               canEdit={canEdit}
               onView={(emp) => router.push(`/employees/${emp.id}`)}
               onEdit={openEditModal}
@@ -325,11 +282,14 @@ export default function EmployeesPage() {
       )}
 
       {/* Pagination */}
-      <Pagination
-        page={page}
-        pageSize={pageSize}
-        totalItems={totalItems}
-        onPageChange={setPage}
+      <CursorPagination
+        page={employeePage.page}
+        pageSize={PAGE_SIZE}
+        itemCount={employees.length}
+        hasNext={employeePage.hasNext}
+        hasPrevious={employeePage.hasPrevious}
+        onNext={employeePage.next}
+        onPrevious={employeePage.previous}
         className="mt-2"
       />
 
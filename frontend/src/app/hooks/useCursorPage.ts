@@ -0,0 +1,75 @@
+import { useEffect, useRef, useState } from "react";
+
+import { Page, PaginationParams } from "@/types";
+
+interface Position {
+  key: string | null;
+  cursor?: string;
+  page: number;
+}
+
+/**
+ * Loads one keyset page at a time from a list endpoint and follows its
+ * next/previous cursors. A new `key` (another parent or filter set) starts
+ * again from the first page; a `null` key loads nothing.
+ */
+export function useCursorPage<T>(
+  fetchPage: (params: PaginationParams) => Promise<Page<T>>,
+  key: string | null,
+  pageSize: number,
+  onError?: (error: unknown) => void
+) {
+  const fetchRef = useRef(fetchPage);
+  const errorRef = useRef(onError);
+  fetchRef.current = fetchPage;
+  errorRef.current = onError;
+
+  const [position, setPosition] = useState<Position>({ key, page: 1 });
+  const [data, setData] = useState<Page<T> | null>(null);
+  const [loading, setLoading] = useState(key !== null);
+  const [version, setVersion] = useState(0);
+
+  const current: Position = position.key === key ? position : { key, page: 1 };
+
+  useEffect(() => {
+    if (key === null) {
+      setData(null);
+      setLoading(false);
+      return;
+    }
+
+    let cancelled = false;
+    setLoading(true);
+    fetchRef
+      .current({ cursor: current.cursor, page_size: pageSize })
+      .then((result) => {
+        if (!cancelled) setData(result);
+      })
+      .catch((error) => {
+        if (!cancelled) errorRef.current?.(error);
+      })
+      .finally(() => {
+        if (!cancelled) setLoading(false);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [key, current.cursor, pageSize, version]);
+
+  const pagination = data?.pagination ?? null;
+  const goTo = (cursor: string | null | undefined, page: number) => {
+    if (cursor) setPosition({ key, cursor, page });
+  };
+
+  return {
+    items: data?.results ?? [],
+    loading,
+    page: current.page,
+    pageSize,
+    hasNext: Boolean(pagination?.next_cursor),
+    hasPrevious: Boolean(pagination?.previous_cursor),
+    next: () => goTo(pagination?.next_cursor, current.page + 1),
+    previous: () => goTo(pagination?.previous_cursor, current.page - 1),
+    reload: () => setVersion((value) => value + 1),
+  };
+}
@@ -0,0 +1,62 @@
+import { Button } from "@/components/ui/button";
+
+interface CursorPaginationProps {
+  page: number;
+  pageSize: number;
+  itemCount: number;
+  totalItems?: number;
+  hasNext: boolean;
+  hasPrevious: boolean;
+  onNext: () => void;
+  onPrevious: () => void;
+  className?: string;
+}
+
+// Previous/Next controls for keyset-paginated lists, which only know the
+// neighbouring pages (and the total when the caller has a counter)
+export function CursorPagination({
+  page,
+  pageSize,
+  itemCount,
+  totalItems,
+  hasNext,
+  hasPrevious,
+  onNext,
+  onPrevious,
+  className = "",
+}: CursorPaginationProps) {
+  if (!hasNext && !hasPrevious) return null;
+
+  const start = (page - 1) * pageSize + 1;
+  const end = start + itemCount - 1;
+
+  return (
+    <div className={`flex items-center justify-between ${className}`}>
+      <p className="text-sm text-muted-foreground">
+        {itemCount > 0
+          ? `Showing ${start}–${end}${totalItems !== undefined ? ` of ${totalItems}` : ""}`
+          : `Page ${page}`}
+      </p>
+
+      <div className="flex gap-2">
+        <Button
+          variant="outline"
+          size="sm"
+          disabled={!hasPrevious}
+          onClick={onPrevious}
+        >
+          Previous
+        </Button>
+
+        <Button
+          variant="outline"
+          size="sm"
+          disabled={!hasNext}
+          onClick={onNext}
+        >
+          Next
+        </Button>
+      </div>
+    </div>
+  );
+}
@@ -1,8 +1,8 @@
 "use client";
 
 import { useState, useEffect } from "react";
-import { Company, Department, DepartmentFormData } from "@/types";
-import { companyAPI, departmentAPI, handleAPIError } from "@/lib/api";
+import { CompanyOption, Department, DepartmentFormData } from "@/types";
+import { departmentAPI, optionsAPI, handleAPIError } from "@/lib/api";
 
 import {
   Dialog,
@@ -47,7 +47,7 @@ export function DepartmentModal({
   const [loading, setLoading] = useState(false);
   const [loadingData, setLoadingData] = useState(true);
   const [error, setError] = useState("");
-  const [companies, setCompanies] = useState<Company[]>([]);
+  const [companies, setCompanies] = useState<CompanyOption[]>([]);
 
   const [formData, setFormData] = useState<DepartmentFormData>({
     company: preselectedCompanyId ?? 0,
@@ -61,8 +61,8 @@ export function DepartmentModal({
 
   const fetchCompanies = async () => {
     try {
-      const data = await companyAPI.getAll();
-      setCompanies(data);
+      const options = await optionsAPI.get();
+      setCompanies(options.companies);
     } catch (err) {
       setError(handleAPIError(err));
     } finally {
@@ -1,13 +1,13 @@
 "use client";
 
 import { useState, useEffect } from "react";
-import { Employee, EmployeeFormData, Company, Department } from "@/types";
 import {
-  employeeAPI,
-  companyAPI,
-  departmentAPI,
-  handleAPIError,
-} from "@/lib/api";
+  Employee,
+  EmployeeFormData,
+  CompanyOption,
+  DepartmentOption,
+} from "@/types";
+import { employeeAPI, optionsAPI, handleAPIError } from "@/lib/api";
 import {
   Dialog,
   DialogContent,
@@ -59,11 +59,11 @@ export function EmployeeModal({
   const [loading, setLoading] = useState(false);
   const [loadingData, setLoadingData] = useState(true);
   const [error, setError] = useState("");
-  const [companies, setCompanies] = useState<Company[]>([]);
-  const [allDepartments, setAllDepartments] = useState<Department[]>([]);
-  const [filteredDepartments, setFilteredDepartments] = useState<Department[]>(
-    []
-  );
+  const [companies, setCompanies] = useState<CompanyOption[]>([]);
+  const [allDepartments, setAllDepartments] = useState<DepartmentOption[]>([]);
+  const [filteredDepartments, setFilteredDepartments] = useState<
+    DepartmentOption[]
+  >([]);
 
   const [formData, setFormData] = useState<EmployeeFormData>({
     company: 0,
@@ -135,12 +135,9 @@ export function EmployeeModal({
 
   const fetchData = async () => {
     try {
-      const [companiesData, departmentsData] = await Promise.all([
-        companyAPI.getAll(),
-        departmentAPI.getAll(),
-      ]);
-      setCompanies(companiesData);
-      setAllDepartments(departmentsData);
+      const options = await optionsAPI.get();
+      setCompanies(options.companies);
+      setAllDepartments(options.departments);
     } catch (err) {
       setError(handleAPIError(err));
     } finally {
@@ -1,4 +1,4 @@
-import axios, { AxiosError, AxiosInstance, InternalAxiosRequestConfig } from 'axios';
+import axios, { AxiosError, AxiosInstance, AxiosResponse, InternalAxiosRequestConfig } from 'axios';
 import { 
   User, LoginRequest, RegisterRequest, AuthResponse,
   Company, CompanyFormData,
@@ -8,10 +8,16 @@ import {
   UpdateRequest,
   ChangePasswordData,
   CompanyDetails,
+  FormOptions, FormOptionsResponse,
+  Page, PaginationInfo, PaginationParams,
 } from '@/types';
 
 const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
 
+// Signed token the backend returns after a write; echoing it back keeps this
+// user's reads on the primary database for a few seconds
+const PIN_HEADER = 'X-DB-Primary-Pin';
+
 // Create axios instance
 const apiClient: AxiosInstance = axios.create({
   baseURL: API_BASE_URL,
@@ -28,6 +34,10 @@ apiClient.interceptors.request.use(
       if (token && config.headers) {
         config.headers.Authorization = `Bearer ${token}`;
       }
+      const pin = sessionStorage.getItem('db_primary_pin');
+      if (pin && config.headers) {
+        config.headers[PIN_HEADER] = pin;
+      }
     }
     return config;
   },
@@ -39,6 +49,11 @@ apiClient.interceptors.request.use(
 // Response interceptor to handle new response structure and errors
 apiClient.interceptors.response.use(
   (response) => {
+    const pin = response.headers?.[PIN_HEADER.toLowerCase()];
+    if (pin && typeof window !== 'undefined') {
+      sessionStorage.setItem('db_primary_pin', pin);
+    }
+
     // Extract data from new response structure
     // Response format: { data: {...}, message: "...", status_code: 200 }
     if (response.data && typeof response.data === 'object') {
@@ -49,6 +64,7 @@ apiClient.interceptors.response.use(
           data: response.data.data,
           message: response.data.message,
           statusCode: response.data.status_code,
+          pagination: response.data.pagination ?? null,
         };
       }
     }
@@ -94,6 +110,12 @@ export const handleAPIError = (error: unknown): string => {
   return 'An unexpected error occurred';
 };
 
+// List endpoints return one keyset page, the interceptor keeps its cursors
+const toPage = <T>(response: AxiosResponse<T[]>): Page<T> => ({
+  results: response.data,
+  pagination: (response as AxiosResponse<T[]> & { pagination?: PaginationInfo }).pagination ?? null,
+});
+
 // Authentication APIs
 export const authAPI = {
   register: async (data: RegisterRequest): Promise<{ message: string; user: User }> => {
@@ -124,13 +146,13 @@ export const authAPI = {
 
 // Company APIs
 export const companyAPI = {
-  getAll: async (): Promise<Company[]> => {
-    const response = await apiClient.get<Company[]>('/api/companies/');
-    return response.data;
+  getAll: async (params?: PaginationParams): Promise<Page<Company>> => {
+    const response = await apiClient.get<Company[]>('/api/companies/', { params });
+    return toPage(response);
   },
 
   getById: async (id: number): Promise<CompanyDetails> => {
-    const response = await apiClient.get<CompanyDetails>(`/api/companies/${id}/`);    
+    const response = await apiClient.get<CompanyDetails>(`/api/companies/${id}/`);
     return response.data;
   },
 
@@ -151,13 +173,13 @@ export const companyAPI = {
 
 // Department APIs
 export const departmentAPI = {
-  getAll: async (filters?: DepartmentFilters): Promise<Department[]> => {
+  getAll: async (filters?: DepartmentFilters, page?: PaginationParams): Promise<Page<Department>> => {
     const params = new URLSearchParams();
     if (filters?.company) {
       params.append('company', filters.company.toString());
     }
-    const response = await apiClient.get<Department[]>(`/api/departments/?${params.toString()}`);
-    return response.data;
+    const response = await apiClient.get<Department[]>(`/api/departments/?${params.toString()}`, { params: page });
+    return toPage(response);
   },
 
   getById: async (id: number): Promise<Department> => {
@@ -165,6 +187,11 @@ export const departmentAPI = {
     return response.data;
   },
 
+  getEmployees: async (id: number, params?: PaginationParams): Promise<Page<Employee>> => {
+    const response = await apiClient.get<Employee[]>(`/api/departments/${id}/employees/`, { params });
+    return toPage(response);
+  },
+
   create: async (data: DepartmentFormData): Promise<Department> => {
     const response = await apiClient.post<Department>('/api/departments/', data);
     return response.data;
@@ -182,7 +209,7 @@ export const departmentAPI = {
 
 // Employee APIs
 export const employeeAPI = {
-  getAll: async (filters?: EmployeeFilters): Promise<Employee[]> => {
+  getAll: async (filters?: EmployeeFilters, page?: PaginationParams): Promise<Page<Employee>> => {
     const params = new URLSearchParams();
     if (filters?.company) {
       params.append('company', filters.company.toString());
@@ -193,8 +220,11 @@ export const employeeAPI = {
     if (filters?.status) {
       params.append('status', filters.status);
     }
-    const response = await apiClient.get<Employee[]>(`/api/employees/?${params.toString()}`);
-    return response.data;
+    if (filters?.q) {
+      params.append('q', filters.q);
+    }
+    const response = await apiClient.get<Employee[]>(`/api/employees/?${params.toString()}`, { params: page });
+    return toPage(response);
   },
 
   getById: async (id: number): Promise<Employee> => {
@@ -231,4 +261,19 @@ export const dashboardAPI = {
   },
 };
 
+// Form dropdown options: ids and names only
+export const optionsAPI = {
+  get: async (): Promise<FormOptions> => {
+    const response = await apiClient.get<FormOptionsResponse>('/api/options/');
+    return {
+      companies: response.data.companies.map(([id, company_name]) => ({ id, company_name })),
+      departments: response.data.departments.map(([id, company, department_name]) => ({
+        id,
+        company,
+        department_name,
+      })),
+    };
+  },
+};
+
 export default apiClient;
\ No newline at end of file
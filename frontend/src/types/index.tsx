@@ -85,7 +85,7 @@ export interface DepartmentDetails {
   company_name: string;
   department_name: string;
   number_of_employees: number;
-  employees: Employee[];
+  employees?: Employee[]; // only with ?depth=1, pages come from /employees/
   created_at: string;
   updated_at: string;
 }
@@ -153,6 +153,29 @@ export interface DashboardSummary {
   scheduled_interviews: number;
 }
 
+// Form Options Types (GET /api/options/)
+export interface FormOptionsResponse {
+  companies: [number, string][];
+  departments: [number, number, string][];
+  statuses: [string, string][];
+}
+
+export interface CompanyOption {
+  id: number;
+  company_name: string;
+}
+
+export interface DepartmentOption {
+  id: number;
+  company: number;
+  department_name: string;
+}
+
+export interface FormOptions {
+  companies: CompanyOption[];
+  departments: DepartmentOption[];
+}
+
 // API Error Types
 export interface APIError {
   error: string;
@@ -161,14 +184,29 @@ export interface APIError {
 
 // Filter and Pagination Types
 export interface PaginationParams {
-  page?: number;
+  cursor?: string;
   page_size?: number;
 }
 
+// Keyset pagination block of list responses
+export interface PaginationInfo {
+  next: string | null;
+  previous: string | null;
+  next_cursor: string | null;
+  previous_cursor: string | null;
+  page_size: number;
+}
+
+export interface Page<T> {
+  results: T[];
+  pagination: PaginationInfo | null;
+}
+
 export interface EmployeeFilters {
   company?: number;
   department?: number;
   status?: EmployeeStatus;
+  q?: string; // full-text search over name, email and designation
 }
 
 export interface DepartmentFilters {